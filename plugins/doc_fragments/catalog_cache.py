@@ -0,0 +1,55 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    # Options of modules resolving Global Catalog entries, see module_utils/catalog.py
+    DOCUMENTATION = r'''
+options:
+    catalog_cache:
+        description:
+            - How to use the on-disk cache of Global Catalog service, plan and deployment resolutions.
+            - The cache is shared by all module runs of the current user and lives in C(IC_CATALOG_CACHE_DIR),
+              C($XDG_CACHE_HOME/ibm.cloud/catalog) or C(~/.cache/ibm.cloud/catalog).
+            - C(use) answers from the cache and stores new resolutions.
+            - C(bypass) always asks the Global Catalog and leaves the cache alone.
+            - C(refresh) always asks the Global Catalog and replaces the cached resolutions.
+        type: str
+        default: use
+        choices: [use, bypass, refresh]
+    catalog_cache_ttl:
+        description:
+            - Number of seconds a resolution stays in the catalog cache. C(0) disables the cache.
+        type: int
+        default: 86400
+    catalog_cache_negative_ttl:
+        description:
+            - Number of seconds a service, plan or location that was not found stays in the catalog cache.
+            - C(0) disables caching of lookups that found nothing.
+        type: int
+        default: 300
+    catalog_snapshot:
+        description:
+            - Path of a snapshot written by M(ibm.cloud.ibm_global_catalog_snapshot).
+            - When set, services, plans and locations are resolved from the snapshot only, without querying
+              the Global Catalog or using the catalog cache.
+            - If not set, the value of the C(IC_CATALOG_SNAPSHOT) environment variable is used.
+        type: path
+'''
@@ -0,0 +1,74 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    # Paging options of the list modules, see module_utils/pagination.py
+    DOCUMENTATION = r'''
+options:
+    all_pages:
+        description:
+            - Page through the whole list within the module run, starting at the given page, instead of returning a single page.
+            - The page size option of the module is then the number of items fetched per request.
+            - The result is a dict with the C(items) of all pages and the number of C(pages_fetched).
+        type: bool
+        default: false
+    max_items:
+        description:
+            - With I(all_pages), stop after this many items. No further page is fetched once they are in.
+        type: int
+    results_only:
+        description:
+            - With I(all_pages), return the plain list of items.
+        type: bool
+        default: false
+    output_file:
+        description:
+            - Write the items of all pages to this file, one JSON document per line, instead of returning them.
+              This implies I(all_pages).
+            - The lines are gzip compressed when the path ends with C(.gz).
+            - The items are written as the pages come in, so they are never all held in memory.
+            - The result then holds the C(path) of the file, the C(count) of items written, the SHA-256 C(checksum)
+              of the file and the number of C(pages_fetched).
+        type: path
+    count_only:
+        description:
+            - Return the number of items of the list instead of the items.
+            - When the list operation returns a total count, a single item is fetched to read it.
+              Otherwise the items are counted in pages of the largest size, unless a page size is given.
+        type: bool
+        default: false
+    exists_only:
+        description:
+            - Return whether the list holds any item instead of the items, fetching a single item.
+        type: bool
+        default: false
+'''
+
+    # Option of the list modules fetching offset pages in parallel
+    CONCURRENT = r'''
+options:
+    workers:
+        description:
+            - With I(all_pages), maximum number of pages fetched at the same time.
+            - The first page gives the total number of items, then the other pages are fetched in parallel.
+        type: int
+        default: 4
+'''
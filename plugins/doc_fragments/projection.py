@@ -0,0 +1,35 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    # Field projection of the info modules, see module_utils/projection.py
+    DOCUMENTATION = r'''
+options:
+    fields:
+        description:
+            - Return only these fields of the resources, instead of the whole documents.
+            - A field is a dotted path of keys, e.g. C(extensions.endpoints). A key of C(*) matches every key,
+              and lists along the path are projected element by element, which may be marked with C([]),
+              e.g. C(rules[].conditions).
+            - For a list, the fields apply to every item, and the rest of the page, like the next page URL, is kept.
+        type: list
+        elements: str
+'''
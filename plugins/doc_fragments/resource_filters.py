@@ -0,0 +1,64 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    # Filters of the Resource Controller list modules, see module_utils/predicates.py
+    DOCUMENTATION = r'''
+options:
+    filters:
+        description:
+            - Return only the items matching all of these filters.
+            - The I(resource_group_id), I(type), I(sub_type) and I(state) filters are sent to the server when the
+              list operation takes them. The other filters are checked on every page as it comes in, so only the
+              matching items are kept in memory.
+            - With I(all_pages), I(max_items) and I(count_only) apply to the matching items.
+        type: dict
+        suboptions:
+            resource_group_id:
+                description:
+                    - The ID of the resource group of the items.
+                type: str
+            type:
+                description:
+                    - The type of the items, for example, C(service_instance).
+                type: str
+            sub_type:
+                description:
+                    - The sub-type of the items, for example, C(kms).
+                type: str
+            state:
+                description:
+                    - The state of the items, for example, C(active).
+                type: str
+            name:
+                description:
+                    - A regular expression searched in the names of the items.
+                type: str
+            tags:
+                description:
+                    - Tags all of which the items have.
+                type: list
+                elements: str
+            region:
+                description:
+                    - The region of the items, read from their CRN, for example, C(us-south) or C(global).
+                type: str
+'''
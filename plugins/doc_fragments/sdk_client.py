@@ -0,0 +1,65 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    # Options shared by all modules, see module_utils/config.py
+    DOCUMENTATION = r'''
+options:
+    pool_size:
+        description:
+            - Maximum number of keep-alive connections per host in the HTTP connection pool shared by all SDK clients of the module.
+        type: int
+        default: 10
+    max_retries:
+        description:
+            - Maximum number of retries of an SDK call that failed with a connection error, HTTP 429 or a HTTP 5xx status.
+            - Only idempotent calls (GET, HEAD, PUT, DELETE, OPTIONS, TRACE) are retried, never POST or PATCH.
+            - Set to C(0) to disable retries.
+            - The number of retries and the seconds spent waiting are returned under the C(retries) key of the result.
+        type: int
+        default: 4
+    retry_backoff_base:
+        description:
+            - Base of the exponential backoff between retries, the n-th retry waits I(retry_backoff_base) * 2^(n-1) seconds.
+            - A C(Retry-After) header sent by the server takes precedence over the backoff.
+        type: float
+        default: 1.0
+    retry_backoff_max:
+        description:
+            - Maximum number of seconds of backoff between two retries, before jitter is added.
+            - Also caps the wait asked for by a C(Retry-After) header.
+        type: float
+        default: 30.0
+    retry_jitter:
+        description:
+            - Maximum number of random seconds added to each backoff, spreading out retries of concurrent tasks.
+        type: float
+        default: 1.0
+    record_api_calls:
+        description:
+            - Return every HTTP call made by the module under the C(_api_calls) key of the result.
+            - Each entry holds the service, SDK operation, method, path template, status, latency in seconds,
+              request and response bytes and the number of retries of the call.
+            - In the path template, the path parameters of the operation appear as C({}).
+            - The number of calls and the seconds spent in them are always returned under the C(api_calls_summary) key.
+        type: bool
+        default: false
+'''
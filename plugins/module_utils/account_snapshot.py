@@ -0,0 +1,175 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import sqlite3
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import config
+from . import pagination
+
+DEFAULT_WORKERS = 8
+SNAPSHOT_VERSION = 1
+
+# The kinds of resources of a snapshot, in the order they are crawled.
+KINDS = (
+    'resource_groups',
+    'resource_instances',
+    'resource_keys',
+    'resource_bindings',
+    'resource_aliases',
+    'access_groups',
+    'access_group_members',
+    'access_group_rules',
+    'service_ids',
+)
+
+SCHEMA = '''
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE resources (
+    kind TEXT NOT NULL,
+    id TEXT,
+    crn TEXT,
+    name TEXT,
+    resource_group_id TEXT,
+    parent_id TEXT,
+    document BLOB NOT NULL
+);
+'''
+
+INDEXES = '''
+CREATE INDEX resources_kind ON resources (kind);
+CREATE INDEX resources_id ON resources (id);
+CREATE INDEX resources_crn ON resources (crn);
+CREATE INDEX resources_name ON resources (name);
+CREATE INDEX resources_resource_group_id ON resources (resource_group_id);
+CREATE INDEX resources_parent_id ON resources (parent_id);
+'''
+
+
+def _list_tasks(account_id):
+    """Returns the functions listing the resources of the account, by kind.
+
+    The functions of the second dict list the resources of an access group
+    and take its ID.
+    """
+    resource_manager = config.get_resource_manager_sdk()
+    resource_controller = config.get_resource_contollerV2_sdk()
+    access_groups = config.get_iam_access_group_sdk()
+    identity = config.get_iam_identity_sdk()
+
+    def start_token(list_method):
+        return lambda: list(pagination.StartTokenPager(
+            list_method, 'resources', page_size=pagination.MAX_PAGE_SIZE).items())
+
+    lists = dict(
+        resource_groups=lambda: resource_manager.list_resource_groups(
+            account_id=account_id).get_result().get('resources') or [],
+        resource_instances=start_token(resource_controller.list_resource_instances),
+        resource_keys=start_token(resource_controller.list_resource_keys),
+        resource_bindings=start_token(resource_controller.list_resource_bindings),
+        resource_aliases=start_token(resource_controller.list_resource_aliases),
+        access_groups=lambda: list(pagination.OffsetPager(
+            access_groups.list_access_groups, 'groups', page_size=pagination.MAX_PAGE_SIZE,
+            workers=1, account_id=account_id).items()),
+        service_ids=lambda: list(pagination.PageTokenPager(
+            identity.list_service_ids, 'serviceids', page_size=pagination.MAX_PAGE_SIZE,
+            account_id=account_id).items()),
+    )
+    group_lists = dict(
+        access_group_members=lambda group_id: list(pagination.OffsetPager(
+            access_groups.list_access_group_members, 'members', page_size=pagination.MAX_PAGE_SIZE,
+            workers=1, access_group_id=group_id).items()),
+        access_group_rules=lambda group_id: access_groups.list_access_group_rules(
+            access_group_id=group_id).get_result().get('rules') or [],
+    )
+    return lists, group_lists
+
+
+def crawl(account_id, workers=DEFAULT_WORKERS):
+    """Lists all the resources of an account on at most workers threads.
+
+    The lists of the account are fetched at once, then the members and
+    rules of every access group as soon as the access groups are in.
+
+    Yields:
+        The kind, the ID of the parent access group or None, and the items
+        of every list, as the lists complete.
+
+    Raises:
+        ApiException: when a list fails. The lists not started yet are
+            cancelled.
+    """
+    lists, group_lists = _list_tasks(account_id)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = dict((pool.submit(func), (kind, None)) for kind, func in lists.items())
+        try:
+            while pending:
+                done, dummy = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, parent_id = pending.pop(future)
+                    items = future.result()
+                    if kind == 'access_groups':
+                        for group in items:
+                            for group_kind, func in group_lists.items():
+                                pending[pool.submit(func, group['id'])] = (group_kind, group['id'])
+                    yield kind, parent_id, items
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _row(kind, parent_id, item):
+    return (
+        kind,
+        item.get('id') or item.get('iam_id'),
+        item.get('crn'),
+        item.get('name'),
+        item.get('resource_group_id'),
+        parent_id,
+        zlib.compress(json.dumps(item, separators=(',', ':')).encode('utf-8')),
+    )
+
+
+def write_snapshot(path, account_id, lists):
+    """Writes the lists of crawl() to a new SQLite database at path.
+
+    Every resource is a row of the resources table, indexed by kind, ID, CRN,
+    name, resource group and parent access group, with its JSON document
+    compressed with zlib. The meta table holds the account, the time of the
+    snapshot and the number of resources of every kind.
+
+    Returns:
+        The number of resources of every kind.
+    """
+    counts = dict((kind, 0) for kind in KINDS)
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(SCHEMA)
+        for kind, parent_id, items in lists:
+            conn.executemany(
+                'INSERT INTO resources VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (_row(kind, parent_id, item) for item in items))
+            counts[kind] += len(items)
+        # Indexes are faster to build once the rows are in.
+        conn.executescript(INDEXES)
+        conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+            ('version', str(SNAPSHOT_VERSION)),
+            ('account_id', account_id),
+            ('created', time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())),
+            ('counts', json.dumps(counts, sort_keys=True)),
+        ])
+        conn.commit()
+    finally:
+        conn.close()
+    return counts
+
+
+def read_document(row_document):
+    """Returns the resource stored in the document column of a snapshot."""
+    return json.loads(zlib.decompress(row_document).decode('utf-8'))
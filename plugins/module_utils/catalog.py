@@ -1,11 +1,137 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ibm_platform_services import GlobalCatalogV1
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.basic import env_fallback
+
 from ..module_utils import config
+from ..module_utils.disk_cache import DiskCache, get_cache_dir
+
+DEFAULT_CACHE_TTL = 86400
+DEFAULT_CACHE_NEGATIVE_TTL = 300
+
+# Children of a catalog entry are listed this many at a time.
+CHILD_PAGE_SIZE = 50
+
+DEFAULT_RESOLVE_WORKERS = 4
+
+# Bump when the format of the cached resolutions changes.
+_CACHE_VERSION = '1'
+
+# Bump when the format of the snapshot files changes.
+SNAPSHOT_VERSION = 1
+
+_settings = dict(
+    catalog_cache='use',
+    catalog_cache_ttl=DEFAULT_CACHE_TTL,
+    catalog_cache_negative_ttl=DEFAULT_CACHE_NEGATIVE_TTL,
+    catalog_snapshot=None,
+)
+
+# Path, mtime and content of the last loaded snapshot, see _load_snapshot().
+_snapshot = {}
+
+
+class NotFound(ValueError):
+    """A service, plan or location that the Global Catalog does not have."""
+
+
+def catalog_argument_spec():
+    """Returns the argument spec of the options of the catalog resolution.
+
+    Merge it into the module_args of modules resolving catalog entries and
+    pass the created AnsibleModule to configure().
+    """
+    return dict(
+        catalog_cache=dict(
+            type='str',
+            default='use',
+            choices=['use', 'bypass', 'refresh'],
+            required=False),
+        catalog_cache_ttl=dict(
+            type='int',
+            default=DEFAULT_CACHE_TTL,
+            required=False),
+        catalog_cache_negative_ttl=dict(
+            type='int',
+            default=DEFAULT_CACHE_NEGATIVE_TTL,
+            required=False),
+        catalog_snapshot=dict(
+            type='path',
+            fallback=(env_fallback, ['IC_CATALOG_SNAPSHOT']),
+            required=False),
+    )
+
+
+def configure(module):
+    """Applies the catalog resolution options of a module."""
+    for name in _settings:
+        if name in module.params:
+            _settings[name] = module.params[name]
+
+
+def _cached(resolve, *key):
+    """Resolves a catalog lookup through the on-disk catalog cache.
+
+    Results are kept for catalog_cache_ttl seconds and lookups that found
+    nothing (NotFound) for catalog_cache_negative_ttl seconds. Other errors,
+    like an incomplete authentication setup, are not cached. The lookup runs
+    under the lock of its cache entry, so concurrent forks resolving the
+    same entry wait for the first one instead of repeating it.
+
+    Entries are keyed by the Global Catalog endpoint and the credential too,
+    since the entries visible to one account, like its private ones, may not
+    be visible to another.
+    """
+    mode = _settings['catalog_cache']
+    ttl = _settings['catalog_cache_ttl']
+    if mode == 'bypass' or ttl <= 0:
+        return resolve()
+
+    # Building the client first raises authentication errors outside the cache.
+    catalog_sdk = config.get_global_catalog_sdk()
+    scope = (catalog_sdk.service_url,) + config.get_credential()
+    cache = DiskCache(
+        get_cache_dir('catalog', 'IC_CATALOG_CACHE_DIR'), _CACHE_VERSION, *(scope + key))
+    with cache.lock():
+        if mode == 'use':
+            entry = cache.load()
+            if entry is not None:
+                if 'error' in entry:
+                    raise NotFound(entry['error'])
+                result = entry['result']
+                return tuple(result) if isinstance(result, list) else result
+        try:
+            result = resolve()
+        except NotFound as ex:
+            _store(cache, dict(error=str(ex)), _settings['catalog_cache_negative_ttl'])
+            raise
+        _store(cache, dict(result=result), ttl)
+        return result
+
+
+def _store(cache, entry, ttl):
+    if ttl <= 0:
+        return
+    try:
+        cache.store(entry, time.time() + ttl)
+    except OSError:
+        pass
 
 
 def get_serviceID_targetCRN_planID(service_name, plan, location):
+    if _settings['catalog_snapshot']:
+        return _resolve_from_snapshot(service_name, plan, location)
+    return _cached(
+        lambda: _get_serviceID_targetCRN_planID(service_name, plan, location),
+        'deployment', service_name, plan, location)
+
+
+def _get_serviceID_targetCRN_planID(service_name, plan, location):
 
     servicePlanID = ""
     catalogCRN = ""
@@ -13,60 +139,275 @@ def get_serviceID_targetCRN_planID(service_name, plan, location):
 
     serviceID, servicePlanID = get_planID(service_name, plan)
     if servicePlanID != "":
-        deployments = get_child_objects(servicePlanID)
-        for deployment in deployments:
+        for deployment in _list_deployments(servicePlanID):
             if deployment['metadata']['deployment']['location'] == location:
                 catalogCRN = deployment['catalog_crn']
+                break
 
     if serviceID == "" or catalogCRN == "" or servicePlanID == "":
-        raise ValueError(
+        raise NotFound(
             "[ERROR] either of service plan or service name or location is invalid or not found")
     else:
         return serviceID, catalogCRN, servicePlanID
 
 
-def get_child_objects(id):
+def _find_planID(serviceID, plan):
+    for resource in get_child_objects(serviceID, 'plan'):
+        if resource['name'] == plan:
+            return resource['id']
+    return ""
+
+
+def _list_deployments(servicePlanID):
+    return get_child_objects(servicePlanID, 'deployment', include='metadata.deployment')
+
+
+def get_child_objects(id, kind='*', include=None):
+    """Yields the children of a Global Catalog entry, one page at a time.
+
+    Only the basic properties of the children of the given kind are
+    requested, plus the ones listed in include. The next page is only
+    fetched once the caller consumed the previous one, so a caller that
+    stops at the child it looks for skips the remaining pages.
+    """
     catalog_sdk = config.get_global_catalog_sdk()
-    result = catalog_sdk.get_child_objects(
-        id=id,
-        kind='*',
-        complete=True,
-    ).get_result()
-    resources = result['resources']
-    return resources
+    offset = 0
+    while True:
+        result = catalog_sdk.get_child_objects(
+            id=id,
+            kind=kind,
+            include=include,
+            offset=offset,
+            limit=CHILD_PAGE_SIZE,
+        ).get_result()
+        resources = result.get('resources') or []
+        for resource in resources:
+            yield resource
+        offset += len(resources)
+        if len(resources) < CHILD_PAGE_SIZE or offset >= result.get('count', offset + 1):
+            return
 
 
 def get_serviceID(service_name):
+    if _settings['catalog_snapshot']:
+        return _resolve_from_snapshot(service_name)
+    return _cached(lambda: _get_serviceID(service_name), 'service', service_name)
+
+
+def _get_serviceID(service_name):
     catalog_sdk = config.get_global_catalog_sdk()
     serviceID_result = catalog_sdk.list_catalog_entries(
         q=service_name + " rc:true",
-        include="true",
-        complete=True,
+        limit=1,
     ).get_result()
 
     if len(serviceID_result['resources']) > 0:
         serviceID = serviceID_result['resources'][0]['id']
         return serviceID
     else:
-        raise ValueError("[ERROR] service name is invalid or not found")
+        raise NotFound("[ERROR] service name is invalid or not found")
 
 
 def get_planID(service_name, plan):
+    if _settings['catalog_snapshot']:
+        return _resolve_from_snapshot(service_name, plan)
+    return _cached(lambda: _get_planID(service_name, plan), 'plan', service_name, plan)
+
+
+def _get_planID(service_name, plan):
     servicePlanID = ""
     serviceID = ""
 
     serviceID = get_serviceID(service_name)
     if serviceID != "":
-        resources = get_child_objects(serviceID)
-        for resource in resources:
-            if resource['name'] == plan:
-                servicePlanID = resource['id']
+        servicePlanID = _find_planID(serviceID, plan)
     if serviceID == "" or servicePlanID == "":
-        raise ValueError(
+        raise NotFound(
             "[ERROR] either of service plan or service name is invalid or not found")
     else:
         return serviceID, servicePlanID
 
+
+def resolve_many(targets, workers=DEFAULT_RESOLVE_WORKERS):
+    """Resolves many (service_name, plan, location) tuples at once.
+
+    Every distinct service and (service, plan) is resolved once, then the
+    deployments of the distinct plans are looked up in parallel on at most
+    workers threads. The deployments of a plan are listed once for all of
+    its locations missing from the catalog cache, and every resolution is
+    stored in the cache like the ones of get_serviceID_targetCRN_planID().
+
+    With a catalog snapshot configured the tuples are resolved from it.
+
+    Returns:
+        A dict mapping each distinct tuple to its (serviceID, catalogCRN,
+        servicePlanID), or to the ValueError its resolution failed with.
+    """
+    targets = list(dict.fromkeys(tuple(target) for target in targets))
+    if _settings['catalog_snapshot']:
+        return _map_parallel(lambda target: _resolve_from_snapshot(*target), targets, 1)
+
+    services = _map_parallel(
+        get_serviceID, list(dict.fromkeys(t[0] for t in targets)), workers)
+
+    def resolve_plan(key):
+        service_name, plan = key
+        serviceID = services[service_name]
+        if isinstance(serviceID, ValueError):
+            raise serviceID
+
+        def resolve():
+            servicePlanID = _find_planID(serviceID, plan)
+            if servicePlanID == "":
+                raise NotFound(
+                    "[ERROR] either of service plan or service name is invalid or not found")
+            return serviceID, servicePlanID
+        return _cached(resolve, 'plan', service_name, plan)
+
+    locations = {}
+    for service_name, plan, location in targets:
+        locations.setdefault((service_name, plan), []).append(location)
+    plans = _map_parallel(resolve_plan, list(locations), workers)
+
+    def resolve_deployments(key):
+        if isinstance(plans[key], ValueError):
+            return dict((location, plans[key]) for location in locations[key])
+        serviceID, servicePlanID = plans[key]
+        # Location to catalog CRN, listed on the first cache miss of the plan.
+        catalogCRNs = {}
+        listed = []
+
+        def resolve(location):
+            if not listed:
+                for deployment in _list_deployments(servicePlanID):
+                    catalogCRNs.setdefault(
+                        deployment['metadata']['deployment']['location'], deployment['catalog_crn'])
+                listed.append(True)
+            if location not in catalogCRNs:
+                raise NotFound(
+                    "[ERROR] either of service plan or service name or location is invalid or not found")
+            return serviceID, catalogCRNs[location], servicePlanID
+
+        results = {}
+        for location in locations[key]:
+            try:
+                results[location] = _cached(lambda: resolve(location), 'deployment', key[0], key[1], location)
+            except ValueError as ex:
+                results[location] = ex
+        return results
+
+    deployments = _map_parallel(resolve_deployments, list(locations), workers)
+    return dict((t, deployments[t[:2]][t[2]]) for t in targets)
+
+
+def _map_parallel(func, items, workers):
+    """Calls func on every item on a pool of at most workers threads.
+
+    Returns a dict mapping each item to its result, or to the ValueError it
+    raised. Any other exception is raised again.
+    """
+    results = {}
+    if not items:
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as pool:
+        futures = [(item, pool.submit(func, item)) for item in items]
+        for item, future in futures:
+            try:
+                results[item] = future.result()
+            except ValueError as ex:
+                results[item] = ex
+    return results
+
+
+def build_snapshot(service_names, plans=None, workers=DEFAULT_RESOLVE_WORKERS):
+    """Crawls services, their plans and deployments into a snapshot index.
+
+    The index maps each service name to its ID and plans, each plan name to
+    its ID and deployments, and each deployment location to its catalog CRN.
+    It is written to a file by the ibm_global_catalog_snapshot module and
+    read back when the catalog_snapshot option points to that file.
+
+    Args:
+        service_names: names of the services to crawl.
+        plans: names of the plans to keep, all plans by default.
+        workers: maximum number of concurrent Global Catalog queries.
+    Returns:
+        The snapshot index, a JSON serializable dict.
+    Raises:
+        ValueError: one of the services was not found.
+    """
+    service_names = list(dict.fromkeys(service_names))
+    serviceIDs = _map_parallel(_get_serviceID, service_names, workers)
+    missing = [name for name in service_names if isinstance(serviceIDs[name], ValueError)]
+    if missing:
+        raise NotFound(
+            "[ERROR] service name is invalid or not found: " + ", ".join(missing))
+
+    def list_plans(service_name):
+        return [p for p in get_child_objects(serviceIDs[service_name], 'plan')
+                if plans is None or p['name'] in plans]
+    service_plans = _map_parallel(list_plans, service_names, workers)
+
+    def list_locations(servicePlanID):
+        catalogCRNs = {}
+        for deployment in _list_deployments(servicePlanID):
+            catalogCRNs.setdefault(
+                deployment['metadata']['deployment']['location'], deployment['catalog_crn'])
+        return catalogCRNs
+    planIDs = list(dict.fromkeys(p['id'] for name in service_names for p in service_plans[name]))
+    deployments = _map_parallel(list_locations, planIDs, workers)
+
+    services = {}
+    for name in service_names:
+        services[name] = dict(
+            id=serviceIDs[name],
+            plans=dict(
+                (plan['name'], dict(id=plan['id'], deployments=deployments[plan['id']]))
+                for plan in service_plans[name]),
+        )
+    return dict(version=SNAPSHOT_VERSION, services=services)
+
+
+def _load_snapshot():
+    path = _settings['catalog_snapshot']
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+        if _snapshot.get('key') != key:
+            with open(path, 'r') as f:
+                index = json.load(f)
+            if not isinstance(index, dict) or index.get('version') != SNAPSHOT_VERSION:
+                raise ValueError("unsupported snapshot version")
+            _snapshot.update(key=key, index=index)
+    except (OSError, ValueError) as ex:
+        raise ValueError("[ERROR] cannot read the catalog snapshot %s: %s" % (path, ex))
+    return _snapshot['index']
+
+
+def _resolve_from_snapshot(service_name, plan=None, location=None):
+    """Resolves a service, a plan or a deployment from the catalog snapshot.
+
+    Returns what get_serviceID(), get_planID() or
+    get_serviceID_targetCRN_planID() return for the same arguments.
+    """
+    service = _load_snapshot()['services'].get(service_name)
+    if service is None:
+        raise NotFound("[ERROR] service name is invalid or not found")
+    if plan is None:
+        return service['id']
+
+    service_plan = service['plans'].get(plan)
+    if service_plan is None:
+        raise NotFound(
+            "[ERROR] either of service plan or service name is invalid or not found")
+    if location is None:
+        return service['id'], service_plan['id']
+
+    catalogCRN = service_plan['deployments'].get(location)
+    if catalogCRN is None:
+        raise NotFound(
+            "[ERROR] either of service plan or service name or location is invalid or not found")
+    return service['id'], catalogCRN, service_plan['id']
+
 # serviceID,catalogCRN,servicePlanID = get_serviceID_targetCRN_planID(service_name,plan,location)
 # print (serviceID, catalogCRN,servicePlanID)
 # serviceID1 = get_serviceID(service_name)
@@ -1,59 +1,255 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import importlib
 import os
+import requests
 from ibm_cloud_sdk_core import get_authenticator_from_environment
-from ibm_cloud_sdk_core.authenticators import Authenticator, IAMAuthenticator
-from ibm_platform_services import CatalogManagementV1, ResourceControllerV2, ResourceManagerV2, IamAccessGroupsV2, IamIdentityV1, GlobalCatalogV1
-from ibm_schematics import SchematicsV1
+from ibm_cloud_sdk_core.authenticators import (
+    Authenticator, BearerTokenAuthenticator, ContainerAuthenticator, IAMAuthenticator, VPCInstanceAuthenticator)
+from ..module_utils import token_cache
+from ..module_utils.instrumentation import CallRecorder
+from ..module_utils.retry import RetryStats, SDKRetry
+
+# The adapter of the SDK enforces TLS 1.2 or later and loads the CA bundle
+# of requests, older SDK versions only have the plain one of requests.
+try:
+    from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter as HTTPAdapter
+except ImportError:
+    from requests.adapters import HTTPAdapter
+
+# Prefix of the environment variables configuring the authenticator, e.g. IC_AUTH_TYPE.
+AUTH_SERVICE_NAME = 'ic'
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_RETRY_BACKOFF_BASE = 1.0
+DEFAULT_RETRY_BACKOFF_MAX = 30.0
+DEFAULT_RETRY_JITTER = 1.0
+
+# Per-process registry of authenticators, SDK clients and the HTTP session
+# they share, so that every service is built and authenticated only once.
+_registry = {}
+_settings = dict(
+    pool_size=DEFAULT_POOL_SIZE,
+    max_retries=DEFAULT_MAX_RETRIES,
+    retry_backoff_base=DEFAULT_RETRY_BACKOFF_BASE,
+    retry_backoff_max=DEFAULT_RETRY_BACKOFF_MAX,
+    retry_jitter=DEFAULT_RETRY_JITTER,
+)
+_retry_stats = RetryStats()
+_call_recorder = CallRecorder()
+
+
+def sdk_argument_spec():
+    """Returns the argument spec of the options shared by all modules.
+
+    Merge it into the module_args of a module and pass the created
+    AnsibleModule to configure().
+    """
+    return dict(
+        pool_size=dict(
+            type='int',
+            default=DEFAULT_POOL_SIZE,
+            required=False),
+        max_retries=dict(
+            type='int',
+            default=DEFAULT_MAX_RETRIES,
+            required=False),
+        retry_backoff_base=dict(
+            type='float',
+            default=DEFAULT_RETRY_BACKOFF_BASE,
+            required=False),
+        retry_backoff_max=dict(
+            type='float',
+            default=DEFAULT_RETRY_BACKOFF_MAX,
+            required=False),
+        retry_jitter=dict(
+            type='float',
+            default=DEFAULT_RETRY_JITTER,
+            required=False),
+        record_api_calls=dict(
+            type='bool',
+            default=False,
+            required=False),
+    )
+
+
+def configure(module):
+    """Applies the shared SDK options of a module to the client registry.
+
+    It also makes the module report statistics of its SDK calls in its
+    result, see get_result_stats().
+    """
+    settings = dict(_settings)
+    for name in settings:
+        if module.params.get(name) is not None:
+            settings[name] = module.params[name]
+    if settings != _settings:
+        _settings.update(settings)
+        _registry.clear()
+    _call_recorder.detailed = bool(module.params.get('record_api_calls'))
+
+    exit_json = module.exit_json
+    fail_json = module.fail_json
+
+    def exit_json_with_stats(*args, **kwargs):
+        kwargs.update(get_result_stats())
+        exit_json(*args, **kwargs)
+
+    def fail_json_with_stats(*args, **kwargs):
+        kwargs.update(get_result_stats())
+        fail_json(*args, **kwargs)
+
+    module.exit_json = exit_json_with_stats
+    module.fail_json = fail_json_with_stats
+
+
+def get_result_stats():
+    """Returns the SDK call statistics added to the result of every module.
+
+    `api_calls_summary` holds the number of HTTP calls and the seconds spent
+    in them, `retries` the retries and the seconds waited between them. With
+    the record_api_calls option, `_api_calls` lists every single call.
+    """
+    stats = dict(
+        api_calls_summary=_call_recorder.summary(),
+        retries=_retry_stats.to_dict(),
+    )
+    if _call_recorder.detailed:
+        stats['_api_calls'] = list(_call_recorder.calls)
+    return stats
 
 
 def get_authenticator() -> Authenticator:
-    apikey = os.getenv('IC_API_KEY')
-    if apikey is None:
-        raise ValueError(
-            "[ERROR] Please export IC_API_KEY. Value for APIKey is None")
-    authenticator = IAMAuthenticator(apikey=apikey)
+    """Returns the authenticator shared by all SDK clients.
+
+    When IC_AUTH_TYPE is set, the authenticator is configured by the SDK from
+    the IC_* environment variables (or an ibm-credentials.env file), e.g. a
+    bearer token (bearerToken), a trusted profile with a compute resource
+    token (container) or the VPC instance metadata service (vpc). Otherwise,
+    or if that configuration is incomplete, the IC_API_KEY is exchanged for
+    an IAM token.
+    """
+    key = ('authenticator',) + tuple(sorted(
+        (k, v) for k, v in os.environ.items() if k.startswith('IC_')))
+    authenticator = _registry.get(key)
+    if authenticator is None:
+        error = None
+        if os.getenv('IC_AUTH_TYPE'):
+            try:
+                authenticator = get_authenticator_from_environment(AUTH_SERVICE_NAME)
+            except ValueError as ex:
+                # The SDK validates some configurations, e.g. a bearerToken
+                # without a token, and returns None for others.
+                error = ex
+        if authenticator is None:
+            apikey = os.getenv('IC_API_KEY')
+            if apikey is None:
+                if error is not None:
+                    raise error
+                raise ValueError(
+                    "[ERROR] Please export IC_API_KEY. Value for APIKey is None")
+            authenticator = IAMAuthenticator(apikey=apikey)
+        _attach_token_cache(authenticator)
+        if hasattr(authenticator, 'token_manager'):
+            _call_recorder.instrument_token_manager(authenticator.token_manager, authenticator.authentication_type())
+        _registry[key] = authenticator
     return authenticator
 
 
+def get_credential():
+    """Returns what identifies the credential of the shared authenticator.
+
+    A credential belongs to a single account, so caches of data that depends
+    on the account key their entries with it. It may hold secrets, like the
+    API key, which DiskCache only stores hashed.
+    """
+    return _credential(get_authenticator())
+
+
+def _credential(authenticator):
+    if isinstance(authenticator, IAMAuthenticator):
+        return (authenticator.token_manager.apikey,)
+    if isinstance(authenticator, ContainerAuthenticator):
+        token_manager = authenticator.token_manager
+        return (Authenticator.AUTHTYPE_CONTAINER, token_manager.cr_token_filename,
+                token_manager.iam_profile_name, token_manager.iam_profile_id)
+    if isinstance(authenticator, VPCInstanceAuthenticator):
+        token_manager = authenticator.token_manager
+        return (Authenticator.AUTHTYPE_VPC, token_manager.iam_profile_crn, token_manager.iam_profile_id)
+    if isinstance(authenticator, BearerTokenAuthenticator):
+        return (Authenticator.AUTHTYPE_BEARERTOKEN, authenticator.bearer_token)
+    return (authenticator.authentication_type(),)
+
+
+def _attach_token_cache(authenticator):
+    if isinstance(authenticator, (IAMAuthenticator, ContainerAuthenticator, VPCInstanceAuthenticator)):
+        token_cache.attach(authenticator.token_manager, *_credential(authenticator))
+
+
+def get_http_session() -> requests.Session:
+    """Returns the keep-alive HTTP session shared by all SDK clients."""
+    session = _registry.get('session')
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=_settings['pool_size'],
+            max_retries=SDKRetry.from_options(
+                _settings['max_retries'],
+                _settings['retry_backoff_base'],
+                _settings['retry_backoff_max'],
+                _settings['retry_jitter'],
+                stats=_retry_stats,
+            ),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.hooks['response'].append(_call_recorder.response_hook)
+        _registry['session'] = session
+    return session
+
+
+def _get_sdk(module_name, class_name):
+    # The SDK service is imported only when its first client is requested,
+    # so a module never pays for importing services it does not use.
+    authenticator = get_authenticator()
+    key = (class_name, authenticator)
+    client = _registry.get(key)
+    if client is None:
+        service_class = getattr(importlib.import_module(module_name), class_name)
+        client = service_class(
+            authenticator=authenticator,
+        )
+        client.set_http_client(get_http_session())
+        _call_recorder.instrument_client(client)
+        _registry[key] = client
+    return client
+
+
 def get_catalog_management_sdk():
-    return CatalogManagementV1(
-        authenticator=get_authenticator(),
-    )
+    return _get_sdk('ibm_platform_services.catalog_management_v1', 'CatalogManagementV1')
 
 
 def get_resource_contollerV2_sdk():
-    return ResourceControllerV2(
-        authenticator=get_authenticator(),
-    )
+    return _get_sdk('ibm_platform_services.resource_controller_v2', 'ResourceControllerV2')
 
 
 def get_resource_manager_sdk():
-    return ResourceManagerV2(
-        authenticator=get_authenticator(),
-    )
+    return _get_sdk('ibm_platform_services.resource_manager_v2', 'ResourceManagerV2')
 
 
 def get_iam_access_group_sdk():
-    return IamAccessGroupsV2(
-        authenticator=get_authenticator(),
-    )
+    return _get_sdk('ibm_platform_services.iam_access_groups_v2', 'IamAccessGroupsV2')
 
 
 def get_iam_identity_sdk():
-    return IamIdentityV1(
-        authenticator=get_authenticator(),
-    )
+    return _get_sdk('ibm_platform_services.iam_identity_v1', 'IamIdentityV1')
 
 
 def get_schematicsv1_sdk():
-    return SchematicsV1(
-        authenticator=get_authenticator(),
-    )
+    return _get_sdk('ibm_schematics.schematics_v1', 'SchematicsV1')
 
 
 def get_global_catalog_sdk():
-    return GlobalCatalogV1(
-        authenticator=get_authenticator(),
-    )
+    return _get_sdk('ibm_platform_services.global_catalog_v1', 'GlobalCatalogV1')
@@ -0,0 +1,182 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+
+from ibm_cloud_sdk_core import ApiException
+
+# The status of a conditional write made with a stale ETag or revision.
+PRECONDITION_FAILED = 412
+# The status of a write with a stale revision in the body, from the services
+# storing their resources in Cloudant, like Catalog Management.
+CONFLICT = 409
+
+
+def differs(current, desired):
+    """Tells whether a desired value differs from the current one.
+
+    A desired value of None is not managed and never differs. A desired dict
+    only compares its own keys, so keys the service adds to the current
+    value, like defaults, do not make it differ. Lists compare element by
+    element.
+    """
+    if desired is None:
+        return False
+    if isinstance(desired, dict) and isinstance(current, dict):
+        return any(differs(current.get(key), value) for key, value in desired.items())
+    if isinstance(desired, list) and isinstance(current, list):
+        return len(desired) != len(current) or any(differs(c, d) for c, d in zip(current, desired))
+    return current != desired
+
+
+def changes(current, desired):
+    """Returns the fields of desired that differ from the current resource.
+
+    Args:
+        current: the resource as read from the service.
+        desired: the desired values, by field name of the resource.
+    """
+    return dict((key, value) for key, value in desired.items() if differs(current.get(key), value))
+
+
+def updated(current, desired):
+    """Returns the current resource with the changes of desired applied."""
+    result = dict(current or {})
+    result.update(changes(current or {}, desired))
+    return result
+
+
+def _pointer(path):
+    return [key.replace('~1', '/').replace('~0', '~') for key in (path or '').split('/')[1:]]
+
+
+def _resolve(document, keys):
+    for key in keys:
+        document = document[int(key) if isinstance(document, list) else key]
+    return document
+
+
+def patched(current, operations):
+    """Returns the current resource with JSON patch operations applied.
+
+    The operations are dicts with the op, path, from_ and value keys of the
+    updates option of the Catalog Management modules. An operation whose
+    path does not resolve is left out, the service reports it on update.
+    """
+    result = copy.deepcopy(current or {})
+    for operation in operations or []:
+        op = operation.get('op')
+        keys = _pointer(operation.get('path'))
+        if not keys:
+            continue
+        try:
+            parent = _resolve(result, keys[:-1])
+            key = keys[-1]
+            if op in ('move', 'copy'):
+                value = copy.deepcopy(_resolve(result, _pointer(operation.get('from_'))))
+            else:
+                value = copy.deepcopy(operation.get('value'))
+            if op == 'move':
+                source = _pointer(operation.get('from_'))
+                source_parent = _resolve(result, source[:-1])
+                del source_parent[int(source[-1]) if isinstance(source_parent, list) else source[-1]]
+            if isinstance(parent, list):
+                index = len(parent) if key == '-' else int(key)
+                if op == 'remove':
+                    del parent[index]
+                elif op == 'replace':
+                    parent[index] = value
+                elif op in ('add', 'move', 'copy'):
+                    parent.insert(index, value)
+            elif op == 'remove':
+                del parent[key]
+            elif op in ('add', 'replace', 'move', 'copy'):
+                parent[key] = value
+        except (KeyError, IndexError, ValueError, TypeError):
+            continue
+    return result
+
+
+def exit_changed(module, msg, before, after):
+    """Exits the module reporting a change, with its diff when --diff is set.
+
+    Args:
+        module: the AnsibleModule.
+        msg: the result of the module.
+        before: the resource before the change, or {} when it was created.
+        after: the resource after the change, or {} when it was deleted.
+    """
+    if module._diff:
+        module.exit_json(changed=True, msg=msg, diff=dict(before=before or {}, after=after or {}))
+    module.exit_json(changed=True, msg=msg)
+
+
+def exit_if_check_mode(module, before, after, msg=None):
+    """Exits the module in check mode with the change it would make.
+
+    The after resource is also the result, unless msg is given. For a
+    resource to create, values of None in after are options that are not
+    set and are left out.
+    """
+    if module.check_mode:
+        if not before:
+            after = dict((key, value) for key, value in after.items() if value is not None)
+        exit_changed(module, after if msg is None else msg, before, after)
+
+
+def check_update(module, current, desired):
+    """Exits the module when an update of the current resource would change nothing.
+
+    In check mode, the module exits with the resource as it would be updated
+    instead of updating it.
+
+    Args:
+        module: the AnsibleModule.
+        current: the resource read by the existence check, or None.
+        desired: the desired values, by field name of the resource.
+    """
+    if current is not None and not changes(current, desired):
+        module.exit_json(changed=False, msg=current)
+    if module.check_mode:
+        after = updated(current, desired)
+        exit_changed(module, after, current, after)
+
+
+def conditional_update(module, current, etag, desired, read, write, retry=True, conflicts=(PRECONDITION_FAILED,)):
+    """Updates a resource with a conditional write and exits the module.
+
+    The write is conditional on the ETag or revision of the current resource.
+    When it fails because the resource changed since it was read, the
+    resource is read and diffed with desired again, and the write is retried
+    once, unless the new resource leaves nothing to update.
+
+    Args:
+        module: the AnsibleModule.
+        current: the resource read by the existence check.
+        etag: the ETag header of that read, or None.
+        desired: the desired values, by field name of the resource.
+        read: returns the DetailedResponse of a new read of the resource.
+        write: takes the current resource and its ETag, and returns the
+            DetailedResponse of the update.
+        retry: False when the condition was set by the user, whose write
+            must then fail rather than overwrite a newer resource.
+        conflicts: the statuses of a write made with a stale ETag or revision.
+    """
+    for attempt in (1, 2):
+        try:
+            result = write(current, etag).get_result()
+        except ApiException as ex:
+            if ex.code not in conflicts or not retry or attempt == 2:
+                module.fail_json(msg=ex.message)
+                return
+            try:
+                response = read()
+            except ApiException as ex:
+                module.fail_json(msg=ex.message)
+                return
+            current = response.get_result()
+            etag = response.get_headers().get('ETag')
+            check_update(module, current, desired)
+        else:
+            exit_changed(module, result, current, result)
+            return
@@ -0,0 +1,107 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+def get_cache_dir(name, env_var):
+    """Returns the directory holding one kind of cached data.
+
+    The environment variable env_var takes precedence, then
+    $XDG_CACHE_HOME/ibm.cloud/<name> and finally ~/.cache/ibm.cloud/<name>.
+    """
+    directory = os.getenv(env_var)
+    if not directory:
+        base = os.getenv('XDG_CACHE_HOME') or os.path.join(
+            os.path.expanduser('~'), '.cache')
+        directory = os.path.join(base, 'ibm.cloud', name)
+    return directory
+
+
+class DiskCache:
+    """A single cached JSON value with an expiry time, shared across processes.
+
+    Entries are stored in a user-private directory and keyed by a SHA-256
+    digest of the key parts, so secrets used as keys never appear on disk.
+    Writers hold an exclusive lock on a sibling lock file, which lets
+    concurrent Ansible forks share one lookup instead of racing each other.
+    """
+
+    def __init__(self, directory, *key_parts):
+        digest = hashlib.sha256()
+        for part in key_parts:
+            digest.update((part or '').encode('utf-8'))
+            digest.update(b'\0')
+        self.directory = directory
+        self.path = os.path.join(directory, digest.hexdigest() + '.json')
+        self.lock_path = self.path + '.lock'
+
+    def _ensure_directory(self):
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self._check_directory()
+
+    def _check_directory(self):
+        st = os.stat(self.directory)
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise OSError(
+                "cache directory %s is not private to the current user" % self.directory)
+
+    def load(self, skew=0):
+        """Returns the cached value, or None if missing or expiring within skew seconds."""
+        try:
+            self._check_directory()
+            with open(self.path, 'r') as f:
+                entry = json.load(f)
+            expire_time = float(entry['expire_time'])
+            value = entry['value']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if expire_time - skew <= time.time():
+            return None
+        return value
+
+    def store(self, value, expire_time):
+        """Atomically replaces the cached value."""
+        self._ensure_directory()
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(dict(value=value, expire_time=expire_time), f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    @contextlib.contextmanager
+    def lock(self):
+        """Holds an exclusive inter-process lock on this cache entry.
+
+        Locking is best effort: if the lock file cannot be created the block
+        still runs, it just is not serialized against other processes.
+        """
+        fd = None
+        if fcntl is not None:
+            try:
+                self._ensure_directory()
+                fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except OSError:
+                if fd is not None:
+                    os.close(fd)
+                fd = None
+        try:
+            yield
+        finally:
+            if fd is not None:
+                os.close(fd)
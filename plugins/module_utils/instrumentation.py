@@ -0,0 +1,205 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import sys
+import threading
+import time
+
+from urllib.parse import urlencode, urlsplit
+
+from ibm_cloud_sdk_core import ApiException
+
+
+class CallRecorder:
+    """Records the HTTP calls made by the SDK clients and token managers.
+
+    The call count and total time are always kept. With `detailed` set, one
+    entry per call is kept as well: service, operation, method, path
+    template, status, latency, request and response bytes and retries. In
+    the path template, the path parameters of the operation are {}.
+    """
+
+    def __init__(self):
+        self.detailed = False
+        self.count = 0
+        self.total_time = 0.0
+        self.calls = []
+        self._lock = threading.Lock()
+        # The request being sent by the current thread, see instrument_client().
+        self._local = threading.local()
+
+    def summary(self):
+        return dict(
+            count=self.count,
+            total_time=round(self.total_time, 3),
+        )
+
+    def record(self, **call):
+        with self._lock:
+            self.count += 1
+            self.total_time += call['latency']
+            if self.detailed:
+                call['latency'] = round(call['latency'], 3)
+                self.calls.append(call)
+
+    def response_hook(self, response, *args, **kwargs):
+        """requests response hook of the shared session."""
+        self._local.response = response
+
+    def instrument_client(self, client):
+        """Records every call sent by an SDK client built by config.py."""
+        prepare_request = client.prepare_request
+        encode_path_vars = client.encode_path_vars
+        send = client.send
+        local = self._local
+        _instrument_sdk_headers(sys.modules[type(client).__module__])
+
+        def recorded_encode_path_vars(*args):
+            # The operation formats its path with the values encoded here.
+            local.path_values = list(encode_path_vars(*args))
+            return local.path_values
+
+        def recorded_prepare_request(method, url, **kwargs):
+            local.operation = getattr(_operation, 'id', None)
+            local.template = _path_template(urlsplit(url).path, getattr(local, 'path_values', None))
+            _operation.id = local.path_values = None
+            return prepare_request(method, url, **kwargs)
+
+        def recorded_send(request, **kwargs):
+            local.response = None
+            status = None
+            start = time.time()
+            try:
+                response = send(request, **kwargs)
+                status = response.get_status_code()
+                return response
+            except ApiException as ex:
+                status = _status_code(ex)
+                raise
+            finally:
+                latency = time.time() - start
+                http_response = local.response
+                self.record(
+                    service=client.DEFAULT_SERVICE_NAME,
+                    operation=getattr(local, 'operation', None),
+                    method=request['method'],
+                    path=getattr(local, 'template', None) or urlsplit(request['url']).path,
+                    status=status,
+                    latency=latency,
+                    request_bytes=_body_size(request.get('data')),
+                    response_bytes=_response_size(http_response, kwargs.get('stream')),
+                    retries=_retries(http_response),
+                )
+                local.operation = local.template = None
+
+        client.encode_path_vars = recorded_encode_path_vars
+        client.prepare_request = recorded_prepare_request
+        client.send = recorded_send
+        return client
+
+    def instrument_token_manager(self, token_manager, service):
+        """Records the token requests of an authenticator's token manager."""
+        request = token_manager._request
+
+        def recorded_request(method, url, **kwargs):
+            # The token managers send their requests with requests itself,
+            # a response hook catches the response they only return the JSON of.
+            responses = []
+            hooks = dict(kwargs.get('hooks') or {})
+            hooks['response'] = _hook_list(hooks.get('response')) + [
+                lambda response, *args, **kw: responses.append(response)]
+            kwargs['hooks'] = hooks
+            start = time.time()
+            try:
+                return request(method, url, **kwargs)
+            finally:
+                response = responses[-1] if responses else None
+                self.record(
+                    service=service,
+                    operation='request_token',
+                    method=method,
+                    path=urlsplit(url).path,
+                    status=response.status_code if response is not None else None,
+                    latency=time.time() - start,
+                    request_bytes=_body_size(kwargs.get('data')),
+                    response_bytes=_response_size(response, False),
+                    retries=0,
+                )
+
+        token_manager._request = recorded_request
+        return token_manager
+
+
+# The operation being prepared by the current thread, see _instrument_sdk_headers().
+_operation = threading.local()
+
+
+def _instrument_sdk_headers(sdk_module):
+    """Notes the operation ID the operations of an SDK module pass to get_sdk_headers().
+
+    The generated SDKs call get_sdk_headers() of their module with the ID of
+    the operation, for analytics, before they prepare its request.
+    """
+    get_sdk_headers = getattr(sdk_module, 'get_sdk_headers', None)
+    if get_sdk_headers is None or getattr(get_sdk_headers, 'recorded', False):
+        return
+
+    def recorded_get_sdk_headers(*args, **kwargs):
+        _operation.id = kwargs.get('operation_id')
+        return get_sdk_headers(*args, **kwargs)
+
+    recorded_get_sdk_headers.recorded = True
+    sdk_module.get_sdk_headers = recorded_get_sdk_headers
+
+
+def _path_template(path, values):
+    """Replaces the path segments holding the encoded path values with {}."""
+    if not values:
+        return path
+    segments = path.split('/')
+    start = 0
+    for value in values:
+        for i in range(start, len(segments)):
+            if segments[i] == value:
+                segments[i] = '{}'
+                start = i + 1
+                break
+    return '/'.join(segments)
+
+
+def _hook_list(hooks):
+    if hooks is None:
+        return []
+    return list(hooks) if isinstance(hooks, (list, tuple)) else [hooks]
+
+
+def _status_code(ex):
+    # ApiException.code is deprecated in favour of status_code in newer SDKs.
+    status = getattr(ex, 'status_code', None)
+    return status if status is not None else ex.code
+
+
+def _body_size(data):
+    if data is None:
+        return 0
+    if isinstance(data, (bytes, str)):
+        return len(data)
+    if isinstance(data, dict):
+        return len(urlencode(data))
+    # Streamed and gzip-compressed bodies have no known size up front.
+    return None
+
+
+def _response_size(response, stream):
+    if response is None:
+        return None
+    if stream:
+        length = response.headers.get('Content-Length')
+        return int(length) if length else None
+    return len(response.content)
+
+
+def _retries(response):
+    retries = getattr(getattr(response, 'raw', None), 'retries', None)
+    history = getattr(retries, 'history', None)
+    return len(history) if history else 0
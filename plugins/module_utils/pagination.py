@@ -0,0 +1,344 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from ibm_cloud_sdk_core import get_query_param
+
+from . import projection
+
+DEFAULT_WORKERS = 4
+# Largest page size of the list operations, used to count items in few requests.
+MAX_PAGE_SIZE = 100
+
+
+# Options of pagination_argument_spec() that select different results.
+MUTUALLY_EXCLUSIVE = [
+    ('count_only', 'exists_only', 'output_file', 'results_only'),
+]
+
+
+def pagination_argument_spec(concurrent=False):
+    """Returns the argument spec of the paging options of the list modules.
+
+    Merge it into the module_args of a list module, pass MUTUALLY_EXCLUSIVE
+    to its AnsibleModule and, when use_pager() tells so, hand the pager of its
+    list operation to exit_json(). With concurrent the workers option of
+    offset paged operations is included as well.
+    """
+    spec = dict(
+        all_pages=dict(
+            type='bool',
+            default=False,
+            required=False),
+        max_items=dict(
+            type='int',
+            required=False),
+        results_only=dict(
+            type='bool',
+            default=False,
+            required=False),
+        output_file=dict(
+            type='path',
+            required=False),
+        count_only=dict(
+            type='bool',
+            default=False,
+            required=False),
+        exists_only=dict(
+            type='bool',
+            default=False,
+            required=False),
+    )
+    if concurrent:
+        spec.update(
+            workers=dict(
+                type='int',
+                default=DEFAULT_WORKERS,
+                required=False),
+        )
+    return spec
+
+
+class Pager:
+    """Pages through an SDK list operation.
+
+    Subclasses address the pages with a start token, an offset or a page
+    token. Pages are only requested as they are consumed, so a caller that
+    stops early does not fetch the rest, and the number of pages requested
+    so far is kept in pages_fetched.
+
+    Args:
+        list_method: the SDK list method, e.g. list_resource_keys.
+        key: the key of the items in a page, e.g. resources.
+        page_size: the number of items per page, the server default by default.
+        predicate: if given, only the items it is true for are yielded, as
+            the pages come in.
+        kwargs: the other arguments of the list method.
+    """
+
+    # Name of the page size argument of the list method.
+    page_size_param = 'limit'
+
+    def __init__(self, list_method, key, page_size=None, predicate=None, **kwargs):
+        self.list_method = list_method
+        self.key = key
+        self.page_size = page_size
+        self.predicate = predicate
+        self.kwargs = kwargs
+        self.pages_fetched = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, page_size, **kwargs):
+        kwargs.update(self.kwargs)
+        kwargs[self.page_size_param] = page_size
+        result = self.list_method(**kwargs).get_result()
+        with self._lock:
+            self.pages_fetched += 1
+        return result
+
+    def pages(self, max_items=None, page_size=None):
+        """Yields the pages, enough of them to hold max_items items.
+
+        page_size overrides the page size given to the pager.
+        """
+        raise NotImplementedError
+
+    def items(self, max_items=None):
+        """Yields the items of all pages, up to max_items."""
+        if max_items is not None and max_items <= 0:
+            return
+        count = 0
+        for page in self.pages(max_items):
+            for item in page.get(self.key) or []:
+                if self.predicate is not None and not self.predicate(item):
+                    continue
+                yield item
+                count += 1
+                if count == max_items:
+                    return
+
+    def exists(self):
+        """Tells whether there is any item, fetching a single one unless there is a predicate."""
+        for dummy in self.items(1):
+            return True
+        return False
+
+    def count(self):
+        """Returns the number of items, paging through them with the largest pages."""
+        pages = self.pages(page_size=self.page_size or MAX_PAGE_SIZE)
+        if self.predicate is None:
+            return sum(len(page.get(self.key) or []) for page in pages)
+        return sum(1 for page in pages for item in page.get(self.key) or [] if self.predicate(item))
+
+    def _page_size(self, max_items):
+        # No need to fetch pages larger than the items wanted, unless some
+        # of them are filtered out.
+        if max_items is not None and self.predicate is None and (self.page_size is None or self.page_size > max_items):
+            return max(1, max_items)
+        return self.page_size
+
+
+class TokenPager(Pager):
+    """Pages addressed by a token read from the next page URL of the previous page."""
+
+    # Name of the token argument of the list method.
+    token_param = None
+    # Field of a page holding the URL of the next page.
+    next_field = None
+
+    def __init__(self, list_method, key, token=None, page_size=None, **kwargs):
+        super().__init__(list_method, key, page_size, **kwargs)
+        self.token = token
+
+    def pages(self, max_items=None, page_size=None):
+        page_size = page_size or self._page_size(max_items)
+        token = self.token
+        while True:
+            result = self.fetch(page_size, **{self.token_param: token})
+            yield result
+            next_url = result.get(self.next_field)
+            token = get_query_param(next_url, self.token_param) if next_url else None
+            if not token:
+                return
+
+
+class StartTokenPager(TokenPager):
+    """Pages of the Resource Controller, addressed by the start token of next_url."""
+
+    token_param = 'start'
+    next_field = 'next_url'
+
+
+class PageTokenPager(TokenPager):
+    """Pages of IAM Identity, addressed by the pagetoken of next."""
+
+    page_size_param = 'pagesize'
+    token_param = 'pagetoken'
+    next_field = 'next'
+
+
+class OffsetPager(Pager):
+    """Pages addressed by an offset, like the ones of IAM Access Groups.
+
+    Once the first page is in, its total_count gives the offsets of all the
+    other pages, which are then fetched on at most workers threads, no more
+    than workers pages ahead of the one yielded, and yielded in order.
+    Without a total_count the pages are fetched one after the other until a
+    short page.
+    """
+
+    def __init__(self, list_method, key, offset=None, page_size=None, workers=DEFAULT_WORKERS, **kwargs):
+        super().__init__(list_method, key, page_size, **kwargs)
+        self.offset = offset or 0
+        self.workers = workers
+
+    def count(self):
+        """Returns the number of items, from the total_count of a single item page if any."""
+        if self.predicate is not None:
+            return super().count()
+        first = self.fetch(1, offset=self.offset)
+        total_count = first.get('total_count')
+        if total_count is None:
+            return super().count()
+        return max(0, total_count - self.offset)
+
+    def pages(self, max_items=None, page_size=None):
+        offset = self.offset
+        page_size = page_size or self._page_size(max_items)
+        first = self.fetch(page_size, offset=offset)
+        yield first
+        page_size = first.get('limit') or page_size
+        if not page_size:
+            return
+        total_count = first.get('total_count')
+        end = total_count
+        # With a predicate, items() stops once max_items items matched, the
+        # items filtered out must not count against it.
+        if max_items is not None and self.predicate is None:
+            end = offset + max_items if end is None else min(end, offset + max_items)
+
+        if total_count is None:
+            page = first
+            while len(page.get(self.key) or []) >= page_size and (end is None or offset + page_size < end):
+                offset += page_size
+                page = self.fetch(page_size, offset=offset)
+                yield page
+            return
+
+        offsets = range(offset + page_size, end, page_size)
+        if not offsets:
+            return
+        # At most workers pages are fetched or waiting to be yielded at a time,
+        # so a large collection is not buffered in memory.
+        workers = max(1, min(self.workers, len(offsets)))
+        offsets = iter(offsets)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            window = deque(pool.submit(self.fetch, page_size, offset=o) for o in islice(offsets, workers))
+            try:
+                while window:
+                    page = window.popleft().result()
+                    for o in islice(offsets, 1):
+                        window.append(pool.submit(self.fetch, page_size, offset=o))
+                    yield page
+            finally:
+                for future in window:
+                    future.cancel()
+
+
+class _HashingFile:
+    """A binary file computing the SHA-256 of the bytes written to it."""
+
+    def __init__(self, f):
+        self.f = f
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data):
+        self.sha256.update(data)
+        return self.f.write(data)
+
+    def flush(self):
+        self.f.flush()
+
+
+def write_items(items, path):
+    """Writes items to path as JSON lines, one item at a time.
+
+    The lines are gzip compressed when path ends with .gz. The file is
+    replaced atomically once all items are written, so it never holds a
+    partial list.
+
+    Returns:
+        The number of items written and the SHA-256 of the file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    count = 0
+    try:
+        with os.fdopen(fd, 'wb') as raw:
+            f = _HashingFile(raw)
+            # A fixed mtime, so that the same items give the same checksum.
+            out = gzip.GzipFile(filename='', mode='wb', fileobj=f, mtime=0) if path.endswith('.gz') else f
+            for item in items:
+                out.write(json.dumps(item).encode('utf-8'))
+                out.write(b'\n')
+                count += 1
+            if out is not f:
+                out.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return count, f.sha256.hexdigest()
+
+
+def use_pager(module):
+    """Tells whether a list module exits with exit_json() and a pager.
+
+    That is with all_pages, with output_file, which always holds all the
+    items, and with count_only or exists_only.
+    """
+    params = module.params
+    return bool(params["all_pages"] or params.get("output_file")
+                or params.get("count_only") or params.get("exists_only"))
+
+
+def exit_json(module, pager):
+    """Exits a list module with the items of all the pages of pager.
+
+    By default the result is a dict with the items and the number of pages
+    fetched. With results_only it is the plain list of items, with
+    count_only the number of items and with exists_only whether there is
+    any. With output_file the items are written to that file as they come
+    in and the result holds its path, the number of items and the SHA-256
+    checksum of the file instead. Each item is projected on the fields
+    option of the module, if any, as it comes in.
+    """
+    if module.params.get('exists_only'):
+        module.exit_json(msg=pager.exists())
+    if module.params.get('count_only'):
+        module.exit_json(msg=pager.count())
+    items = pager.items(module.params.get('max_items'))
+    fields = module.params.get('fields')
+    if fields:
+        items = map(projection.projector(fields), items)
+    output_file = module.params.get('output_file')
+    if output_file:
+        count, checksum = write_items(items, output_file)
+        module.exit_json(changed=True, msg=dict(
+            path=output_file, count=count, checksum=checksum, pages_fetched=pager.pages_fetched))
+    items = list(items)
+    if module.params.get('results_only'):
+        module.exit_json(msg=items)
+    module.exit_json(msg=dict(items=items, pages_fetched=pager.pages_fetched))
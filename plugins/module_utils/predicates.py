@@ -0,0 +1,102 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+
+# Filters of the Resource Controller lists that some list operations take
+# as arguments. The others compare them with the fields of the items.
+SERVER_SIDE = ('resource_group_id', 'type', 'sub_type', 'state')
+
+
+def filters_argument_spec():
+    """Returns the argument spec of the filters option of the resource list modules.
+
+    Merge it into the module_args of a list module, then pass the filters
+    option and the arguments of its list operation to apply().
+    """
+    return dict(
+        filters=dict(
+            type='dict',
+            options=dict(
+                resource_group_id=dict(
+                    type='str',
+                    required=False),
+                type=dict(
+                    type='str',
+                    required=False),
+                sub_type=dict(
+                    type='str',
+                    required=False),
+                state=dict(
+                    type='str',
+                    required=False),
+                name=dict(
+                    type='str',
+                    required=False),
+                tags=dict(
+                    type='list',
+                    elements='str',
+                    required=False),
+                region=dict(
+                    type='str',
+                    required=False),
+            ),
+            required=False),
+    )
+
+
+def region(crn):
+    """Returns the region of a CRN, e.g. us-south, or None."""
+    parts = (crn or '').split(':')
+    return parts[5] if len(parts) > 5 else None
+
+
+def apply(filters, list_args):
+    """Pushes the filters the list operation takes into its arguments.
+
+    Args:
+        filters: the filters option of the module, or None.
+        list_args: the arguments of the list operation, updated in place.
+            A filter is sent to the server when list_args has a key for it.
+
+    Returns:
+        A predicate on the items for the other filters, or None when all of
+        them were sent to the server.
+
+    Raises:
+        ValueError: when a filter conflicts with the argument of the same
+            name, or the name filter is not a valid regular expression.
+    """
+    checks = []
+    for key, value in (filters or {}).items():
+        if value is None:
+            continue
+        if key in SERVER_SIDE and key in list_args:
+            if list_args[key] is not None and list_args[key] != value:
+                raise ValueError("filter %s conflicts with the option of the same name" % key)
+            list_args[key] = value
+        elif key in SERVER_SIDE:
+            checks.append(lambda item, key=key, value=value: item.get(key) == value)
+        elif key == 'name':
+            try:
+                pattern = re.compile(value)
+            except re.error as ex:
+                raise ValueError("filter name is not a valid regular expression: %s" % ex)
+            checks.append(lambda item: pattern.search(item.get('name') or '') is not None)
+        elif key == 'tags':
+            tags = set(value)
+            checks.append(lambda item: tags.issubset(item.get('tags') or ()))
+        elif key == 'region':
+            checks.append(lambda item, value=value: region(item.get('crn')) == value)
+    if not checks:
+        return None
+    return lambda item: all(check(item) for check in checks)
+
+
+def filter_page(result, key, predicate):
+    """Returns a page of a list operation keeping the items matching predicate."""
+    if predicate is None or not isinstance(result, dict):
+        return result
+    result = dict(result)
+    result[key] = [item for item in result.get(key) or [] if predicate(item)]
+    return result
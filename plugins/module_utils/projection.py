@@ -0,0 +1,103 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+def projection_argument_spec():
+    """Returns the argument spec of the fields option of the info modules.
+
+    Merge it into the module_args of an info module and exit it with
+    exit_json() of this module, or with pagination.exit_json() for all pages.
+    """
+    return dict(
+        fields=dict(
+            type='list',
+            elements='str',
+            required=False),
+    )
+
+
+def compile_fields(fields):
+    """Compiles field paths into a tree of dicts, True marking a whole value.
+
+    A path is a dotted list of keys, e.g. extensions.endpoints. A key may be
+    suffixed with [] to mark a list, whose elements are then projected one by
+    one, though lists are projected element by element anyway. The key *
+    stands for every key of a dict.
+    """
+    tree = {}
+    for field in fields:
+        keys = [key[:-2] if key.endswith('[]') else key for key in field.split('.')]
+        node = tree
+        for key in keys[:-1]:
+            child = node.get(key)
+            if child is True:
+                break
+            if child is None:
+                child = node[key] = {}
+            node = child
+        else:
+            node[keys[-1]] = True
+    return tree
+
+
+def _merge(a, b):
+    if a is True or b is True:
+        return True
+    merged = dict(a)
+    for key, value in b.items():
+        merged[key] = _merge(merged[key], value) if key in merged else value
+    return merged
+
+
+def _project(value, tree):
+    if tree is True:
+        return value
+    if isinstance(value, list):
+        return [_project(v, tree) for v in value]
+    if not isinstance(value, dict):
+        # A path going into a scalar keeps the scalar.
+        return value
+    wildcard = tree.get('*')
+    result = {}
+    for key, v in value.items():
+        sub = tree.get(key)
+        if wildcard is not None:
+            sub = wildcard if sub is None else _merge(sub, wildcard)
+        if sub is not None:
+            result[key] = _project(v, sub)
+    return result
+
+
+def project(value, fields):
+    """Returns value with only the given field paths, or value itself without fields."""
+    if not fields:
+        return value
+    return _project(value, compile_fields(fields))
+
+
+def projector(fields):
+    """Returns a function projecting values on the given field paths.
+
+    The paths are compiled once, which pays off for the items of a list.
+    """
+    if not fields:
+        return lambda value: value
+    tree = compile_fields(fields)
+    return lambda value: _project(value, tree)
+
+
+def exit_json(module, result, key=None):
+    """Exits an info module with result projected on its fields option.
+
+    For a page of a list operation, key is the key of its items, e.g.
+    resources. The items are projected and the rest of the page, like the
+    next page URL, is kept as it is.
+    """
+    fields = module.params.get('fields')
+    if fields and key is not None and isinstance(result, dict):
+        apply = projector(fields)
+        result = dict(result)
+        result[key] = [apply(item) for item in result.get(key) or []]
+    elif fields:
+        result = project(result, fields)
+    module.exit_json(msg=result)
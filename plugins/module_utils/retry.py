@@ -0,0 +1,92 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import time
+
+from urllib3.util.retry import Retry
+
+# Throttling and transient server errors worth another attempt.
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# Only methods that can safely be repeated are retried. POST and PATCH are
+# left out because resending them could create or modify a resource twice.
+IDEMPOTENT_METHODS = frozenset(['HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS', 'TRACE'])
+
+
+class RetryStats:
+    """Retries performed and seconds spent waiting between them."""
+
+    def __init__(self):
+        self.count = 0
+        self.wait_time = 0.0
+
+    def to_dict(self):
+        return dict(
+            count=self.count,
+            wait_time=round(self.wait_time, 3),
+        )
+
+
+class SDKRetry(Retry):
+    """urllib3 retry policy used by the HTTP session shared by the SDK clients.
+
+    Waits for the Retry-After header when the server sends one, capped at
+    backoff_max, otherwise for an exponential backoff of backoff_factor *
+    2 ** (retry - 1) seconds, capped at backoff_max and increased by a random
+    jitter of up to jitter seconds.
+    Every retry and wait is recorded in stats, which is shared with all the
+    copies urllib3 makes of the policy while it works through a request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.jitter = kwargs.pop('jitter', 0.0)
+        self.stats = kwargs.pop('stats', None) or RetryStats()
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_options(cls, max_retries, backoff_base, backoff_max, jitter, stats=None):
+        retry = cls(
+            total=max_retries,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=IDEMPOTENT_METHODS,
+            backoff_factor=backoff_base,
+            respect_retry_after_header=True,
+            # Hand the last response to the SDK so it raises its usual ApiException.
+            raise_on_status=False,
+            jitter=jitter,
+            stats=stats,
+        )
+        retry.backoff_max = backoff_max
+        return retry
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.backoff_max = self.backoff_max
+        retry.jitter = self.jitter
+        retry.stats = self.stats
+        return retry
+
+    def increment(self, *args, **kwargs):
+        retry = super().increment(*args, **kwargs)
+        self.stats.count += 1
+        return retry
+
+    def get_backoff_time(self):
+        retries = len(self.history)
+        if retries == 0:
+            return 0
+        backoff = min(self.backoff_max, self.backoff_factor * (2 ** (retries - 1)))
+        return backoff + random.uniform(0, self.jitter)
+
+    def sleep(self, response=None):
+        seconds = None
+        if self.respect_retry_after_header and response:
+            seconds = self.get_retry_after(response)
+            if seconds is not None:
+                seconds = min(seconds, self.backoff_max)
+        if seconds is None:
+            seconds = self.get_backoff_time()
+        if seconds > 0:
+            time.sleep(seconds)
+            self.stats.wait_time += seconds
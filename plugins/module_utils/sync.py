@@ -0,0 +1,144 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+from . import projection
+
+STATE_VERSION = 1
+# Changes are listed from this long before the watermark, in case the clocks
+# of the host and of the service differ. Listing a change twice is harmless.
+OVERLAP = timedelta(minutes=5)
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def sync_argument_spec():
+    """Returns the argument spec of the delta sync options of a list module.
+
+    Merge it into the module_args of a list module and exit it with
+    exit_json() when since_last_run is set.
+    """
+    return dict(
+        since_last_run=dict(
+            type='bool',
+            default=False,
+            required=False),
+        state_file=dict(
+            type='path',
+            required=False),
+    )
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def load_state(path):
+    """Returns the state stored at path, or None when there is no usable one."""
+    try:
+        with open(path, 'r') as f:
+            state = json.load(f)
+    except (OSError, IOError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get('version') != STATE_VERSION:
+        return None
+    return state
+
+
+def write_state(module, path, state):
+    """Replaces the state at path atomically."""
+    fd, tmp_path = tempfile.mkstemp(dir=module.tmpdir)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(state, f, sort_keys=True, separators=(',', ':'))
+    module.atomic_move(tmp_path, path)
+
+
+def sync(state, filters, new_pager, fields=None, predicate=None):
+    """Brings a snapshot of a list up to date with the changes since its watermark.
+
+    The snapshot is listed in full when there is no state yet or when it was
+    taken with other filters or fields. Otherwise only the items updated
+    since the watermark are listed and merged into it, and the items removed
+    since then are dropped from it.
+
+    Args:
+        state: the state returned by load_state(), or None.
+        filters: the arguments of the list operation, stored in the state.
+        new_pager: returns a pager of the list operation, called with the
+            updated_from and state arguments overriding the filters.
+        fields: the field paths the items are projected on, if any.
+        predicate: if given, the snapshot only holds the items it is true
+            for, and an item updated so that it no longer is gets dropped.
+
+    Returns:
+        The new state and a summary of the changes.
+    """
+    watermark = _now()
+    items = {}
+    full_sync = state is None or state.get('filters') != filters or state.get('fields') != fields
+    updated = removed = 0
+    pagers = []
+    project = projection.projector(fields)
+
+    if full_sync:
+        pager = new_pager()
+        pagers.append(pager)
+        for item in pager.items():
+            if predicate is None or predicate(item):
+                items[item['id']] = project(item)
+        updated = len(items)
+    else:
+        items = dict(state['items'])
+        since = datetime.strptime(state['watermark'], TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+        updated_from = (since - OVERLAP).strftime(TIMESTAMP_FORMAT)
+        pager = new_pager(updated_from=updated_from)
+        pagers.append(pager)
+        for item in pager.items():
+            id = item['id']
+            if predicate is not None and not predicate(item):
+                if items.pop(id, None) is not None:
+                    removed += 1
+                continue
+            item = project(item)
+            if items.get(id) != item:
+                items[id] = item
+                updated += 1
+        # Removed items are only listed on request.
+        pager = new_pager(updated_from=updated_from, state='removed')
+        pagers.append(pager)
+        for item in pager.items():
+            if items.pop(item['id'], None) is not None:
+                removed += 1
+
+    new_state = dict(
+        version=STATE_VERSION,
+        watermark=watermark.strftime(TIMESTAMP_FORMAT),
+        filters=filters,
+        fields=fields,
+        items=items,
+    )
+    summary = dict(
+        watermark=new_state['watermark'],
+        full_sync=full_sync,
+        count=len(items),
+        updated=updated,
+        removed=removed,
+        pages_fetched=sum(p.pages_fetched for p in pagers),
+    )
+    return new_state, summary
+
+
+def exit_json(module, filters, new_pager, predicate=None):
+    """Exits a list module after syncing the snapshot of its state_file.
+
+    The result holds the path of the state file and the summary of sync().
+    The module reports a change when items were updated or removed.
+    """
+    path = module.params['state_file']
+    state, summary = sync(load_state(path), filters, new_pager, module.params.get('fields'), predicate)
+    write_state(module, path, state)
+    summary['path'] = path
+    module.exit_json(changed=bool(summary['updated'] or summary['removed']), msg=summary)
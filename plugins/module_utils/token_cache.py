@@ -0,0 +1,82 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+
+import jwt
+from ansible.module_utils.parsing.convert_bool import boolean
+from ..module_utils.disk_cache import DiskCache, get_cache_dir
+
+# Tokens are considered stale this many seconds before they really expire,
+# so a task never starts an API call with a token that is about to lapse.
+EXPIRY_SKEW = 300
+
+# Fields of the IAM token response that are never needed to reuse a token.
+_DROPPED_FIELDS = ('refresh_token',)
+
+
+def is_enabled():
+    """Whether the token cache is switched on (IC_TOKEN_CACHE, default true)."""
+    return boolean(os.getenv('IC_TOKEN_CACHE', 'true'), strict=False)
+
+
+def _expire_time(token_manager, token):
+    claims = jwt.decode(
+        token[token_manager.token_name],
+        algorithms=['RS256'],
+        options={'verify_signature': False, 'verify_aud': False})
+    return int(claims['exp'])
+
+
+def attach(token_manager, *credential):
+    """Backs a JWT token manager from the SDK with the on-disk token cache.
+
+    A still valid cached token is loaded right away, and every later token
+    request is answered from the cache when another process already
+    refreshed it. Any cache failure falls back to the plain token exchange.
+
+    Args:
+        token_manager: the token manager of an SDK authenticator.
+        credential: what the token is exchanged for, e.g. the API key or
+            the trusted profile.
+    Returns:
+        The same token manager.
+    """
+    if not is_enabled():
+        return token_manager
+
+    cache = DiskCache(
+        get_cache_dir('tokens', 'IC_TOKEN_CACHE_DIR'), token_manager.url, *credential)
+    request_token = token_manager.request_token
+    save_token_info = token_manager._save_token_info
+
+    def exchange_and_store():
+        token = request_token()
+        try:
+            cache.store(
+                dict((k, v) for k, v in token.items() if k not in _DROPPED_FIELDS),
+                _expire_time(token_manager, token))
+        except (OSError, jwt.InvalidTokenError, KeyError, TypeError):
+            pass
+        return token
+
+    def cached_request_token():
+        with cache.lock():
+            return cache.load(EXPIRY_SKEW) or exchange_and_store()
+
+    def cached_save_token_info(token_response):
+        save_token_info(token_response)
+        # Keep using the token until shortly before it expires instead of
+        # refreshing it after 80% of its lifetime.
+        token_manager.refresh_time = token_manager.expire_time - EXPIRY_SKEW
+
+    token_manager.request_token = cached_request_token
+    token_manager._save_token_info = cached_save_token_info
+
+    token = cache.load(EXPIRY_SKEW)
+    if token is not None:
+        try:
+            token_manager._save_token_info(token)
+        except (jwt.InvalidTokenError, KeyError, TypeError):
+            pass
+    return token_manager
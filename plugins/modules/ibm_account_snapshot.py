@@ -0,0 +1,121 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: ibm_account_snapshot
+short_description: Crawl the resources and IAM objects of an account into a local snapshot.
+author:
+    - "Kavya Handadi (@kavya498)"
+version_added: "1.0.0"
+description:
+    - This module lists the resource groups, resource instances, keys, bindings and aliases, the access groups
+      with their members and rules, and the service IDs of an account, and writes them to a SQLite database.
+    - The lists are fetched in parallel, and the members and rules of the access groups as soon as the access groups are in.
+    - Every resource is a row of the C(resources) table, indexed by C(kind), C(id), C(crn), C(name), C(resource_group_id)
+      and C(parent_id), the access group of members and rules. Its C(document) column holds the JSON document
+      of the resource compressed with zlib.
+    - The C(meta) table holds the C(account_id), the time the snapshot was C(created) and the C(counts) of every kind.
+requirements:
+    - "ResourceManagerV2"
+    - "ResourceControllerV2"
+    - "IamAccessGroupsV2"
+    - "IamIdentityV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+options:
+    account_id:
+        description:
+            - The ID of the account to crawl.
+        type: str
+        required: true
+    path:
+        description:
+            - The path of the snapshot database to write. It is replaced once the crawl is complete.
+        type: path
+        required: true
+    workers:
+        description:
+            - Maximum number of lists fetched at the same time.
+            - Raise I(pool_size) with it, so that every worker has a connection.
+        type: int
+        default: 8
+'''
+
+EXAMPLES = r'''
+Examples coming soon.
+'''
+
+import os
+import tempfile
+
+from ..module_utils import config
+from ..module_utils import account_snapshot
+from ansible.module_utils.basic import AnsibleModule
+from ibm_cloud_sdk_core import ApiException
+
+
+def run_module():
+    module_args = dict(
+        account_id=dict(
+            type='str',
+            required=True),
+        path=dict(
+            type='path',
+            required=True),
+        workers=dict(
+            type='int',
+            default=account_snapshot.DEFAULT_WORKERS,
+            required=False),
+    )
+
+    module_args.update(config.sdk_argument_spec())
+
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=False
+    )
+    config.configure(module)
+
+    account_id = module.params["account_id"]
+    path = module.params["path"]
+    workers = module.params["workers"]
+
+    # SQLite takes the empty file as a new database.
+    fd, tmp_path = tempfile.mkstemp(dir=module.tmpdir, suffix='.db')
+    os.close(fd)
+    try:
+        counts = account_snapshot.write_snapshot(
+            tmp_path, account_id, account_snapshot.crawl(account_id, workers))
+    except ApiException as ex:
+        module.fail_json(msg=ex.message)
+    module.atomic_move(tmp_path, path)
+
+    module.exit_json(changed=True, msg=dict(path=path, counts=counts))
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
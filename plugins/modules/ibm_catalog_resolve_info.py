@@ -0,0 +1,145 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: ibm_catalog_resolve_info
+short_description: Resolve Global Catalog services, plans and deployments.
+author:
+    - "Kavya Handadi (@kavya498)"
+version_added: "1.0.0"
+description:
+    - This module resolves many service, plan and location tuples to the IDs and catalog CRNs used to provision resource instances.
+    - Every distinct service and plan is looked up once, and the deployments of the distinct plans are looked up in parallel.
+    - The resolutions are stored in the catalog cache, so later M(ibm.cloud.ibm_resource_instance) tasks
+      for the same tuples do not query the Global Catalog again.
+requirements:
+    - "GlobalCatalogV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.catalog_cache
+options:
+    targets:
+        description:
+            - The service, plan and location tuples to resolve.
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+            service:
+                description:
+                    - The name of the service in the global catalog.
+                type: str
+                required: true
+            plan:
+                description:
+                    - The name of the service plan.
+                type: str
+                required: true
+            location:
+                description:
+                    - The deployment location of the plan.
+                type: str
+                required: true
+    workers:
+        description:
+            - Maximum number of plans whose deployments are looked up at the same time.
+        type: int
+        default: 4
+'''
+
+EXAMPLES = r'''
+Examples coming soon.
+'''
+
+from ..module_utils import config
+from ..module_utils import catalog
+from ansible.module_utils.basic import AnsibleModule
+from ibm_cloud_sdk_core import ApiException
+
+
+def run_module():
+    module_args = dict(
+        targets=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                service=dict(
+                    type='str',
+                    required=True),
+                plan=dict(
+                    type='str',
+                    required=True),
+                location=dict(
+                    type='str',
+                    required=True),
+            ),
+            required=True),
+        workers=dict(
+            type='int',
+            default=catalog.DEFAULT_RESOLVE_WORKERS,
+            required=False),
+    )
+
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(catalog.catalog_argument_spec())
+
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=False
+    )
+    config.configure(module)
+    catalog.configure(module)
+
+    targets = [(t['service'], t['plan'], t['location']) for t in module.params["targets"]]
+    workers = module.params["workers"]
+
+    try:
+        resolutions = catalog.resolve_many(targets, workers)
+    except ApiException as ex:
+        module.fail_json(msg=ex.message)
+
+    # Keyed by "<service>/<plan>/<location>".
+    result = {}
+    errors = []
+    for target, resolution in resolutions.items():
+        key = '/'.join(target)
+        if isinstance(resolution, ValueError):
+            errors.append('%s: %s' % (key, resolution))
+        else:
+            serviceID, catalogCRN, servicePlanID = resolution
+            result[key] = dict(
+                service_id=serviceID,
+                plan_id=servicePlanID,
+                catalog_crn=catalogCRN,
+            )
+    if errors:
+        module.fail_json(msg='\n'.join(errors))
+    module.exit_json(msg=result)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
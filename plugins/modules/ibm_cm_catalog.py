@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_cm_catalog.
 requirements:
     - "CatalogManagementV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     short_description:
         description:
@@ -49,6 +51,7 @@ options:
     rev:
         description:
             - Cloudant revision.
+            - Defaults to the revision of the existing catalog on update.
         type: str
     catalog_icon_url:
         description:
@@ -270,6 +273,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ibm_platform_services import CatalogManagementV1
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -467,10 +471,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     short_description = module.params["short_description"]
     resource_group_id = module.params["resource_group_id"]
@@ -490,13 +497,17 @@ def run_module():
 
     sdk = config.get_catalog_management_sdk()
     resource_exists = True
+    current = None
+    etag = None
 
     # Check for existence
     if catalog_identifier:
         try:
-            sdk.get_catalog(
+            response = sdk.get_catalog(
                 catalog_identifier=catalog_identifier,
             )
+            current = response.get_result()
+            etag = response.get_headers().get('ETag')
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -509,6 +520,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": catalog_identifier, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_catalog(
                     catalog_identifier=catalog_identifier,
@@ -516,14 +530,30 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": catalog_identifier, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": catalog_identifier, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                id=id,
+                rev=rev,
+                label=label,
+                short_description=short_description,
+                catalog_icon_url=catalog_icon_url,
+                tags=tags,
+                features=features,
+                disabled=disabled,
+                resource_group_id=resource_group_id,
+                owning_account=owning_account,
+                catalog_filters=catalog_filters,
+                syndication_settings=syndication_settings,
+                kind=kind,
+            ))
+
             # Create path
             try:
                 result = sdk.create_catalog(
@@ -544,14 +574,35 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
-            # Update path
-            try:
-                result = sdk.replace_catalog(
+            # No-op and check mode paths
+            desired = dict(
+                label=label,
+                short_description=short_description,
+                catalog_icon_url=catalog_icon_url,
+                tags=tags,
+                features=features,
+                disabled=disabled,
+                resource_group_id=resource_group_id,
+                owning_account=owning_account,
+                catalog_filters=catalog_filters,
+                syndication_settings=syndication_settings,
+                kind=kind,
+            )
+            diff.check_update(module, current, desired)
+
+            # Update path, conditional on the revision of the catalog read
+            def read():
+                return sdk.get_catalog(
+                    catalog_identifier=catalog_identifier,
+                )
+
+            def write(current, etag):
+                return sdk.replace_catalog(
                     catalog_identifier=catalog_identifier,
                     id=id,
-                    rev=rev,
+                    rev=rev or current.get('_rev'),
                     label=label,
                     short_description=short_description,
                     catalog_icon_url=catalog_icon_url,
@@ -563,11 +614,13 @@ def run_module():
                     catalog_filters=catalog_filters,
                     syndication_settings=syndication_settings,
                     kind=kind,
-                ).get_result()
-            except ApiException as ex:
-                module.fail_json(msg=ex.message)
-            else:
-                module.exit_json(changed=True, msg=result)
+                    headers={'If-Match': etag} if etag else {},
+                )
+
+            # The revision is checked by Cloudant, which rejects a stale one
+            # with 409, an If-Match header with a stale ETag gets 412.
+            diff.conditional_update(module, current, etag, desired, read, write, retry=not rev,
+                                    conflicts=(diff.CONFLICT, diff.PRECONDITION_FAILED))
 
 
 def main():
@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_cm_offering.
 requirements:
     - "CatalogManagementV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     short_description:
         description:
@@ -781,6 +783,7 @@ EXAMPLES = r'''
 Examples coming soon.
 '''
 from ..module_utils import config
+from ..module_utils import diff
 from ibm_platform_services import CatalogManagementV1
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -1382,10 +1385,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     short_description = module.params["short_description"]
     offering_support_url = module.params["offering_support_url"]
@@ -1437,16 +1443,18 @@ def run_module():
 
     sdk = config.get_catalog_management_sdk()
     resource_exists = True
+    current = None
 
     # Check for existence
     if offering_id:
         try:
-            sdk.get_offering(
+            response = sdk.get_offering(
                 catalog_identifier=catalog_identifier,
                 offering_id=offering_id,
                 type=type,
                 digest=digest,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -1459,6 +1467,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": offering_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_offering(
                     catalog_identifier=catalog_identifier,
@@ -1467,14 +1478,58 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": offering_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": offering_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                catalog_identifier=catalog_identifier,
+                id=id,
+                rev=rev,
+                url=url,
+                crn=crn,
+                label=label,
+                name=name,
+                offering_icon_url=offering_icon_url,
+                offering_docs_url=offering_docs_url,
+                offering_support_url=offering_support_url,
+                tags=tags,
+                keywords=keywords,
+                rating=rating,
+                created=created,
+                updated=updated,
+                short_description=short_description,
+                long_description=long_description,
+                features=features,
+                kinds=kinds,
+                pc_managed=pc_managed,
+                publish_approved=publish_approved,
+                share_with_all=share_with_all,
+                share_with_ibm=share_with_ibm,
+                share_enabled=share_enabled,
+                permit_request_ibm_public_publish=permit_request_ibm_public_publish,
+                ibm_publish_approved=ibm_publish_approved,
+                public_publish_approved=public_publish_approved,
+                public_original_crn=public_original_crn,
+                publish_public_crn=publish_public_crn,
+                portal_approval_record=portal_approval_record,
+                portal_ui_url=portal_ui_url,
+                catalog_id=catalog_id,
+                catalog_name=catalog_name,
+                metadata=metadata,
+                disclaimer=disclaimer,
+                hidden=hidden,
+                provider=provider,
+                provider_info=provider_info,
+                repo_info=repo_info,
+                support=support,
+                media=media,
+            ))
+
             # Create path
             try:
                 result = sdk.create_offering(
@@ -1523,8 +1578,11 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # Check mode path
+            diff.exit_if_check_mode(module, current, diff.patched(current, updates))
+
             # Update path
             try:
                 result = sdk.update_offering(
@@ -1536,7 +1594,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_cm_offering_instance.
 requirements:
     - "CatalogManagementV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     kind_format:
         description:
@@ -151,6 +153,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ibm_platform_services import CatalogManagementV1
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -247,10 +250,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     kind_format = module.params["kind_format"]
     install_plan = module.params["install_plan"]
@@ -278,13 +284,15 @@ def run_module():
     sdk = config.get_catalog_management_sdk()
 
     resource_exists = True
+    current = None
 
     # Check for existence
     if instance_identifier:
         try:
-            sdk.get_offering_instance(
+            response = sdk.get_offering_instance(
                 instance_identifier=instance_identifier,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -297,6 +305,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": instance_identifier, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_offering_instance(
                     instance_identifier=instance_identifier,
@@ -305,14 +316,36 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": instance_identifier, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": instance_identifier, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                id=id,
+                rev=rev,
+                url=url,
+                crn=crn,
+                label=label,
+                catalog_id=catalog_id,
+                offering_id=offering_id,
+                kind_format=kind_format,
+                version=version,
+                cluster_id=cluster_id,
+                cluster_region=cluster_region,
+                cluster_namespaces=cluster_namespaces,
+                cluster_all_namespaces=cluster_all_namespaces,
+                schematics_workspace_id=schematics_workspace_id,
+                resource_group_id=resource_group_id,
+                install_plan=install_plan,
+                channel=channel,
+                metadata=metadata,
+                last_operation=last_operation,
+            ))
+
             # Create path
             try:
                 result = sdk.create_offering_instance(
@@ -340,8 +373,28 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                url=url,
+                crn=crn,
+                label=label,
+                catalog_id=catalog_id,
+                offering_id=offering_id,
+                kind_format=kind_format,
+                version=version,
+                cluster_id=cluster_id,
+                cluster_region=cluster_region,
+                cluster_namespaces=cluster_namespaces,
+                cluster_all_namespaces=cluster_all_namespaces,
+                schematics_workspace_id=schematics_workspace_id,
+                resource_group_id=resource_group_id,
+                install_plan=install_plan,
+                channel=channel,
+                metadata=metadata,
+            ))
+
             # Update path
             try:
                 result = sdk.put_offering_instance(
@@ -370,7 +423,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
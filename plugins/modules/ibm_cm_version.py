@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_cm_version.
 requirements:
     - "CatalogManagementV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     content:
         description:
@@ -89,6 +91,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ibm_platform_services import CatalogManagementV1
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -139,10 +142,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     content = module.params["content"]
     try:
@@ -164,13 +170,15 @@ def run_module():
     sdk = config.get_catalog_management_sdk()
 
     resource_exists = True
+    current = None
 
     # Check for existence
     if version_loc_id:
         try:
-            sdk.get_version(
+            response = sdk.get_version(
                 version_loc_id=version_loc_id,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -183,6 +191,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": version_loc_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_version(
                     version_loc_id=version_loc_id,
@@ -190,14 +201,27 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": version_loc_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": version_loc_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                catalog_identifier=catalog_identifier,
+                offering_id=offering_id,
+                tags=tags,
+                target_kinds=target_kinds,
+                content=content,
+                zipurl=zipurl,
+                target_version=target_version,
+                include_config=include_config,
+                is_vsi=is_vsi,
+                repo_type=repo_type,
+            ))
+
             # Create path
             try:
                 result = sdk.import_offering_version(
@@ -215,7 +239,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
 
 
 def main():
@@ -0,0 +1,142 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+module: ibm_global_catalog_snapshot
+short_description: Export Global Catalog services, plans and deployments to a local snapshot.
+author:
+    - "Kavya Handadi (@kavya498)"
+version_added: "1.0.0"
+description:
+    - This module crawls services, their plans and deployments in the Global Catalog and writes them to a compact index file.
+    - Modules resolving catalog entries answer from that file, without any Global Catalog query,
+      when their C(catalog_snapshot) option or the C(IC_CATALOG_SNAPSHOT) environment variable points to it.
+requirements:
+    - "GlobalCatalogV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+options:
+    services:
+        description:
+            - The names of the services to export.
+        type: list
+        elements: str
+        required: true
+    plans:
+        description:
+            - The names of the plans to export. All plans of the services are exported by default.
+        type: list
+        elements: str
+    path:
+        description:
+            - The path of the snapshot file to write.
+        type: path
+        required: true
+    workers:
+        description:
+            - Maximum number of concurrent Global Catalog queries.
+        type: int
+        default: 4
+'''
+
+EXAMPLES = r'''
+Examples coming soon.
+'''
+
+import json
+import os
+import tempfile
+
+from ..module_utils import config
+from ..module_utils import catalog
+from ansible.module_utils.basic import AnsibleModule
+from ibm_cloud_sdk_core import ApiException
+
+
+def run_module():
+    module_args = dict(
+        services=dict(
+            type='list',
+            elements='str',
+            required=True),
+        plans=dict(
+            type='list',
+            elements='str',
+            required=False),
+        path=dict(
+            type='path',
+            required=True),
+        workers=dict(
+            type='int',
+            default=catalog.DEFAULT_RESOLVE_WORKERS,
+            required=False),
+    )
+
+    module_args.update(config.sdk_argument_spec())
+
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=False
+    )
+    config.configure(module)
+
+    services = module.params["services"]
+    plans = module.params["plans"]
+    path = module.params["path"]
+    workers = module.params["workers"]
+
+    try:
+        index = catalog.build_snapshot(services, plans, workers)
+    except ApiException as ex:
+        module.fail_json(msg=ex.message)
+    except ValueError as ex:
+        module.fail_json(msg=str(ex))
+
+    content = json.dumps(index, sort_keys=True, separators=(',', ':'))
+    try:
+        with open(path, 'r') as f:
+            changed = f.read() != content
+    except (OSError, IOError):
+        changed = True
+
+    if changed:
+        fd, tmp_path = tempfile.mkstemp(dir=module.tmpdir)
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        module.atomic_move(tmp_path, path)
+
+    payload = dict(
+        path=path,
+        services=len(index['services']),
+        plans=sum(len(s['plans']) for s in index['services'].values()),
+        deployments=sum(len(p['deployments']) for s in index['services'].values() for p in s['plans'].values()),
+    )
+    module.exit_json(changed=changed, msg=payload)
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_iam_access_group.
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     name:
         description: |
@@ -54,6 +56,7 @@ options:
         description: |
             The current revision number of the group being updated.
             This can be found in the Create/Get access group response ETag header.
+            Defaults to the ETag of the existing access group.
         type: str
     transaction_id:
         description: |
@@ -82,6 +85,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ibm_platform_services import IamAccessGroupsV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -120,10 +124,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     name = module.params["name"]
     description = module.params["description"]
@@ -138,15 +145,19 @@ def run_module():
     sdk = config.get_iam_access_group_sdk()
 
     resource_exists = True
+    current = None
+    etag = None
 
     # Check for existence
     if access_group_id:
         try:
-            sdk.get_access_group(
+            response = sdk.get_access_group(
                 access_group_id=access_group_id,
                 transaction_id=transaction_id,
                 show_federated=show_federated,
             )
+            current = response.get_result()
+            etag = response.get_headers().get('ETag')
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -159,6 +170,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": access_group_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_access_group(
                     access_group_id=access_group_id,
@@ -168,14 +182,20 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": access_group_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": access_group_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                account_id=account_id,
+                name=name,
+                description=description,
+            ))
+
             # Create path
             try:
                 result = sdk.create_access_group(
@@ -187,13 +207,19 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                name=name,
+                description=description,
+            ))
+
             # Update path
             try:
                 result = sdk.update_access_group(
                     access_group_id=access_group_id,
-                    if_match=if_match,
+                    if_match=if_match or etag,
                     name=name,
                     description=description,
                     transaction_id=transaction_id,
@@ -201,7 +227,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
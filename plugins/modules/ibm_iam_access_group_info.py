@@ -28,6 +28,9 @@ description:
     - This module retrieves one or more ibm_iam_access_group(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
     access_group_id:
         description:
@@ -50,6 +53,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ibm_platform_services import IamAccessGroupsV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -68,10 +72,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     access_group_id = module.params["access_group_id"]
     transaction_id = module.params["transaction_id"]
@@ -86,7 +94,7 @@ def run_module():
                 transaction_id=transaction_id,
                 show_federated=show_federated
             )
-            module.exit_json(msg=response.get_result())
+            projection.exit_json(module, response.get_result())
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_iam_access_group_members.
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     members:
         description:
@@ -54,6 +56,7 @@ options:
         type: str
     offset:
         description:
+            - "[deprecated] Ignored, the members of the group are always read from the first one to decide membership."
             - The offset of the first result item to be returned.
         type: int
     transaction_id:
@@ -65,6 +68,7 @@ options:
     limit:
         description:
             - Return up to this limit of results where limit is between 0 and 100.
+            - The number of members read per page, 100 by default. All the pages are read.
         type: int
     sort:
         description:
@@ -90,6 +94,8 @@ EXAMPLES = r'''
 Examples coming soon.
 '''
 from ..module_utils import config
+from ..module_utils import diff
+from ..module_utils import pagination
 from ibm_platform_services import IamAccessGroupsV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -117,6 +123,8 @@ def run_module():
             required=False),
         offset=dict(
             type='int',
+            removed_in_version='2.0.0',
+            removed_from_collection='ibm.cloud',
             required=False),
         transaction_id=dict(
             type='str',
@@ -140,15 +148,17 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     members = module.params["members"]
     access_group_id = module.params["access_group_id"]
     iam_id = module.params["iam_id"]
-    offset = module.params["offset"]
     transaction_id = module.params["transaction_id"]
     limit = module.params["limit"]
     sort = module.params["sort"]
@@ -159,19 +169,19 @@ def run_module():
     sdk = config.get_iam_access_group_sdk()
 
     resource_exists = True
+    current = None
 
-    # Check for existence
+    # Check for existence, the members are read over all pages
     if iam_id:
         try:
-            sdk.list_access_group_members(
+            current = dict(members=list(pagination.OffsetPager(
+                sdk.list_access_group_members, 'members', page_size=limit or pagination.MAX_PAGE_SIZE, workers=1,
                 access_group_id=access_group_id,
                 transaction_id=transaction_id,
-                limit=limit,
-                offset=offset,
                 type=type,
                 verbose=verbose,
                 sort=sort,
-            )
+            ).items()))
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -183,7 +193,12 @@ def run_module():
 
     # Delete path
     if state == "absent":
-        if resource_exists:
+        if resource_exists and any(m.get('iam_id') == iam_id for m in current['members']):
+            payload = {"id": iam_id, "status": "deleted"}
+            remaining = [m for m in current['members'] if m.get('iam_id') != iam_id]
+            after = dict(current, members=remaining)
+            diff.exit_if_check_mode(module, current, after, payload)
+
             try:
                 sdk.remove_member_from_access_group(
                     access_group_id=access_group_id,
@@ -193,14 +208,19 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": iam_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, after)
         else:
             payload = {"id": iam_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                access_group_id=access_group_id,
+                members=members,
+            ))
+
             # Create path
             try:
                 result = sdk.add_members_to_access_group(
@@ -211,8 +231,19 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op path, all the members are in the group already
+            present = current['members']
+            member_ids = set(m.get('iam_id') for m in present)
+            added = [m for m in members or [] if m.get('iam_id') not in member_ids]
+            if members and not added:
+                module.exit_json(changed=False, msg=current)
+
+            # Check mode path
+            after = dict(current, members=present + added)
+            diff.exit_if_check_mode(module, current, after)
+
             # Update path
             try:
                 result = sdk.add_members_to_access_group(
@@ -223,7 +254,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, after)
 
 
 def main():
@@ -28,6 +28,11 @@ description:
     - This module retrieves one or more ibm_iam_access_group_members(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.pagination
+    - ibm.cloud.pagination.concurrent
+    - ibm.cloud.projection
 options:
     access_group_id:
         description:
@@ -65,6 +70,8 @@ EXAMPLES = r'''
 Examples coming soon.
 '''
 from ..module_utils import config
+from ..module_utils import pagination
+from ..module_utils import projection
 from ibm_platform_services import IamAccessGroupsV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -95,10 +102,16 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(pagination.pagination_argument_spec(concurrent=True))
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
+        mutually_exclusive=pagination.MUTUALLY_EXCLUSIVE,
         supports_check_mode=False
     )
+    config.configure(module)
 
     access_group_id = module.params["access_group_id"]
     offset = module.params["offset"]
@@ -107,21 +120,26 @@ def run_module():
     sort = module.params["sort"]
     type = module.params["type"]
     verbose = module.params["verbose"]
+    use_pager = pagination.use_pager(module)
+    workers = module.params["workers"]
 
     sdk = config.get_iam_access_group_sdk()
 
     # list
     try:
-        response = sdk.list_access_group_members(
+        list_args = dict(
             access_group_id=access_group_id,
             transaction_id=transaction_id,
-            limit=limit,
-            offset=offset,
             type=type,
             verbose=verbose,
             sort=sort
         )
-        module.exit_json(msg=response.get_result())
+        if use_pager:
+            pager = pagination.OffsetPager(
+                sdk.list_access_group_members, 'members', offset=offset, page_size=limit, workers=workers, **list_args)
+            pagination.exit_json(module, pager)
+        response = sdk.list_access_group_members(limit=limit, offset=offset, **list_args)
+        projection.exit_json(module, response.get_result(), 'members')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
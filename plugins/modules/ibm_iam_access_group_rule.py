@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_iam_access_group_rule.
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     name:
         description:
@@ -72,6 +74,7 @@ options:
         description: |
             The current revision number of the rule being updated.
             This can be found in the Get Rule response ETag header.
+            Defaults to the ETag of the existing rule.
         type: str
     transaction_id:
         description: |
@@ -92,6 +95,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ibm_platform_services import IamAccessGroupsV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -142,10 +146,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     name = module.params["name"]
     expiration = module.params["expiration"]
@@ -160,15 +167,19 @@ def run_module():
     sdk = config.get_iam_access_group_sdk()
 
     resource_exists = True
+    current = None
+    etag = None
 
     # Check for existence
     if rule_id:
         try:
-            sdk.get_access_group_rule(
+            response = sdk.get_access_group_rule(
                 access_group_id=access_group_id,
                 rule_id=rule_id,
                 transaction_id=transaction_id,
             )
+            current = response.get_result()
+            etag = response.get_headers().get('ETag')
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -181,6 +192,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": rule_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.remove_access_group_rule(
                     access_group_id=access_group_id,
@@ -190,14 +204,22 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": rule_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": rule_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                access_group_id=access_group_id,
+                expiration=expiration,
+                realm_name=realm_name,
+                conditions=conditions,
+                name=name,
+            ))
+
             # Create path
             try:
                 result = sdk.add_access_group_rule(
@@ -211,24 +233,38 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
-            # Update path
-            try:
-                result = sdk.replace_access_group_rule(
+            # No-op and check mode paths
+            desired = dict(
+                expiration=expiration,
+                realm_name=realm_name,
+                conditions=conditions,
+                name=name,
+            )
+            diff.check_update(module, current, desired)
+
+            # Update path, conditional on the ETag of the rule read
+            def read():
+                return sdk.get_access_group_rule(
+                    access_group_id=access_group_id,
+                    rule_id=rule_id,
+                    transaction_id=transaction_id,
+                )
+
+            def write(current, etag):
+                return sdk.replace_access_group_rule(
                     access_group_id=access_group_id,
                     rule_id=rule_id,
-                    if_match=if_match,
+                    if_match=if_match or etag,
                     expiration=expiration,
                     realm_name=realm_name,
                     conditions=conditions,
                     name=name,
                     transaction_id=transaction_id,
-                ).get_result()
-            except ApiException as ex:
-                module.fail_json(msg=ex.message)
-            else:
-                module.exit_json(changed=True, msg=result)
+                )
+
+            diff.conditional_update(module, current, etag, desired, read, write, retry=not if_match)
 
 
 def main():
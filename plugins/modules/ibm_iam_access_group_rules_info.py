@@ -28,6 +28,9 @@ description:
     - This module retrieves one or more ibm_iam_access_group_rules(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
     access_group_id:
         description:
@@ -46,6 +49,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ibm_platform_services import IamAccessGroupsV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -61,10 +65,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     access_group_id = module.params["access_group_id"]
     transaction_id = module.params["transaction_id"]
@@ -77,7 +85,7 @@ def run_module():
             access_group_id=access_group_id,
             transaction_id=transaction_id
         )
-        module.exit_json(msg=response.get_result())
+        projection.exit_json(module, response.get_result(), 'rules')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
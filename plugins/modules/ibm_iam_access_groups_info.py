@@ -28,6 +28,11 @@ description:
     - This module retrieves one or more ibm_iam_access_groups(s).
 requirements:
     - "IamAccessGroupsV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.pagination
+    - ibm.cloud.pagination.concurrent
+    - ibm.cloud.projection
 options:
     account_id:
         description: |
@@ -72,6 +77,8 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import pagination
+from ..module_utils import projection
 from ibm_platform_services import IamAccessGroupsV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -105,10 +112,16 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(pagination.pagination_argument_spec(concurrent=True))
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
+        mutually_exclusive=pagination.MUTUALLY_EXCLUSIVE,
         supports_check_mode=False
     )
+    config.configure(module)
 
     account_id = module.params["account_id"]
     iam_id = module.params["iam_id"]
@@ -118,22 +131,31 @@ def run_module():
     show_federated = module.params["show_federated"]
     sort = module.params["sort"]
     hide_public_access = module.params["hide_public_access"]
+    use_pager = pagination.use_pager(module)
+    workers = module.params["workers"]
 
     sdk = config.get_iam_access_group_sdk()
 
     # list
     try:
-        response = sdk.list_access_groups(
+        list_args = dict(
             account_id=account_id,
             transaction_id=transaction_id,
             iam_id=iam_id,
-            limit=limit,
-            offset=offset,
             sort=sort,
             show_federated=show_federated,
             hide_public_access=hide_public_access
         )
-        module.exit_json(msg=response.get_result())
+        if use_pager:
+            pager = pagination.OffsetPager(
+                sdk.list_access_groups, 'groups', offset=offset, page_size=limit, workers=workers, **list_args)
+            pagination.exit_json(module, pager)
+        response = sdk.list_access_groups(
+            limit=limit,
+            offset=offset,
+            **list_args
+        )
+        projection.exit_json(module, response.get_result(), 'groups')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
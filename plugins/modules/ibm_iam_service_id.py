@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_iam_service_id.
 requirements:
     - "IamIdentityV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     account_id:
         description:
@@ -85,6 +87,7 @@ options:
             Version of the service ID to be updated.
             Specify the version that you retrieved as entity_tag (ETag header) when reading the service ID.
             This value helps identifying parallel usage of this API. Pass * to indicate to update any version available. This might result in stale updates.
+            Defaults to the ETag of the existing service ID.
         type: str
     entity_lock:
         description:
@@ -112,6 +115,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ibm_platform_services import IamIdentityV1
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -172,10 +176,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     account_id = module.params["account_id"]
     apikey = module.params["apikey"]
@@ -191,15 +198,19 @@ def run_module():
 
     sdk = config.get_iam_identity_sdk()
     resource_exists = True
+    current = None
+    etag = None
 
     # Check for existence
     if id:
         try:
-            sdk.get_service_id(
+            response = sdk.get_service_id(
                 id=id,
                 # include_history=include_history,
                 # include_activity=include_activity,
             )
+            current = response.get_result()
+            etag = response.get_headers().get('ETag')
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -212,6 +223,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_service_id(
                     id=id,
@@ -219,14 +233,23 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                account_id=account_id,
+                name=name,
+                description=description,
+                unique_instance_crns=unique_instance_crns,
+                apikey=apikey,
+                entity_lock=entity_lock,
+            ))
+
             # Create path
             try:
                 result = sdk.create_service_id(
@@ -240,13 +263,20 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                name=name,
+                description=description,
+                unique_instance_crns=unique_instance_crns,
+            ))
+
             # Update path
             try:
                 result = sdk.update_service_id(
                     id=id,
-                    if_match=if_match,
+                    if_match=if_match or etag,
                     name=name,
                     description=description,
                     unique_instance_crns=unique_instance_crns,
@@ -254,7 +284,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
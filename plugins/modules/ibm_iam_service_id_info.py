@@ -28,6 +28,9 @@ description:
     - This module retrieves one or more ibm_iam_service_id(s).
 requirements:
     - "IamIdentityV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
     include_history:
         description:
@@ -50,6 +53,7 @@ Examples coming soon.
 
 
 from ..module_utils import config
+from ..module_utils import projection
 from ibm_platform_services import IamIdentityV1
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -68,10 +72,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     include_history = module.params["include_history"]
     id = module.params["id"]
@@ -87,7 +95,7 @@ def run_module():
                 include_history=include_history,
                 include_activity=include_activity
             )
-            module.exit_json(msg=response.get_result())
+            projection.exit_json(module, response.get_result())
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
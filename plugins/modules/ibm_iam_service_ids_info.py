@@ -28,6 +28,10 @@ description:
     - This module retrieves one or more ibm_iam_service_ids(s).
 requirements:
     - "IamIdentityV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.pagination
+    - ibm.cloud.projection
 options:
     include_history:
         description:
@@ -74,6 +78,8 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import pagination
+from ..module_utils import projection
 from ibm_platform_services import IamIdentityV1
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -110,10 +116,16 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(pagination.pagination_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
+        mutually_exclusive=pagination.MUTUALLY_EXCLUSIVE,
         supports_check_mode=False
     )
+    config.configure(module)
 
     include_history = module.params["include_history"]
     account_id = module.params["account_id"]
@@ -124,6 +136,7 @@ def run_module():
     pagetoken = module.params["pagetoken"]
     include_activity = module.params["include_activity"]
     order = module.params["order"]
+    use_pager = pagination.use_pager(module)
 
     sdk = config.get_iam_identity_sdk()
 
@@ -135,22 +148,25 @@ def run_module():
                 include_history=include_history,
                 include_activity=include_activity
             )
-            module.exit_json(msg=response.get_result())
+            projection.exit_json(module, response.get_result())
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
     # list
     try:
-        response = sdk.list_service_ids(
+        list_args = dict(
             account_id=account_id,
             name=name,
-            pagesize=pagesize,
-            pagetoken=pagetoken,
             sort=sort,
             order=order,
             include_history=include_history
         )
-        module.exit_json(msg=response.get_result())
+        if use_pager:
+            pager = pagination.PageTokenPager(
+                sdk.list_service_ids, 'serviceids', token=pagetoken, page_size=pagesize, **list_args)
+            pagination.exit_json(module, pager)
+        response = sdk.list_service_ids(pagesize=pagesize, pagetoken=pagetoken, **list_args)
+        projection.exit_json(module, response.get_result(), 'serviceids')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
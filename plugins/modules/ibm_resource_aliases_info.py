@@ -28,6 +28,11 @@ description:
     - This module retrieves one or more ibm_resource_aliases(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.pagination
+    - ibm.cloud.projection
+    - ibm.cloud.resource_filters
 options:
     limit:
         description:
@@ -50,6 +55,9 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import pagination
+from ..module_utils import predicates
+from ..module_utils import projection
 from ibm_platform_services import ResourceControllerV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -68,27 +76,43 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(pagination.pagination_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+    module_args.update(predicates.filters_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
+        mutually_exclusive=pagination.MUTUALLY_EXCLUSIVE,
         supports_check_mode=False
     )
+    config.configure(module)
 
     limit = module.params["limit"]
     start = module.params["start"]
     id = module.params["id"]
+    use_pager = pagination.use_pager(module)
 
     sdk = config.get_resource_contollerV2_sdk()
 
     # list
     try:
+        predicate = predicates.apply(module.params["filters"], {})
+        if use_pager:
+            pager = pagination.StartTokenPager(
+                sdk.list_resource_aliases_for_instance, 'resources', token=start, page_size=limit, predicate=predicate, id=id)
+            pagination.exit_json(module, pager)
         response = sdk.list_resource_aliases_for_instance(
             id=id,
             limit=limit,
             start=start
         )
-        module.exit_json(msg=response.get_result())
+        result = predicates.filter_page(response.get_result(), 'resources', predicate)
+        projection.exit_json(module, result, 'resources')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
+    except ValueError as ex:
+        module.fail_json(msg=str(ex))
 
 
 def main():
@@ -29,6 +29,8 @@ description:
     - By default the module will look for an existing ibm_resource_binding.
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
     role:
         description:
@@ -74,6 +76,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ibm_platform_services import ResourceControllerV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -112,10 +115,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     role = module.params["role"]
     name = module.params["name"]
@@ -128,13 +134,15 @@ def run_module():
     sdk = config.get_resource_contollerV2_sdk()
 
     resource_exists = True
+    current = None
 
     # Check for existence
     if id:
         try:
-            sdk.get_resource_binding(
+            response = sdk.get_resource_binding(
                 id=id,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -147,6 +155,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_resource_binding(
                     id=id,
@@ -154,14 +165,22 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                source=source,
+                target=target,
+                name=name,
+                parameters=parameters,
+                role=role,
+            ))
+
             # Create path
             try:
                 result = sdk.create_resource_binding(
@@ -174,8 +193,13 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                name=name,
+            ))
+
             # Update path
             try:
                 result = sdk.update_resource_binding(
@@ -185,7 +209,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
@@ -28,6 +28,9 @@ description:
     - This module retrieves one or more ibm_resource_group(s).
 requirements:
     - "ResourceManagerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
     id:
         description:
@@ -40,6 +43,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ibm_platform_services import ResourceManagerV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -52,10 +56,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     id = module.params["id"]
 
@@ -66,7 +74,7 @@ def run_module():
         response = sdk.get_resource_group(
             id=id
         )
-        module.exit_json(msg=response.get_result())
+        projection.exit_json(module, response.get_result())
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
@@ -32,6 +32,9 @@ description:
     - By default the module will look for an existing ibm_resource_instance.
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.catalog_cache
 options:
     resource_group:
         description:
@@ -40,6 +43,7 @@ options:
     plan:
         description:
             - The unique ID of the plan associated with the offering. This value is provided by and stored in the global catalog.
+            - With I(service) set, the name of the plan, which is looked up in the global catalog on create and update alike.
         type: str
     allow_cleanup:
         description:
@@ -71,6 +75,17 @@ options:
         description:
             - The ID of the instance.
         type: str
+    match_by:
+        description:
+            - How to find the existing instance when I(id) is not set.
+            - With C(id), an instance without I(id) does not exist yet and is created.
+            - With C(name), the instance is looked up by I(name) among the instances of
+              I(resource_group) and I(service), those that are set, with a filtered list.
+              It is then updated, or left as it is, like an instance found by I(id).
+              The module fails when more than one instance matches.
+        type: str
+        default: id
+        choices: [id, name]
     recursive:
         description:
             - Will delete resource bindings, keys and aliases associated with the instance.
@@ -91,6 +106,7 @@ from ..module_utils import config
 # Todo: change this to external python package format
 from ibm_platform_services import ResourceControllerV2
 from ..module_utils import catalog
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 from ibm_cloud_sdk_core import ApiException
 
@@ -130,6 +146,11 @@ def run_module():
         id=dict(
             type='str',
             required=False),
+        match_by=dict(
+            type='str',
+            default='id',
+            choices=['id', 'name'],
+            required=False),
         recursive=dict(
             type='bool',
             required=False),
@@ -140,10 +161,16 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(catalog.catalog_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        required_if=[('match_by', 'name', ['name'])],
+        supports_check_mode=True
     )
+    config.configure(module)
+    catalog.configure(module)
 
     resource_group = module.params["resource_group"]
     plan = module.params["plan"]  # renamed resource_plan_id to plan
@@ -154,24 +181,51 @@ def run_module():
     tags = module.params["tags"]
     entity_lock = module.params["entity_lock"]
     id = module.params["id"]
+    match_by = module.params["match_by"]
     recursive = module.params["recursive"]
     state = module.params["state"]
     service = module.params["service"]  # handcoded argument
 
     sdk = config.get_resource_contollerV2_sdk()
     resource_exists = True
+    current = None
 
     # Check for existence
     if id:
         try:
-            sdk.get_resource_instance(
+            response = sdk.get_resource_instance(
                 id=id,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
             else:
                 module.fail_json(msg=ex.message)
+    elif match_by == 'name':
+        # Look the instance up by name, the list returns whole instances
+        serviceID = None
+        if service is not None:
+            try:
+                serviceID = catalog.get_serviceID(service)
+            except (ApiException, ValueError) as ex:
+                module.fail_json(msg=str(ex))
+        try:
+            matches = sdk.list_resource_instances(
+                name=name,
+                resource_group_id=resource_group,
+                resource_id=serviceID,
+                limit=2,
+            ).get_result().get('resources') or []
+        except ApiException as ex:
+            module.fail_json(msg=ex.message)
+        if len(matches) > 1:
+            module.fail_json(msg="more than one instance is named %s, set id to pick one" % name)
+        if matches:
+            current = matches[0]
+            id = current['id']
+        else:
+            resource_exists = False
     else:
         # assume resource does not exist
         resource_exists = False
@@ -179,6 +233,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_resource_instance(
                     id=id,
@@ -187,8 +244,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
@@ -199,6 +255,19 @@ def run_module():
             if service is not None:
                 serviceID, catalogCRN, servicePlanID = catalog.get_serviceID_targetCRN_planID(
                     service, plan, location)
+
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                name=name,
+                target=catalogCRN,
+                resource_group=resource_group,
+                resource_plan_id=servicePlanID,
+                tags=tags,
+                allow_cleanup=allow_cleanup,
+                parameters=parameters,
+                entity_lock=entity_lock,
+            ))
+
             # Create path
             try:
                 result = sdk.create_resource_instance(
@@ -214,21 +283,38 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # With a service, the plan is looked up by name as on create
+            if service is not None and plan is not None:
+                try:
+                    serviceID, servicePlanID = catalog.get_planID(service, plan)
+                except (ApiException, ValueError) as ex:
+                    module.fail_json(msg=str(ex))
+            else:
+                servicePlanID = plan
+
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                name=name,
+                parameters=parameters,
+                resource_plan_id=servicePlanID,
+                allow_cleanup=allow_cleanup,
+            ))
+
             # Update path
             try:
                 result = sdk.update_resource_instance(
                     id=id,
                     name=name,
                     parameters=parameters,
-                    resource_plan_id=plan,
+                    resource_plan_id=servicePlanID,
                     allow_cleanup=allow_cleanup,
                 ).get_result()
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
@@ -31,7 +31,27 @@ description:
     - This module retrieves one or more ibm_resource_instances(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.catalog_cache
+    - ibm.cloud.pagination
+    - ibm.cloud.projection
+    - ibm.cloud.resource_filters
 options:
+    since_last_run:
+        description:
+            - Keep a snapshot of the listed instances in I(state_file) up to date, instead of returning them.
+            - The first run lists all the instances. The next ones only list the instances updated or removed
+              since the previous run, with I(updated_from), and merge them into the snapshot.
+            - The snapshot is listed in full again when the filters or I(fields) change.
+            - The result holds the C(path) of the state file, the C(count) of instances in the snapshot,
+              the number of instances C(updated) and C(removed), whether it was a C(full_sync) and its C(watermark).
+        type: bool
+        default: false
+    state_file:
+        description:
+            - With I(since_last_run), the JSON file holding the snapshot and the time of the last run.
+        type: path
     resource_group_id:
         description:
             - The ID of the resource group.
@@ -92,6 +112,10 @@ from ..module_utils import config
 # Todo: change this to external python package format
 from ibm_platform_services import ResourceControllerV2
 from ..module_utils import catalog
+from ..module_utils import pagination
+from ..module_utils import predicates
+from ..module_utils import projection
+from ..module_utils import sync
 from ansible.module_utils.basic import AnsibleModule
 from ibm_cloud_sdk_core import ApiException
 
@@ -136,10 +160,25 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(catalog.catalog_argument_spec())
+    module_args.update(pagination.pagination_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+    module_args.update(predicates.filters_argument_spec())
+    module_args.update(sync.sync_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
+        mutually_exclusive=pagination.MUTUALLY_EXCLUSIVE + [
+            ('since_last_run', 'updated_from'),
+            ('since_last_run', 'updated_to'),
+            ('since_last_run', 'start'),
+        ],
+        required_if=[('since_last_run', True, ['state_file'])],
         supports_check_mode=False
     )
+    config.configure(module)
+    catalog.configure(module)
 
     resource_group_id = module.params["resource_group_id"]
     updated_from = module.params["updated_from"]
@@ -153,6 +192,8 @@ def run_module():
     state_ = module.params["state_"]
     type = module.params["type"]
     updated_to = module.params["updated_to"]
+    since_last_run = module.params["since_last_run"]
+    use_pager = pagination.use_pager(module)
 
     # sdk = ResourceControllerV2.new_instance()
 
@@ -166,7 +207,7 @@ def run_module():
             servicePlanID = ""
             if plan != "" and plan is not None and plan != "None":
                 serviceID, servicePlanID = catalog.get_planID(service, plan)
-        response = sdk.list_resource_instances(
+        list_args = dict(
             guid=guid,
             name=name,
             resource_group_id=resource_group_id,
@@ -174,15 +215,28 @@ def run_module():
             resource_plan_id=servicePlanID,
             type=type,
             sub_type=sub_type,
-            limit=limit,
-            start=start,
             state=state_,
             updated_from=updated_from,
             updated_to=updated_to
         )
-        module.exit_json(msg=response.get_result())
+        predicate = predicates.apply(module.params["filters"], list_args)
+        if since_last_run:
+            def new_pager(**kwargs):
+                args = dict(list_args, **kwargs)
+                return pagination.StartTokenPager(
+                    sdk.list_resource_instances, 'resources', page_size=limit, **args)
+            sync.exit_json(module, dict(list_args, filters=module.params["filters"]), new_pager, predicate)
+        if use_pager:
+            pager = pagination.StartTokenPager(
+                sdk.list_resource_instances, 'resources', token=start, page_size=limit, predicate=predicate, **list_args)
+            pagination.exit_json(module, pager)
+        response = sdk.list_resource_instances(limit=limit, start=start, **list_args)
+        result = predicates.filter_page(response.get_result(), 'resources', predicate)
+        projection.exit_json(module, result, 'resources')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
+    except ValueError as ex:
+        module.fail_json(msg=str(ex))
 
 
 def main():
@@ -31,6 +31,9 @@ description:
     - This module retrieves one or more ibm_resource_key(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
     id:
         description:
@@ -42,6 +45,7 @@ EXAMPLES = r'''
 Examples coming soon.
 '''
 from ..module_utils import config
+from ..module_utils import projection
 # Todo: change this to external python package format
 from ibm_platform_services import ResourceControllerV2
 from ansible.module_utils.basic import AnsibleModule
@@ -55,10 +59,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     id = module.params["id"]
 
@@ -71,7 +79,7 @@ def run_module():
             response = sdk.get_resource_key(
                 id=id
             )
-            module.exit_json(msg=response.get_result())
+            projection.exit_json(module, response.get_result())
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -30,6 +30,11 @@ description:
     - This module retrieves one or more ibm_resource_keys(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.pagination
+    - ibm.cloud.projection
+    - ibm.cloud.resource_filters
 options:
     resource_group_id:
         description:
@@ -73,6 +78,9 @@ Examples coming soon.
 
 
 from ..module_utils import config
+from ..module_utils import pagination
+from ..module_utils import predicates
+from ..module_utils import projection
 # Todo: change this to external python package format
 from ibm_platform_services import ResourceControllerV2
 from ansible.module_utils.basic import AnsibleModule
@@ -107,10 +115,17 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(pagination.pagination_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+    module_args.update(predicates.filters_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
+        mutually_exclusive=pagination.MUTUALLY_EXCLUSIVE,
         supports_check_mode=False
     )
+    config.configure(module)
 
     resource_group_id = module.params["resource_group_id"]
     updated_from = module.params["updated_from"]
@@ -120,6 +135,7 @@ def run_module():
     guid = module.params["guid"]
     resource_id = module.params["resource_id"]
     updated_to = module.params["updated_to"]
+    use_pager = pagination.use_pager(module)
 
     # sdk = ResourceControllerV2.new_instance()
 
@@ -127,19 +143,26 @@ def run_module():
 
     # list
     try:
-        response = sdk.list_resource_keys(
+        list_args = dict(
             guid=guid,
             name=name,
             resource_group_id=resource_group_id,
             resource_id=resource_id,
-            limit=limit,
-            start=start,
             updated_from=updated_from,
             updated_to=updated_to
         )
-        module.exit_json(msg=response.get_result())
+        predicate = predicates.apply(module.params["filters"], list_args)
+        if use_pager:
+            pager = pagination.StartTokenPager(
+                sdk.list_resource_keys, 'resources', token=start, page_size=limit, predicate=predicate, **list_args)
+            pagination.exit_json(module, pager)
+        response = sdk.list_resource_keys(limit=limit, start=start, **list_args)
+        result = predicates.filter_page(response.get_result(), 'resources', predicate)
+        projection.exit_json(module, result, 'resources')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
+    except ValueError as ex:
+        module.fail_json(msg=str(ex))
 
 
 def main():
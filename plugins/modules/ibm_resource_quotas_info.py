@@ -28,6 +28,9 @@ description:
     - This module retrieves one or more ibm_resource_quotas(s).
 requirements:
     - "ResourceManagerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 '''
 
 EXAMPLES = r'''
@@ -35,6 +38,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ibm_platform_services import ResourceManagerV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -44,10 +48,14 @@ def run_module():
     module_args = dict(
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     sdk = config.get_resource_manager_sdk()
 
@@ -55,7 +63,7 @@ def run_module():
     try:
         response = sdk.list_quota_definitions(
         )
-        module.exit_json(msg=response.get_result())
+        projection.exit_json(module, response.get_result(), 'resources')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
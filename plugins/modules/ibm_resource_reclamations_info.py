@@ -28,6 +28,9 @@ description:
     - This module retrieves one or more ibm_resource_reclamations(s).
 requirements:
     - "ResourceControllerV2"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
     account_id:
         description:
@@ -44,6 +47,7 @@ Examples coming soon.
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ibm_platform_services import ResourceControllerV2
 from ibm_cloud_sdk_core import ApiException
 from ansible.module_utils.basic import AnsibleModule
@@ -59,10 +63,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     account_id = module.params["account_id"]
     resource_instance_id = module.params["resource_instance_id"]
@@ -75,7 +83,7 @@ def run_module():
             account_id=account_id,
             resource_instance_id=resource_instance_id
         )
-        module.exit_json(msg=response.get_result())
+        projection.exit_json(module, response.get_result(), 'resources')
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
@@ -28,6 +28,8 @@ description:
   - This module creates, updates, or deletes a C(schematics_action) resource for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
   outputs:
     description:
@@ -900,6 +902,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -1479,10 +1482,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     outputs = module.params["outputs"]
     settings = module.params["settings"]
@@ -1516,14 +1522,16 @@ def run_module():
     sdk = config.get_schematicsv1_sdk()
 
     resource_exists = True
+    current = None
 
     # Check for existence
     if action_id:
         try:
-            sdk.get_action(
+            response = sdk.get_action(
                 action_id=action_id,
                 profile=profile,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -1536,6 +1544,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": action_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_action(
                     action_id=action_id,
@@ -1545,14 +1556,39 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": action_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": action_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                name=name,
+                description=description,
+                location=location,
+                resource_group=resource_group,
+                bastion_connection_type=bastion_connection_type,
+                inventory_connection_type=inventory_connection_type,
+                tags=tags,
+                user_state=user_state,
+                source_readme_url=source_readme_url,
+                source=source,
+                source_type=source_type,
+                command_parameter=command_parameter,
+                inventory=inventory,
+                credentials=credentials,
+                bastion=bastion,
+                bastion_credential=bastion_credential,
+                targets_ini=targets_ini,
+                inputs=inputs,
+                outputs=outputs,
+                settings=settings,
+                state=state_,
+                sys_lock=sys_lock,
+            ))
+
             # Create path
             try:
                 result = sdk.create_action(
@@ -1583,8 +1619,34 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                name=name,
+                description=description,
+                location=location,
+                resource_group=resource_group,
+                bastion_connection_type=bastion_connection_type,
+                inventory_connection_type=inventory_connection_type,
+                tags=tags,
+                user_state=user_state,
+                source_readme_url=source_readme_url,
+                source=source,
+                source_type=source_type,
+                command_parameter=command_parameter,
+                inventory=inventory,
+                credentials=credentials,
+                bastion=bastion,
+                bastion_credential=bastion_credential,
+                targets_ini=targets_ini,
+                inputs=inputs,
+                outputs=outputs,
+                settings=settings,
+                state=state_,
+                sys_lock=sys_lock,
+            ))
+
             # Update path
             try:
                 result = sdk.update_action(
@@ -1616,7 +1678,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
@@ -28,6 +28,9 @@ description:
   - This module retrieves one or more C(schematics_action) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
   action_id:
     description:
@@ -72,6 +75,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 
 try:
@@ -92,10 +96,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     action_id = module.params["action_id"]
     profile = module.params["profile"]
@@ -109,7 +117,7 @@ def run_module():
                 action_id=action_id,
                 profile=profile
             )
-            module.exit_json(msg=response.get_result())
+            projection.exit_json(module, response.get_result())
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -28,6 +28,8 @@ description:
   - This module creates, updates, or deletes a C(schematics_inventory) resource for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
   inventories_ini:
     description:
@@ -126,6 +128,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -176,10 +179,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     inventories_ini = module.params["inventories_ini"]
     resource_group = module.params["resource_group"]
@@ -196,14 +202,18 @@ def run_module():
     sdk = config.get_schematicsv1_sdk()
 
     resource_exists = True
+    current = None
+    etag = None
 
     # Check for existence
     if inventory_id:
         try:
-            sdk.get_inventory(
+            response = sdk.get_inventory(
                 inventory_id=inventory_id,
                 profile=profile,
             )
+            current = response.get_result()
+            etag = response.get_headers().get('ETag')
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -216,6 +226,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": inventory_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_inventory(
                     inventory_id=inventory_id,
@@ -225,14 +238,23 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": inventory_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": inventory_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                name=name,
+                description=description,
+                location=location,
+                resource_group=resource_group,
+                inventories_ini=inventories_ini,
+                resource_queries=resource_queries,
+            ))
+
             # Create path
             try:
                 result = sdk.create_inventory(
@@ -246,11 +268,28 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
-            # Update path
-            try:
-                result = sdk.replace_inventory(
+            # No-op and check mode paths
+            desired = dict(
+                name=name,
+                description=description,
+                location=location,
+                resource_group=resource_group,
+                inventories_ini=inventories_ini,
+                resource_queries=resource_queries,
+            )
+            diff.check_update(module, current, desired)
+
+            # Update path, conditional on the ETag of the inventory read
+            def read():
+                return sdk.get_inventory(
+                    inventory_id=inventory_id,
+                    profile=profile,
+                )
+
+            def write(current, etag):
+                return sdk.replace_inventory(
                     inventory_id=inventory_id,
                     name=name,
                     description=description,
@@ -258,11 +297,10 @@ def run_module():
                     resource_group=resource_group,
                     inventories_ini=inventories_ini,
                     resource_queries=resource_queries,
-                ).get_result()
-            except ApiException as ex:
-                module.fail_json(msg=ex.message)
-            else:
-                module.exit_json(changed=True, msg=result)
+                    headers={'If-Match': etag} if etag else {},
+                )
+
+            diff.conditional_update(module, current, etag, desired, read, write)
 
 
 def main():
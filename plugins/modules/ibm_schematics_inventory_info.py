@@ -28,6 +28,9 @@ description:
   - This module retrieves one or more C(schematics_inventory) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
   inventory_id:
     description:
@@ -69,6 +72,7 @@ msg:
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 
 try:
@@ -89,10 +93,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     inventory_id = module.params["inventory_id"]
     profile = module.params["profile"]
@@ -106,7 +114,7 @@ def run_module():
                 inventory_id=inventory_id,
                 profile=profile
             )
-            module.exit_json(msg=response.get_result())
+            projection.exit_json(module, response.get_result())
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
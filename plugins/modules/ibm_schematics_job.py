@@ -28,6 +28,8 @@ description:
   - This module creates, updates, or deletes a C(schematics_job) resource for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
   settings:
     description:
@@ -2845,6 +2847,7 @@ msg:
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -4766,10 +4769,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     settings = module.params["settings"]
     data = module.params["data"]
@@ -4794,14 +4800,16 @@ def run_module():
     sdk = config.get_schematicsv1_sdk()
 
     resource_exists = True
+    current = None
 
     # Check for existence
     if job_id:
         try:
-            sdk.get_job(
+            response = sdk.get_job(
                 job_id=job_id,
                 profile=profile,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -4814,6 +4822,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": job_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_job(
                     job_id=job_id,
@@ -4824,14 +4835,30 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": job_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": job_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                command_object=command_object,
+                command_object_id=command_object_id,
+                command_name=command_name,
+                command_parameter=command_parameter,
+                command_options=command_options,
+                inputs=inputs,
+                settings=settings,
+                tags=tags,
+                location=location,
+                status=status,
+                data=data,
+                bastion=bastion,
+                log_summary=log_summary,
+            ))
+
             # Create path
             try:
                 result = sdk.create_job(
@@ -4853,8 +4880,24 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                command_object=command_object,
+                command_object_id=command_object_id,
+                command_name=command_name,
+                command_parameter=command_parameter,
+                command_options=command_options,
+                inputs=inputs,
+                settings=settings,
+                tags=tags,
+                location=location,
+                status=status,
+                data=data,
+                bastion=bastion,
+            ))
+
             # Update path
             try:
                 result = sdk.update_job(
@@ -4877,7 +4920,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
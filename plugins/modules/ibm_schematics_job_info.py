@@ -28,6 +28,9 @@ description:
   - This module retrieves one or more C(schematics_job) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
   job_id:
     description:
@@ -70,6 +73,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -89,10 +93,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     job_id = module.params["job_id"]
     profile = module.params["profile"]
@@ -106,7 +114,7 @@ def run_module():
                 job_id=job_id,
                 profile=profile
             )
-            module.exit_json(msg=response.get_result())
+            projection.exit_json(module, response.get_result())
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
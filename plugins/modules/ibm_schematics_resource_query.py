@@ -28,6 +28,8 @@ description:
   - This module creates, updates, or deletes a C(schematics_resource_query) resource for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
   name:
     description:
@@ -135,6 +137,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -197,10 +200,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     name = module.params["name"]
     type = module.params["type"]
@@ -213,13 +219,15 @@ def run_module():
     sdk = config.get_schematicsv1_sdk()
 
     resource_exists = True
+    current = None
 
     # Check for existence
     if query_id:
         try:
-            sdk.get_resources_query(
+            response = sdk.get_resources_query(
                 query_id=query_id,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -232,6 +240,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": query_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_resources_query(
                     query_id=query_id,
@@ -241,14 +252,20 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": query_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": query_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                type=type,
+                name=name,
+                queries=queries,
+            ))
+
             # Create path
             try:
                 result = sdk.create_resource_query(
@@ -259,8 +276,15 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                type=type,
+                name=name,
+                queries=queries,
+            ))
+
             # Update path
             try:
                 result = sdk.replace_resources_query(
@@ -272,7 +296,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
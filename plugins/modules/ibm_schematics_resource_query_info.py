@@ -28,6 +28,9 @@ description:
   - This module retrieves one or more C(schematics_resource_query) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
   query_id:
     description:
@@ -62,6 +65,7 @@ msg:
 
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -77,10 +81,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     query_id = module.params["query_id"]
 
@@ -92,7 +100,7 @@ def run_module():
             response = sdk.get_resources_query(
                 query_id=query_id
             )
-            module.exit_json(msg=response.get_result())
+            projection.exit_json(module, response.get_result())
         except ApiException as ex:
             module.fail_json(msg=ex.message)
 
@@ -28,6 +28,8 @@ description:
   - This module creates, updates, or deletes a C(schematics_workspace) resource for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
 options:
   agent_id:
     description:
@@ -637,6 +639,7 @@ msg:
 '''
 
 from ..module_utils import config
+from ..module_utils import diff
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -1050,10 +1053,13 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
-        supports_check_mode=False
+        supports_check_mode=True
     )
+    config.configure(module)
 
     agent_id = module.params["agent_id"]
     description = module.params["description"]
@@ -1084,13 +1090,15 @@ def run_module():
     sdk = config.get_schematicsv1_sdk()
 
     resource_exists = True
+    current = None
 
     # Check for existence
     if w_id:
         try:
-            sdk.get_workspace(
+            response = sdk.get_workspace(
                 w_id=w_id,
             )
+            current = response.get_result()
         except ApiException as ex:
             if ex.code == 404:
                 resource_exists = False
@@ -1103,6 +1111,9 @@ def run_module():
     # Delete path
     if state == "absent":
         if resource_exists:
+            payload = {"id": w_id, "status": "deleted"}
+            diff.exit_if_check_mode(module, current, {}, payload)
+
             try:
                 sdk.delete_workspace(
                     refresh_token=refresh_token,
@@ -1112,14 +1123,32 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                payload = {"id": w_id, "status": "deleted"}
-                module.exit_json(changed=True, msg=payload)
+                diff.exit_changed(module, payload, current, {})
         else:
             payload = {"id": w_id, "status": "not_found"}
             module.exit_json(changed=False, msg=payload)
 
     if state == "present":
         if not resource_exists:
+            # Check mode path
+            diff.exit_if_check_mode(module, {}, dict(
+                applied_shareddata_ids=applied_shareddata_ids,
+                catalog_ref=catalog_ref,
+                dependencies=dependencies,
+                description=description,
+                location=location,
+                name=name,
+                resource_group=resource_group,
+                shared_data=shared_data,
+                tags=tags,
+                template_data=template_data,
+                template_ref=template_ref,
+                template_repo=template_repo,
+                type=type,
+                workspace_status=workspace_status,
+                agent_id=agent_id,
+            ))
+
             # Create path
             try:
                 result = sdk.create_workspace(
@@ -1143,8 +1172,24 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, {}, result)
         else:
+            # No-op and check mode paths
+            diff.check_update(module, current, dict(
+                catalog_ref=catalog_ref,
+                description=description,
+                dependencies=dependencies,
+                name=name,
+                shared_data=shared_data,
+                tags=tags,
+                template_data=template_data,
+                template_repo=template_repo_update_request_template_repo,
+                type=type,
+                workspace_status=workspace_status_update_request_workspace_status,
+                workspace_status_msg=workspace_status_msg,
+                agent_id=agent_id,
+            ))
+
             # Update path
             try:
                 result = sdk.update_workspace(
@@ -1165,7 +1210,7 @@ def run_module():
             except ApiException as ex:
                 module.fail_json(msg=ex.message)
             else:
-                module.exit_json(changed=True, msg=result)
+                diff.exit_changed(module, result, current, result)
 
 
 def main():
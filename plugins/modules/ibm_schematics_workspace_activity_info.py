@@ -28,6 +28,9 @@ description:
   - This module retrieves one or more C(schematics_workspace_activity) for Schematics Service API.
 requirements:
   - "SchematicsV1"
+extends_documentation_fragment:
+    - ibm.cloud.sdk_client
+    - ibm.cloud.projection
 options:
   w_id:
     description:
@@ -66,6 +69,7 @@ msg:
 '''
 
 from ..module_utils import config
+from ..module_utils import projection
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ibm_schematics import SchematicsV1
@@ -84,10 +88,14 @@ def run_module():
             required=False),
     )
 
+    module_args.update(config.sdk_argument_spec())
+    module_args.update(projection.projection_argument_spec())
+
     module = AnsibleModule(
         argument_spec=module_args,
         supports_check_mode=False
     )
+    config.configure(module)
 
     w_id = module.params["w_id"]
     activity_id = module.params["activity_id"]
@@ -100,7 +108,7 @@ def run_module():
             w_id=w_id,
             activity_id=activity_id
         )
-        module.exit_json(msg=response.get_result())
+        projection.exit_json(module, response.get_result())
     except ApiException as ex:
         module.fail_json(msg=ex.message)
 
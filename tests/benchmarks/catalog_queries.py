@@ -0,0 +1,294 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the Global Catalog traffic of the catalog resolution.
+
+A local server answers the Global Catalog queries from a catalog fixture,
+then catalog.get_serviceID_targetCRN_planID() resolves a (service, plan,
+location) tuple in a fresh interpreter, with a cold catalog cache. The
+requests, bytes received and latency of the resolution are reported.
+
+Run it from the root of the collection:
+
+    python tests/benchmarks/catalog_queries.py [--ref REV] [--fixture FILE]
+        [--delay MS] [--repeat N] SERVICE PLAN LOCATION
+
+Without --fixture a synthetic catalog with a service named cloudant is
+served. A fixture of a real service is recorded with IC_API_KEY set:
+
+    python tests/benchmarks/catalog_queries.py --record FILE SERVICE
+
+With --ref the same measurement is also taken on the plugins/ tree of the
+given git revision, and the two are printed side by side.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# Properties the Global Catalog returns without complete=true or include.
+BASIC_PROPERTIES = (
+    'id', 'name', 'kind', 'url', 'parent_id', 'catalog_crn', 'geo_tags',
+    'tags', 'active', 'disabled', 'created', 'updated',
+)
+
+LANGUAGES = ('en', 'de', 'es', 'fr', 'it', 'ja', 'ko', 'pt-BR', 'zh-CN', 'zh-TW')
+
+LOCATIONS = (
+    'us-south', 'us-east', 'eu-gb', 'eu-de', 'eu-es', 'jp-tok', 'jp-osa',
+    'au-syd', 'ca-tor', 'br-sao', 'in-che', 'kr-seo', 'fr-par', 'mil01',
+    'sng01', 'che01', 'mon01', 'sjc03', 'wdc04', 'dal10',
+)
+
+PROBE = r'''
+import json, sys, time
+import ibm_platform_services
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from plugins.module_utils import catalog, config
+ibm_platform_services.GlobalCatalogV1.DEFAULT_SERVICE_URL = sys.argv[1]
+config.get_authenticator = NoAuthAuthenticator
+start = time.perf_counter()
+catalog.get_serviceID_targetCRN_planID(*sys.argv[2:])
+print(json.dumps(time.perf_counter() - start))
+'''
+
+
+def synthetic_catalog():
+    """A service with the size and shape of a popular Global Catalog entry."""
+    def document(id, name, kind, parent_id):
+        return dict(
+            id=id,
+            name=name,
+            kind=kind,
+            parent_id=parent_id,
+            url='https://globalcatalog.cloud.ibm.com/api/v1/' + id,
+            catalog_crn='crn:v1:bluemix:public:globalcatalog::::%s:%s' % (kind, id),
+            geo_tags=list(LOCATIONS),
+            tags=['ibm_created', 'rc_compatible', 'lite', 'data_management'],
+            active=True,
+            disabled=False,
+            overview_ui=dict(
+                (language, dict(
+                    display_name='%s (%s)' % (name, language),
+                    description='Description of %s. ' % name * 20,
+                    long_description='Long description of %s. ' % name * 60,
+                )) for language in LANGUAGES),
+            images=dict(image='https://cache.globalcatalog.cloud.ibm.com/%s.svg' % id),
+            metadata=dict(
+                rc_compatible=True,
+                ui=dict(
+                    strings=dict(
+                        (language, dict(bullets=['Feature %d of %s' % (i, name) for i in range(10)]))
+                        for language in LANGUAGES),
+                    urls=dict(doc_url='https://cloud.ibm.com/docs/' + name),
+                ),
+                pricing=dict(
+                    type='paid',
+                    metrics=[dict(
+                        part_ref='part-%d' % i,
+                        metric_id='metric-%d' % i,
+                        tier_model='Linear',
+                        charge_unit_name='CAPACITY_%d' % i,
+                        amounts=[dict(country=country, currency='USD', prices=[dict(quantity_tier=1, price=0.5)])
+                                 for country in ('USA', 'DEU', 'GBR', 'JPN', 'AUS')],
+                    ) for i in range(5)],
+                ),
+            ),
+        )
+
+    entries = [document('cloudant', 'cloudant', 'service', None)]
+    for plan in ('lite', 'standard', 'dedicated-hardware', 'enterprise', 'sandbox', 'trial'):
+        plan_id = 'cloudant-' + plan
+        entries.append(document(plan_id, plan, 'plan', 'cloudant'))
+        for location in LOCATIONS:
+            deployment = document('%s-%s' % (plan_id, location), 'cloudant-' + location, 'deployment', plan_id)
+            deployment['metadata']['deployment'] = dict(
+                location=location,
+                target_crn='crn:v1:bluemix:public:resource-catalog::a/9e16d1fed8aa7e1bd73e7a9d23434a5a::deployment-target:' + location,
+            )
+            entries.append(deployment)
+    return entries
+
+
+def view(entry, params):
+    """The entry as the Global Catalog returns it for the given query parameters."""
+    if params.get('complete') == 'true':
+        return entry
+    result = dict((k, entry[k]) for k in BASIC_PROPERTIES if k in entry)
+    if 'overview_ui' in entry:
+        result['overview_ui'] = dict((k, v) for k, v in entry['overview_ui'].items() if k == 'en')
+    for path in params.get('include', '').split(':'):
+        if path == '*':
+            return entry
+        parts = path.split('.')
+        value = entry
+        for part in parts:
+            value = value.get(part) if isinstance(value, dict) else None
+        if value is not None and parts[0]:
+            target = result
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = value
+    return result
+
+
+class CatalogHandler(BaseHTTPRequestHandler):
+    """Answers the list and child queries of the Global Catalog from a fixture."""
+
+    entries = []
+    delay = 0.0
+    requests = 0
+    bytes_sent = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = dict((k, v[-1]) for k, v in parse_qs(url.query).items())
+        parts = [unquote(p) for p in url.path.split('/') if p]
+        if not parts:
+            name = params.get('q', '').split(' ')[0]
+            matches = [e for e in self.entries if e['kind'] == 'service' and e['name'] == name]
+        elif len(parts) == 2:
+            matches = [e for e in self.entries
+                       if e.get('parent_id') == parts[0] and parts[1] in ('*', e['kind'])]
+        else:
+            matches = [e for e in self.entries if e['id'] == parts[0]]
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', 200))
+        page = matches[offset:offset + limit]
+        payload = json.dumps(dict(
+            offset=offset,
+            limit=limit,
+            count=len(matches),
+            resource_count=len(page),
+            resources=[view(e, params) for e in page],
+        )).encode('utf-8')
+
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        with self.lock:
+            CatalogHandler.requests += 1
+            CatalogHandler.bytes_sent += len(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(root, url, resolution, repeat):
+    env = dict(os.environ, IC_TOKEN_CACHE='false')
+    env['PYTHONPATH'] = os.pathsep.join([root, env.get('PYTHONPATH', '')])
+    samples = []
+    for dummy in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env['IC_CATALOG_CACHE_DIR'] = cache_dir
+            CatalogHandler.requests = CatalogHandler.bytes_sent = 0
+            output = subprocess.check_output(
+                [sys.executable, '-c', PROBE, url] + list(resolution), cwd=root, env=env)
+            samples.append(json.loads(output.decode('utf-8').splitlines()[-1]))
+    return CatalogHandler.requests, CatalogHandler.bytes_sent, statistics.median(samples) * 1000
+
+
+def record(path, service_name):
+    """Writes the complete documents of a service, its plans and deployments to path."""
+    sys.path.insert(0, os.getcwd())
+    from plugins.module_utils import config
+
+    catalog_sdk = config.get_global_catalog_sdk()
+    services = catalog_sdk.list_catalog_entries(q=service_name + ' rc:true', complete=True).get_result()
+    entries = services['resources'][:1]
+    parents = [e['id'] for e in entries]
+    while parents:
+        children = []
+        for parent in parents:
+            offset = 0
+            while True:
+                result = catalog_sdk.get_child_objects(
+                    id=parent, kind='*', complete=True, offset=offset, limit=100).get_result()
+                for child in result['resources']:
+                    child['parent_id'] = parent
+                    children.append(child)
+                offset += len(result['resources'])
+                if not result['resources'] or offset >= result['count']:
+                    break
+        entries.extend(children)
+        parents = [c['id'] for c in children if c['kind'] == 'plan']
+    with open(path, 'w') as f:
+        json.dump(entries, f)
+
+
+def checkout(ref, directory):
+    archive = subprocess.Popen(['git', 'archive', ref, 'plugins'], stdout=subprocess.PIPE)
+    subprocess.check_call(['tar', '-x', '-C', directory], stdin=archive.stdout)
+    if archive.wait() != 0:
+        raise SystemExit("git archive %s failed" % ref)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ref', help='git revision to compare against')
+    parser.add_argument('--fixture', help='recorded catalog fixture, a synthetic catalog by default')
+    parser.add_argument('--record', metavar='FILE', help='record the fixture of SERVICE to FILE and exit')
+    parser.add_argument('--delay', type=float, default=50, help='server latency per request in ms')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per tree')
+    parser.add_argument('resolution', nargs='*', default=['cloudant', 'standard', 'eu-de'],
+                        help='SERVICE PLAN LOCATION to resolve')
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, args.resolution[0])
+        return
+
+    if args.fixture:
+        with open(args.fixture) as f:
+            CatalogHandler.entries = json.load(f)
+    else:
+        CatalogHandler.entries = synthetic_catalog()
+    CatalogHandler.delay = args.delay / 1000.0
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CatalogHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:%d' % server.server_port
+
+    root = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as before_root:
+            print('%-8s %10s %12s %12s' % ('tree', 'requests', 'bytes', 'latency ms'))
+            if args.ref:
+                checkout(args.ref, before_root)
+                print('%-8s %10d %12d %12.1f' % (('before',) + measure(before_root, url, args.resolution, args.repeat)))
+            print('%-8s %10d %12d %12.1f' % (('after',) + measure(root, url, args.resolution, args.repeat)))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
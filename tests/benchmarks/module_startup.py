@@ -0,0 +1,114 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the startup cost of every module.
+
+Each module is imported in a fresh interpreter, the way the AnsiballZ payload
+imports it on the target host, then the SDK clients it uses are built through
+module_utils/config.py. Both steps are timed separately and the median of
+several runs is reported.
+
+Run it from the root of the collection:
+
+    python tests/benchmarks/module_startup.py [--ref REV] [--repeat N] [MODULE ...]
+
+With --ref the same measurement is also taken on the plugins/ tree of the
+given git revision, and the two are printed side by side.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import glob
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROBE = r'''
+import importlib, json, sys, time
+start = time.perf_counter()
+module = importlib.import_module('plugins.modules.' + sys.argv[1])
+imported = time.perf_counter()
+for factory in sys.argv[2:]:
+    getattr(module.config, factory)()
+initialized = time.perf_counter()
+print(json.dumps([imported - start, initialized - imported]))
+'''
+
+
+def list_modules(root):
+    paths = glob.glob(os.path.join(root, 'plugins', 'modules', 'ibm_*.py'))
+    return sorted(os.path.splitext(os.path.basename(p))[0] for p in paths)
+
+
+def get_factories(root, module):
+    with open(os.path.join(root, 'plugins', 'modules', module + '.py')) as f:
+        source = f.read()
+    return sorted(set(re.findall(r'config\.(get_\w+_sdk)\(', source)))
+
+
+def measure(root, module, repeat):
+    env = dict(os.environ, IC_API_KEY='benchmark', IC_TOKEN_CACHE='false')
+    env['PYTHONPATH'] = os.pathsep.join([root, env.get('PYTHONPATH', '')])
+    args = [sys.executable, '-c', PROBE, module] + get_factories(root, module)
+    samples = []
+    for dummy in range(repeat):
+        output = subprocess.check_output(args, cwd=root, env=env)
+        samples.append(json.loads(output.decode('utf-8').splitlines()[-1]))
+    return (statistics.median(s[0] for s in samples) * 1000,
+            statistics.median(s[1] for s in samples) * 1000)
+
+
+def checkout(ref, directory):
+    archive = subprocess.Popen(['git', 'archive', ref, 'plugins'], stdout=subprocess.PIPE)
+    subprocess.check_call(['tar', '-x', '-C', directory], stdin=archive.stdout)
+    if archive.wait() != 0:
+        raise SystemExit("git archive %s failed" % ref)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ref', help='git revision to compare against')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per module')
+    parser.add_argument('modules', nargs='*', help='modules to measure, all by default')
+    args = parser.parse_args()
+
+    root = os.getcwd()
+    modules = args.modules or list_modules(root)
+
+    with tempfile.TemporaryDirectory() as before_root:
+        if args.ref:
+            checkout(args.ref, before_root)
+            print('%-42s %19s %19s' % ('module (ms)', 'import before/after', 'init before/after'))
+        else:
+            print('%-42s %10s %10s' % ('module (ms)', 'import', 'init'))
+
+        for module in modules:
+            after = measure(root, module, args.repeat)
+            if args.ref:
+                before = measure(before_root, module, args.repeat)
+                print('%-42s %9.1f/%-9.1f %9.1f/%-9.1f' % (module, before[0], after[0], before[1], after[1]))
+            else:
+                print('%-42s %10.1f %10.1f' % (module, after[0], after[1]))
+
+
+if __name__ == '__main__':
+    main()
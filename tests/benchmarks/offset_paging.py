@@ -0,0 +1,131 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares sequential and parallel offset paging of access groups.
+
+A local server plays the IAM Access Groups API with thousands of groups and
+a fixed latency per request. All the groups are listed through
+pagination.OffsetPager with one worker, which pages sequentially,
+and with each of the given numbers of workers.
+
+Run it from the root of the collection:
+
+    python tests/benchmarks/offset_paging.py [--groups N] [--limit N]
+        [--delay MS] [--repeat N] [WORKERS ...]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.getcwd())
+
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator  # noqa: E402
+from plugins.module_utils import config, pagination  # noqa: E402
+
+
+class GroupsHandler(BaseHTTPRequestHandler):
+    """Answers list_access_groups with a page of the groups."""
+
+    groups = []
+    delay = 0.0
+
+    def do_GET(self):
+        params = dict((k, v[-1]) for k, v in parse_qs(urlsplit(self.path).query).items())
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', 50))
+        payload = json.dumps(dict(
+            limit=limit,
+            offset=offset,
+            total_count=len(self.groups),
+            groups=self.groups[offset:offset + limit],
+        )).encode('utf-8')
+
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    # Room for the connections of all the workers.
+    request_queue_size = 128
+
+
+def measure(sdk, limit, workers, repeat):
+    samples = []
+    for dummy in range(repeat):
+        start = time.perf_counter()
+        pager = pagination.OffsetPager(
+            sdk.list_access_groups, 'groups', page_size=limit, workers=workers, account_id='account')
+        count = sum(1 for dummy in pager.items())
+        samples.append(time.perf_counter() - start)
+        if count != len(GroupsHandler.groups):
+            raise SystemExit('listed %d groups out of %d' % (count, len(GroupsHandler.groups)))
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--groups', type=int, default=5000, help='groups in the account')
+    parser.add_argument('--limit', type=int, default=100, help='groups per page')
+    parser.add_argument('--delay', type=float, default=50, help='server latency per request in ms')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement')
+    parser.add_argument('workers', type=int, nargs='*', default=[4, 8, 16], help='numbers of workers to compare')
+    args = parser.parse_args()
+
+    GroupsHandler.groups = [
+        dict(id='AccessGroupId-%d' % i, name='group-%d' % i, description='Access group %d' % i,
+             is_federated=False, href='https://iam.cloud.ibm.com/v2/groups/AccessGroupId-%d' % i)
+        for i in range(args.groups)]
+    GroupsHandler.delay = args.delay / 1000.0
+    server = Server(('127.0.0.1', 0), GroupsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    config.get_authenticator = NoAuthAuthenticator
+    config.configure(MagicMock(params=dict(pool_size=max([1] + args.workers))))
+    sdk = config.get_iam_access_group_sdk()
+    sdk.set_service_url('http://127.0.0.1:%d' % server.server_port)
+
+    try:
+        sequential = measure(sdk, args.limit, 1, args.repeat)
+        print('%-12s %10s %8s' % ('workers', 'time ms', 'speedup'))
+        print('%-12s %10.1f %8.1f' % ('sequential', sequential, 1.0))
+        for workers in args.workers:
+            elapsed = measure(sdk, args.limit, workers, args.repeat)
+            print('%-12d %10.1f %8.1f' % (workers, elapsed, sequential / elapsed))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# coding: utf-8
+
+# Copyright 2022 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers with the queued (status, headers, body) responses, then with 200.
+
+    The requests received are recorded as (method, path) pairs.
+    """
+
+    responses = []
+    requests = []
+    default_body = {'resources': []}
+
+    def _respond(self):
+        StubHandler.requests.append((self.command, self.path))
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        if StubHandler.responses:
+            status, headers, body = StubHandler.responses.pop(0)
+        else:
+            status, headers, body = 200, {}, StubHandler.default_body
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+    do_PUT = _respond
+    do_PATCH = _respond
+    do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    """A local HTTP server running StubHandler on a background thread."""
+
+    def __init__(self):
+        self.server = HTTPServer(('127.0.0.1', 0), StubHandler)
+        self.url = 'http://127.0.0.1:%d' % self.server.server_port
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def reset(self, responses=None):
+        StubHandler.responses = list(responses or [])
+        StubHandler.requests = []
+
+    @property
+    def requests(self):
+        return StubHandler.requests
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_module(**params):
+    """Returns a mocked AnsibleModule with the given params."""
+    module = MagicMock()
+    module.params = dict(params)
+    return module
@@ -0,0 +1,113 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+
+from plugins.module_utils import account_snapshot
+
+
+def answer(result):
+    return MagicMock(return_value=DetailedResponse(response=result))
+
+
+def sdks():
+    """Returns mocked SDK clients of an account with two access groups."""
+    resource_manager = MagicMock()
+    resource_manager.list_resource_groups = answer({'resources': [{'id': 'rg-1', 'name': 'default', 'crn': 'crn:rg-1'}]})
+    resource_controller = MagicMock()
+    resource_controller.list_resource_instances = answer({'next_url': None, 'resources': [
+        {'id': 'crn:i-1', 'crn': 'crn:i-1', 'name': 'db', 'resource_group_id': 'rg-1'},
+        {'id': 'crn:i-2', 'crn': 'crn:i-2', 'name': 'cos', 'resource_group_id': 'rg-1'},
+    ]})
+    resource_controller.list_resource_keys = answer({'next_url': None, 'resources': [
+        {'id': 'crn:k-1', 'crn': 'crn:k-1', 'name': 'db-key', 'resource_group_id': 'rg-1'}]})
+    resource_controller.list_resource_bindings = answer({'next_url': None, 'resources': []})
+    resource_controller.list_resource_aliases = answer({'next_url': None, 'resources': []})
+    access_groups = MagicMock()
+    access_groups.list_access_groups = answer({'limit': 100, 'offset': 0, 'total_count': 2, 'groups': [
+        {'id': 'AccessGroupId-1', 'name': 'admins'}, {'id': 'AccessGroupId-2', 'name': 'readers'}]})
+    access_groups.list_access_group_members = MagicMock(side_effect=lambda access_group_id, **kwargs: DetailedResponse(
+        response={'limit': 100, 'offset': 0, 'total_count': 1, 'members': [{'iam_id': 'IBMid-' + access_group_id}]}))
+    access_groups.list_access_group_rules = answer({'rules': [{'id': 'rule-1', 'name': 'federated'}]})
+    identity = MagicMock()
+    identity.list_service_ids = answer({'serviceids': [{'id': 'ServiceId-1', 'name': 'ci', 'crn': 'crn:s-1'}]})
+    return resource_manager, resource_controller, access_groups, identity
+
+
+class TestAccountSnapshot(unittest.TestCase):
+    """
+    Test class for the account crawl and its SQLite snapshot.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, 'account.db')
+        resource_manager, self.resource_controller, self.access_groups, identity = sdks()
+        for name, sdk in (('resource_manager', resource_manager), ('resource_contollerV2', self.resource_controller),
+                          ('iam_access_group', self.access_groups), ('iam_identity', identity)):
+            patcher = patch('plugins.module_utils.account_snapshot.config.get_%s_sdk' % name, return_value=sdk)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_crawl(self):
+        """All the lists are crawled, with the members and rules of every access group."""
+        lists = list(account_snapshot.crawl('account', workers=4))
+
+        kinds = sorted((kind, parent_id) for kind, parent_id, items in lists)
+        assert kinds == sorted(
+            [(kind, None) for kind in account_snapshot.KINDS if not kind.startswith('access_group_')]
+            + [(kind, group) for kind in ('access_group_members', 'access_group_rules')
+               for group in ('AccessGroupId-1', 'AccessGroupId-2')])
+        assert self.access_groups.list_access_groups.call_args.kwargs['account_id'] == 'account'
+        assert self.resource_controller.list_resource_instances.call_args.kwargs['limit'] == 100
+
+    def test_crawl_failed(self):
+        """A failed list fails the crawl."""
+        self.resource_controller.list_resource_keys.side_effect = ApiException(403, message='Forbidden')
+
+        with self.assertRaises(ApiException):
+            list(account_snapshot.crawl('account'))
+
+    def test_write_snapshot(self):
+        """The resources are indexed rows holding their compressed documents."""
+        counts = account_snapshot.write_snapshot(self.path, 'account', account_snapshot.crawl('account'))
+
+        assert counts == {
+            'resource_groups': 1, 'resource_instances': 2, 'resource_keys': 1, 'resource_bindings': 0,
+            'resource_aliases': 0, 'access_groups': 2, 'access_group_members': 2, 'access_group_rules': 2,
+            'service_ids': 1,
+        }
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        row = conn.execute("SELECT kind, id, name, document FROM resources WHERE crn = 'crn:i-2'").fetchone()
+        assert row[:3] == ('resource_instances', 'crn:i-2', 'cos')
+        assert account_snapshot.read_document(row[3]) == {
+            'id': 'crn:i-2', 'crn': 'crn:i-2', 'name': 'cos', 'resource_group_id': 'rg-1'}
+        assert conn.execute(
+            "SELECT id FROM resources WHERE kind = 'access_group_members' AND parent_id = 'AccessGroupId-2'"
+        ).fetchall() == [('IBMid-AccessGroupId-2',)]
+        assert conn.execute("SELECT count(*) FROM resources WHERE resource_group_id = 'rg-1'").fetchone() == (3,)
+        plan = ' '.join(r[-1] for r in conn.execute("EXPLAIN QUERY PLAN SELECT * FROM resources WHERE name = 'db'"))
+        assert 'resources_name' in plan
+        assert dict(conn.execute('SELECT key, value FROM meta'))['account_id'] == 'account'
@@ -0,0 +1,385 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+
+from .common import make_module
+from plugins.module_utils import catalog
+
+SERVICE = {'id': 'service-id', 'name': 'cloudant', 'kind': 'service'}
+PLANS = [{'id': 'plan-id', 'name': 'lite', 'kind': 'plan'}]
+DEPLOYMENTS = [
+    {'id': 'deployment-eu', 'kind': 'deployment', 'catalog_crn': 'crn:eu-de',
+     'metadata': {'deployment': {'location': 'eu-de'}}},
+    {'id': 'deployment-us', 'kind': 'deployment', 'catalog_crn': 'crn:us-south',
+     'metadata': {'deployment': {'location': 'us-south'}}},
+]
+
+
+def list_catalog_entries(**kwargs):
+    resources = [SERVICE] if kwargs['q'].startswith(SERVICE['name'] + ' ') else []
+    return DetailedResponse(response={'resources': resources})
+
+
+def get_child_objects(**kwargs):
+    children = {'service-id': PLANS, 'plan-id': DEPLOYMENTS}
+    matches = [c for c in children.get(kwargs['id'], []) if kwargs['kind'] in ('*', c['kind'])]
+    offset = kwargs.get('offset') or 0
+    page = matches[offset:offset + kwargs['limit']]
+    return DetailedResponse(response={'count': len(matches), 'resources': page})
+
+
+def default_options():
+    return dict((name, spec.get('default')) for name, spec in catalog.catalog_argument_spec().items())
+
+
+class TestCatalogCache(unittest.TestCase):
+    """
+    Test class for the Global Catalog resolution cache.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        env = patch.dict(os.environ, {
+            'IC_API_KEY': 'noAuthAPIKey',
+            'IC_TOKEN_CACHE': 'false',
+            'IC_CATALOG_CACHE_DIR': os.path.join(self.tmpdir.name, 'catalog'),
+        })
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(catalog.configure, make_module(**default_options()))
+
+        patcher = patch('ibm_platform_services.GlobalCatalogV1.list_catalog_entries', side_effect=list_catalog_entries)
+        self.list_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('ibm_platform_services.GlobalCatalogV1.get_child_objects', side_effect=get_child_objects)
+        self.children_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.configure()
+
+    def configure(self, **params):
+        options = default_options()
+        options.update(params)
+        catalog.configure(make_module(**options))
+
+    def api_calls(self):
+        return self.list_mock.call_count + self.children_mock.call_count
+
+    def test_resolution_cached(self):
+        """A resolution is answered from the cache by later runs."""
+        result = catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'us-south')
+        assert result == ('service-id', 'crn:us-south', 'plan-id')
+        calls = self.api_calls()
+
+        assert catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'us-south') == result
+        assert catalog.get_planID('cloudant', 'lite') == ('service-id', 'plan-id')
+        assert catalog.get_serviceID('cloudant') == 'service-id'
+        assert self.api_calls() == calls
+
+    def test_other_location_resolved(self):
+        """Each (service, plan, location) has its own cache entry."""
+        catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'us-south')
+        calls = self.api_calls()
+
+        result = catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'eu-de')
+
+        assert result == ('service-id', 'crn:eu-de', 'plan-id')
+        assert self.api_calls() == calls + 1
+
+    def test_not_found_cached(self):
+        """A service that was not found is not looked up again until the negative TTL ends."""
+        for dummy in range(2):
+            with self.assertRaises(ValueError):
+                catalog.get_serviceID('unknown')
+        assert self.list_mock.call_count == 1
+
+        with patch('plugins.module_utils.disk_cache.time.time', return_value=time.time() + catalog.DEFAULT_CACHE_NEGATIVE_TTL):
+            with self.assertRaises(ValueError):
+                catalog.get_serviceID('unknown')
+        assert self.list_mock.call_count == 2
+
+    def test_authentication_error_not_cached(self):
+        """An authentication setup error is raised again, but not cached as not found."""
+        with patch.dict(os.environ):
+            del os.environ['IC_API_KEY']
+            with self.assertRaises(ValueError) as ctx:
+                catalog.get_serviceID('cloudant')
+            assert not isinstance(ctx.exception, catalog.NotFound)
+
+        assert catalog.get_serviceID('cloudant') == 'service-id'
+        assert self.list_mock.call_count == 1
+
+    def test_cached_per_credential(self):
+        """The resolutions of one credential, hence account, are not served to another."""
+        catalog.get_serviceID('cloudant')
+        with patch.dict(os.environ, {'IC_API_KEY': 'otherAPIKey'}):
+            catalog.get_serviceID('cloudant')
+        catalog.get_serviceID('cloudant')
+
+        assert self.list_mock.call_count == 2
+
+    def test_ttl(self):
+        """A resolution is looked up again once its TTL ended."""
+        self.configure(catalog_cache_ttl=60)
+        catalog.get_serviceID('cloudant')
+
+        with patch('plugins.module_utils.disk_cache.time.time', return_value=time.time() + 61):
+            catalog.get_serviceID('cloudant')
+
+        assert self.list_mock.call_count == 2
+
+    def test_bypass(self):
+        """catalog_cache=bypass always asks the Global Catalog."""
+        self.configure(catalog_cache='bypass')
+        catalog.get_serviceID('cloudant')
+        catalog.get_serviceID('cloudant')
+
+        assert self.list_mock.call_count == 2
+        assert not os.path.exists(os.environ['IC_CATALOG_CACHE_DIR'])
+
+    def test_refresh(self):
+        """catalog_cache=refresh replaces the cached resolution."""
+        catalog.get_serviceID('cloudant')
+        self.configure(catalog_cache='refresh')
+        with patch.dict(SERVICE, id='new-service-id'):
+            assert catalog.get_serviceID('cloudant') == 'new-service-id'
+
+        self.configure(catalog_cache='use')
+        assert catalog.get_serviceID('cloudant') == 'new-service-id'
+        assert self.list_mock.call_count == 2
+
+
+class TestCatalogQueries(unittest.TestCase):
+    """
+    Test class for the Global Catalog queries of the catalog resolution.
+    """
+
+    def setUp(self):
+        env = patch.dict(os.environ, {'IC_API_KEY': 'noAuthAPIKey', 'IC_TOKEN_CACHE': 'false'})
+        env.start()
+        self.addCleanup(env.stop)
+        catalog.configure(make_module(catalog_cache='bypass'))
+        self.addCleanup(catalog.configure, make_module(**default_options()))
+
+        patcher = patch('ibm_platform_services.GlobalCatalogV1.list_catalog_entries', side_effect=list_catalog_entries)
+        self.list_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('ibm_platform_services.GlobalCatalogV1.get_child_objects', side_effect=get_child_objects)
+        self.children_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lean_queries(self):
+        """Only the plans and deployments are requested, without the complete documents."""
+        result = catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'us-south')
+
+        assert result == ('service-id', 'crn:us-south', 'plan-id')
+        assert 'complete' not in self.list_mock.call_args.kwargs
+        assert self.list_mock.call_args.kwargs['limit'] == 1
+        plans, deployments = [c.kwargs for c in self.children_mock.call_args_list]
+        assert (plans['id'], plans['kind']) == ('service-id', 'plan')
+        assert (deployments['id'], deployments['kind']) == ('plan-id', 'deployment')
+        assert deployments['include'] == 'metadata.deployment'
+        assert 'complete' not in plans and 'complete' not in deployments
+
+    def test_stops_at_match(self):
+        """The remaining pages are not fetched once the location is found."""
+        deployments = [
+            {'id': 'deployment-%d' % i, 'kind': 'deployment', 'catalog_crn': 'crn:%d' % i,
+             'metadata': {'deployment': {'location': 'location-%d' % i}}}
+            for i in range(catalog.CHILD_PAGE_SIZE * 3)]
+        with patch('%s.DEPLOYMENTS' % __name__, deployments):
+            result = catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'location-1')
+            assert result == ('service-id', 'crn:1', 'plan-id')
+            assert self.children_mock.call_count == 2
+
+            result = catalog.get_serviceID_targetCRN_planID(
+                'cloudant', 'lite', 'location-%d' % (catalog.CHILD_PAGE_SIZE * 2))
+            assert result == ('service-id', 'crn:%d' % (catalog.CHILD_PAGE_SIZE * 2), 'plan-id')
+            assert [c.kwargs['offset'] for c in self.children_mock.call_args_list[3:]] == [
+                0, catalog.CHILD_PAGE_SIZE, catalog.CHILD_PAGE_SIZE * 2]
+
+    def test_location_not_found(self):
+        """Every page is searched before the location is reported missing."""
+        with self.assertRaises(ValueError):
+            catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'mars-1')
+        assert self.children_mock.call_count == 2
+
+
+class TestResolveMany(unittest.TestCase):
+    """
+    Test class for the batch catalog resolution.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        env = patch.dict(os.environ, {
+            'IC_API_KEY': 'noAuthAPIKey',
+            'IC_TOKEN_CACHE': 'false',
+            'IC_CATALOG_CACHE_DIR': os.path.join(self.tmpdir.name, 'catalog'),
+        })
+        env.start()
+        self.addCleanup(env.stop)
+        catalog.configure(make_module(**default_options()))
+        self.addCleanup(catalog.configure, make_module(**default_options()))
+
+        patcher = patch('ibm_platform_services.GlobalCatalogV1.list_catalog_entries', side_effect=list_catalog_entries)
+        self.list_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('ibm_platform_services.GlobalCatalogV1.get_child_objects', side_effect=get_child_objects)
+        self.children_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lookups_deduplicated(self):
+        """Each service, plan and deployment list is fetched once for the whole batch."""
+        targets = [
+            ('cloudant', 'lite', 'us-south'),
+            ('cloudant', 'lite', 'eu-de'),
+            ('cloudant', 'lite', 'us-south'),
+        ]
+
+        result = catalog.resolve_many(targets, workers=2)
+
+        assert result == {
+            ('cloudant', 'lite', 'us-south'): ('service-id', 'crn:us-south', 'plan-id'),
+            ('cloudant', 'lite', 'eu-de'): ('service-id', 'crn:eu-de', 'plan-id'),
+        }
+        assert self.list_mock.call_count == 1
+        assert [c.kwargs['kind'] for c in self.children_mock.call_args_list] == ['plan', 'deployment']
+
+    def test_resolutions_cached(self):
+        """The batch stores and reuses the resolutions of the single lookups."""
+        catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'us-south')
+        calls = self.children_mock.call_count
+
+        result = catalog.resolve_many([('cloudant', 'lite', 'us-south')])
+        assert result[('cloudant', 'lite', 'us-south')] == ('service-id', 'crn:us-south', 'plan-id')
+        assert self.children_mock.call_count == calls
+
+        catalog.resolve_many([('cloudant', 'lite', 'eu-de')])
+        calls = self.children_mock.call_count
+        assert catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'eu-de')[1] == 'crn:eu-de'
+        assert self.children_mock.call_count == calls
+
+    def test_errors_per_target(self):
+        """A tuple that cannot be resolved does not fail the others."""
+        result = catalog.resolve_many([
+            ('cloudant', 'lite', 'us-south'),
+            ('cloudant', 'lite', 'mars-1'),
+            ('cloudant', 'unknown', 'us-south'),
+            ('unknown', 'lite', 'us-south'),
+        ])
+
+        assert result[('cloudant', 'lite', 'us-south')] == ('service-id', 'crn:us-south', 'plan-id')
+        assert isinstance(result[('cloudant', 'lite', 'mars-1')], ValueError)
+        assert isinstance(result[('cloudant', 'unknown', 'us-south')], ValueError)
+        assert isinstance(result[('unknown', 'lite', 'us-south')], ValueError)
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    """
+    Test class for the offline Global Catalog snapshot.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        env = patch.dict(os.environ, {
+            'IC_API_KEY': 'noAuthAPIKey',
+            'IC_TOKEN_CACHE': 'false',
+            'IC_CATALOG_CACHE_DIR': os.path.join(self.tmpdir.name, 'catalog'),
+        })
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(catalog.configure, make_module(**default_options()))
+
+        patcher = patch('ibm_platform_services.GlobalCatalogV1.list_catalog_entries', side_effect=list_catalog_entries)
+        self.list_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('ibm_platform_services.GlobalCatalogV1.get_child_objects', side_effect=get_child_objects)
+        self.children_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_snapshot(self, index):
+        path = os.path.join(self.tmpdir.name, 'snapshot.json')
+        with open(path, 'w') as f:
+            json.dump(index, f)
+        options = default_options()
+        options.update(catalog_snapshot=path)
+        catalog.configure(make_module(**options))
+        return path
+
+    def test_build_snapshot(self):
+        """The snapshot holds the IDs of the services and plans and the CRNs of their deployments."""
+        index = catalog.build_snapshot(['cloudant'])
+
+        assert index == {
+            'version': catalog.SNAPSHOT_VERSION,
+            'services': {
+                'cloudant': {
+                    'id': 'service-id',
+                    'plans': {
+                        'lite': {
+                            'id': 'plan-id',
+                            'deployments': {'eu-de': 'crn:eu-de', 'us-south': 'crn:us-south'},
+                        },
+                    },
+                },
+            },
+        }
+        assert catalog.build_snapshot(['cloudant'], plans=['standard'])['services']['cloudant']['plans'] == {}
+
+    def test_build_snapshot_service_not_found(self):
+        """Services missing from the Global Catalog are reported."""
+        with self.assertRaises(ValueError) as context:
+            catalog.build_snapshot(['cloudant', 'unknown'])
+        assert 'unknown' in str(context.exception)
+
+    def test_resolved_offline(self):
+        """With a snapshot configured no Global Catalog query is sent."""
+        self.write_snapshot(catalog.build_snapshot(['cloudant']))
+        self.list_mock.reset_mock()
+        self.children_mock.reset_mock()
+
+        assert catalog.get_serviceID('cloudant') == 'service-id'
+        assert catalog.get_planID('cloudant', 'lite') == ('service-id', 'plan-id')
+        assert catalog.get_serviceID_targetCRN_planID('cloudant', 'lite', 'eu-de') == ('service-id', 'crn:eu-de', 'plan-id')
+        result = catalog.resolve_many([('cloudant', 'lite', 'us-south'), ('cloudant', 'lite', 'mars-1')])
+        assert result[('cloudant', 'lite', 'us-south')] == ('service-id', 'crn:us-south', 'plan-id')
+        assert isinstance(result[('cloudant', 'lite', 'mars-1')], ValueError)
+        for args in [('unknown',), ('cloudant', 'unknown'), ('cloudant', 'lite', 'mars-1')]:
+            with self.assertRaises(ValueError):
+                catalog.get_serviceID_targetCRN_planID(*(args + (None,) * (3 - len(args))))
+
+        assert self.list_mock.call_count == 0
+        assert self.children_mock.call_count == 0
+        assert not os.path.exists(os.environ['IC_CATALOG_CACHE_DIR'])
+
+    def test_invalid_snapshot(self):
+        """A snapshot of another format is rejected."""
+        self.write_snapshot({'version': catalog.SNAPSHOT_VERSION + 1, 'services': {}})
+        with self.assertRaises(ValueError) as context:
+            catalog.get_serviceID('cloudant')
+        assert 'cannot read the catalog snapshot' in str(context.exception)
@@ -0,0 +1,174 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import subprocess
+import sys
+import unittest
+
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator, ContainerAuthenticator, IAMAuthenticator
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+
+from plugins.module_utils import config
+
+
+def make_module(**params):
+    module = MagicMock()
+    module.params = dict(pool_size=config.DEFAULT_POOL_SIZE)
+    module.params.update(params)
+    return module
+
+
+class TestConfig(unittest.TestCase):
+    """
+    Test class for the SDK client registry.
+    """
+
+    def setUp(self):
+        self.env = patch.dict(os.environ, {
+            'IC_API_KEY': 'noAuthAPIKey',
+            'IC_TOKEN_CACHE': 'false',
+        })
+        self.env.start()
+        self.addCleanup(self.env.stop)
+        config.configure(make_module())
+        config._registry.clear()
+        self.addCleanup(config._registry.clear)
+
+    def test_clients_are_memoized(self):
+        """Every factory hands out one client per service."""
+        first = config.get_global_catalog_sdk()
+        assert config.get_global_catalog_sdk() is first
+        assert config.get_resource_contollerV2_sdk() is not first
+
+    def test_clients_share_session_and_authenticator(self):
+        """All clients use the same HTTP session and authenticator."""
+        catalog_sdk = config.get_global_catalog_sdk()
+        controller_sdk = config.get_resource_contollerV2_sdk()
+
+        assert catalog_sdk.get_http_client() is controller_sdk.get_http_client()
+        assert catalog_sdk.get_authenticator() is controller_sdk.get_authenticator()
+
+    def test_pool_size_option(self):
+        """The pool_size option sizes the shared connection pool."""
+        config.configure(make_module(pool_size=25))
+
+        session = config.get_resource_manager_sdk().get_http_client()
+
+        assert session.get_adapter('https://example.com')._pool_maxsize == 25
+
+    def test_session_keeps_sdk_tls_settings(self):
+        """The shared session mounts the SDK adapter, which enforces TLS 1.2 or later."""
+        session = config.get_resource_manager_sdk().get_http_client()
+
+        adapter = session.get_adapter('https://example.com')
+        assert isinstance(adapter, SSLHTTPAdapter)
+        assert adapter.max_retries.total == config.DEFAULT_MAX_RETRIES
+
+    def test_configure_resets_registry(self):
+        """Changing the shared options rebuilds the clients."""
+        first = config.get_iam_identity_sdk()
+        config.configure(make_module())
+        assert config.get_iam_identity_sdk() is first
+
+        config.configure(make_module(pool_size=2))
+        assert config.get_iam_identity_sdk() is not first
+
+    def test_apikey_authenticator(self):
+        """Without IC_AUTH_TYPE the IC_API_KEY is used."""
+        authenticator = config.get_authenticator()
+
+        assert isinstance(authenticator, IAMAuthenticator)
+        assert authenticator.token_manager.apikey == 'noAuthAPIKey'
+        assert config.get_authenticator() is authenticator
+
+    def test_missing_apikey(self):
+        """A missing IC_API_KEY is reported."""
+        del os.environ['IC_API_KEY']
+
+        with self.assertRaises(ValueError):
+            config.get_authenticator()
+
+    def test_bearer_token_authenticator(self):
+        """IC_AUTH_TYPE=bearerToken uses the token as is."""
+        os.environ['IC_AUTH_TYPE'] = 'bearerToken'
+        os.environ['IC_BEARER_TOKEN'] = 'token'
+
+        authenticator = config.get_authenticator()
+
+        assert isinstance(authenticator, BearerTokenAuthenticator)
+        assert authenticator.bearer_token == 'token'
+
+    def test_container_authenticator(self):
+        """IC_AUTH_TYPE=container exchanges a compute resource token for a trusted profile."""
+        os.environ['IC_AUTH_TYPE'] = 'container'
+        os.environ['IC_IAM_PROFILE_ID'] = 'iam-Profile-1'
+        os.environ['IC_CR_TOKEN_FILENAME'] = '/var/run/secrets/token'
+
+        authenticator = config.get_authenticator()
+
+        assert isinstance(authenticator, ContainerAuthenticator)
+        assert authenticator.token_manager.iam_profile_id == 'iam-Profile-1'
+
+    def test_incomplete_auth_type_falls_back_to_apikey(self):
+        """The API key is used when the IC_AUTH_TYPE configuration is incomplete."""
+        os.environ['IC_AUTH_TYPE'] = 'iam'
+
+        authenticator = config.get_authenticator()
+
+        assert isinstance(authenticator, IAMAuthenticator)
+        assert authenticator.token_manager.apikey == 'noAuthAPIKey'
+
+    def test_incomplete_bearer_token_falls_back_to_apikey(self):
+        """The API key is used when IC_AUTH_TYPE=bearerToken has no token."""
+        os.environ['IC_AUTH_TYPE'] = 'bearerToken'
+
+        authenticator = config.get_authenticator()
+
+        assert isinstance(authenticator, IAMAuthenticator)
+        assert authenticator.token_manager.apikey == 'noAuthAPIKey'
+
+    def test_incomplete_container_falls_back_to_apikey(self):
+        """The API key is used when IC_AUTH_TYPE=container has no trusted profile."""
+        os.environ['IC_AUTH_TYPE'] = 'container'
+
+        authenticator = config.get_authenticator()
+
+        assert isinstance(authenticator, IAMAuthenticator)
+        assert authenticator.token_manager.apikey == 'noAuthAPIKey'
+
+    def test_incomplete_auth_type_without_apikey(self):
+        """Without an API key to fall back to, the configuration error is reported."""
+        os.environ['IC_AUTH_TYPE'] = 'container'
+        del os.environ['IC_API_KEY']
+
+        with self.assertRaises(ValueError) as ctx:
+            config.get_authenticator()
+        assert 'IC_API_KEY' not in str(ctx.exception)
+
+    def test_services_imported_lazily(self):
+        """Importing config does not import any SDK service."""
+        code = (
+            'import sys; import plugins.module_utils.config as config; '
+            'print(sorted(m for m in sys.modules if m.startswith(("ibm_platform_services", "ibm_schematics"))))'
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=root)
+
+        assert output.decode('utf-8').strip() == '[]'
@@ -0,0 +1,221 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from plugins.module_utils import diff
+from .common import make_module
+
+CURRENT = {
+    'name': 'my-instance',
+    'parameters': {'key1': 'value1', 'nested': {'a': 1, 'b': 2}},
+    'allow_cleanup': False,
+    'tags': ['a', 'b'],
+}
+
+
+class TestChanges(unittest.TestCase):
+    """
+    Test class for the diffing of desired and current resources.
+    """
+
+    def test_unchanged(self):
+        """Unmanaged fields and keys added by the service do not differ."""
+        assert diff.changes(CURRENT, {
+            'name': 'my-instance',
+            'parameters': {'nested': {'a': 1}},
+            'allow_cleanup': False,
+            'resource_plan_id': None,
+        }) == {}
+
+    def test_changed(self):
+        """Only the fields that differ are returned."""
+        assert diff.changes(CURRENT, {
+            'name': 'my-instance',
+            'parameters': {'nested': {'a': 2}},
+            'allow_cleanup': True,
+            'tags': ['a'],
+            'resource_plan_id': 'plan',
+        }) == {
+            'parameters': {'nested': {'a': 2}},
+            'allow_cleanup': True,
+            'tags': ['a'],
+            'resource_plan_id': 'plan',
+        }
+
+    def test_differs(self):
+        """A dict differs from a scalar, and a missing key from a value."""
+        assert diff.differs('value', {'a': 1})
+        assert diff.differs({}, {'a': 1})
+        assert not diff.differs({'a': 1}, None)
+
+
+class TestPatched(unittest.TestCase):
+    """
+    Test class for the application of JSON patch operations.
+    """
+
+    def test_operations(self):
+        """The operations apply in order and leave the current resource as it is."""
+        current = {'name': 'old', 'tags': ['a'], 'metadata': {'x': 1}}
+        assert diff.patched(current, [
+            {'op': 'replace', 'path': '/name', 'value': 'new'},
+            {'op': 'add', 'path': '/tags/-', 'value': 'b'},
+            {'op': 'remove', 'path': '/metadata/x'},
+            {'op': 'copy', 'from_': '/name', 'path': '/label'},
+        ]) == {'name': 'new', 'tags': ['a', 'b'], 'metadata': {}, 'label': 'new'}
+        assert current == {'name': 'old', 'tags': ['a'], 'metadata': {'x': 1}}
+
+    def test_unresolved(self):
+        """An operation whose path does not resolve is left out."""
+        assert diff.patched({'name': 'old'}, [
+            {'op': 'replace', 'path': '/missing/key', 'value': 1},
+            {'op': 'move', 'from_': '/name', 'path': '/label'},
+        ]) == {'label': 'old'}
+
+
+class TestCheckMode(unittest.TestCase):
+    """
+    Test class for the check mode and diff of the resource modules.
+    """
+
+    def make_module(self, check_mode, diff_mode=True):
+        module = make_module()
+        module.check_mode = check_mode
+        module._diff = diff_mode
+        module.exit_json.side_effect = SystemExit
+        return module
+
+    def test_check_update(self):
+        """In check mode, the resource as it would be updated is returned with its diff."""
+        module = self.make_module(True)
+        with self.assertRaises(SystemExit):
+            diff.check_update(module, CURRENT, {'name': 'renamed', 'allow_cleanup': None})
+        after = dict(CURRENT, name='renamed')
+        module.exit_json.assert_called_once_with(
+            changed=True, msg=after, diff=dict(before=CURRENT, after=after))
+
+    def test_check_update_unchanged(self):
+        """Nothing to update exits unchanged, in check mode too."""
+        module = self.make_module(True)
+        with self.assertRaises(SystemExit):
+            diff.check_update(module, CURRENT, {'name': 'my-instance'})
+        module.exit_json.assert_called_once_with(changed=False, msg=CURRENT)
+
+    def test_check_update_not_check_mode(self):
+        """Outside of check mode, the module goes on with the update."""
+        module = self.make_module(False)
+        diff.check_update(module, CURRENT, {'name': 'renamed'})
+        module.exit_json.assert_not_called()
+
+    def test_check_create(self):
+        """Options that are not set are left out of a resource to create."""
+        module = self.make_module(True)
+        with self.assertRaises(SystemExit):
+            diff.exit_if_check_mode(module, {}, {'name': 'new', 'tags': None})
+        module.exit_json.assert_called_once_with(
+            changed=True, msg={'name': 'new'}, diff=dict(before={}, after={'name': 'new'}))
+
+    def test_check_delete(self):
+        """A resource to delete is returned with the given payload."""
+        module = self.make_module(True, diff_mode=False)
+        payload = {'id': 'id', 'status': 'deleted'}
+        with self.assertRaises(SystemExit):
+            diff.exit_if_check_mode(module, CURRENT, {}, payload)
+        module.exit_json.assert_called_once_with(changed=True, msg=payload)
+
+
+class TestConditionalUpdate(unittest.TestCase):
+    """
+    Test class for the conditional updates of the resource modules.
+    """
+
+    def make_module(self):
+        module = make_module()
+        module.check_mode = False
+        module._diff = False
+        module.exit_json.side_effect = SystemExit
+        module.fail_json.side_effect = SystemExit
+        return module
+
+    def test_update(self):
+        """The write is conditional on the ETag of the existence check."""
+        module = self.make_module()
+        writes = []
+
+        def write(current, etag):
+            writes.append(etag)
+            return DetailedResponse(response={'name': 'renamed'})
+
+        with self.assertRaises(SystemExit):
+            diff.conditional_update(module, CURRENT, '1-a', {'name': 'renamed'}, None, write)
+        assert writes == ['1-a']
+        module.exit_json.assert_called_once_with(changed=True, msg={'name': 'renamed'})
+
+    def test_precondition_failed(self):
+        """A stale ETag rereads the resource and retries the write once."""
+        module = self.make_module()
+        writes = []
+
+        def write(current, etag):
+            writes.append(etag)
+            if len(writes) == 1:
+                raise ApiException(412, message='Precondition failed')
+            return DetailedResponse(response={'name': 'renamed'})
+
+        def read():
+            return DetailedResponse(response=dict(CURRENT, description='new'), headers={'ETag': '2-b'})
+
+        with self.assertRaises(SystemExit):
+            diff.conditional_update(module, CURRENT, '1-a', {'name': 'renamed'}, read, write)
+        assert writes == ['1-a', '2-b']
+        module.exit_json.assert_called_once_with(changed=True, msg={'name': 'renamed'})
+
+    def test_precondition_failed_unchanged(self):
+        """No write is retried when the reread resource is already as desired."""
+        module = self.make_module()
+        renamed = dict(CURRENT, name='renamed')
+
+        def write(current, etag):
+            raise ApiException(412, message='Precondition failed')
+
+        def read():
+            return DetailedResponse(response=renamed, headers={'ETag': '2-b'})
+
+        with self.assertRaises(SystemExit):
+            diff.conditional_update(module, CURRENT, '1-a', {'name': 'renamed'}, read, write)
+        module.exit_json.assert_called_once_with(changed=False, msg=renamed)
+
+    def test_precondition_failed_twice(self):
+        """The write is retried once only, and not at all without retry."""
+        for retry, writes_expected in ((True, 2), (False, 1)):
+            module = self.make_module()
+            writes = []
+
+            def write(current, etag):
+                writes.append(etag)
+                raise ApiException(412, message='Precondition failed')
+
+            def read():
+                return DetailedResponse(response=CURRENT, headers={'ETag': '2-b'})
+
+            with self.assertRaises(SystemExit):
+                diff.conditional_update(module, CURRENT, '1-a', {'name': 'renamed'}, read, write, retry=retry)
+            assert len(writes) == writes_expected
+            module.fail_json.assert_called_once_with(msg='Precondition failed')
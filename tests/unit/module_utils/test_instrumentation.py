@@ -0,0 +1,174 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import requests
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+
+from .common import StubServer, make_module
+from plugins.module_utils import config
+from plugins.module_utils.instrumentation import CallRecorder
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Test class for the HTTP call instrumentation of the SDK clients.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
+    def setUp(self):
+        self.server.reset()
+        patcher = patch.object(config, 'get_authenticator', return_value=NoAuthAuthenticator())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sleep_patcher = patch('time.sleep')
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+        self.recorder = CallRecorder()
+        recorder_patcher = patch.object(config, '_call_recorder', self.recorder)
+        recorder_patcher.start()
+        self.addCleanup(recorder_patcher.stop)
+        self.addCleanup(config._registry.clear)
+
+    def configure(self, **params):
+        module = make_module(**params)
+        config.configure(module)
+        config._registry.clear()
+        sdk = config.get_resource_manager_sdk()
+        sdk.set_service_url(self.server.url)
+        return module, sdk
+
+    def test_calls_recorded(self):
+        """Every call is recorded with its path template, status, sizes and retries."""
+        self.server.reset([(503, {}, {}), (200, {}, {'id': 'abc'})])
+        module, sdk = self.configure(record_api_calls=True, retry_jitter=0.0)
+
+        sdk.get_resource_group(id='abc')
+        with self.assertRaises(ApiException):
+            self.server.reset([(409, {}, {'message': 'conflict'})])
+            sdk.create_resource_group(name='test')
+
+        calls = self.recorder.calls
+        assert len(calls) == 2
+        assert calls[0]['service'] == 'resource_manager'
+        assert calls[0]['operation'] == 'get_resource_group'
+        assert calls[0]['method'] == 'GET'
+        assert calls[0]['path'] == '/v2/resource_groups/{}'
+        assert calls[0]['status'] == 200
+        assert calls[0]['retries'] == 1
+        assert calls[0]['request_bytes'] == 0
+        assert calls[0]['response_bytes'] == len('{"id": "abc"}')
+
+        assert calls[1]['operation'] == 'create_resource_group'
+        assert calls[1]['method'] == 'POST'
+        assert calls[1]['path'] == '/v2/resource_groups'
+        assert calls[1]['status'] == 409
+        assert calls[1]['retries'] == 0
+        assert calls[1]['request_bytes'] == len('{"name": "test"}')
+
+    def test_encoded_path_parameters(self):
+        """Path parameters are replaced in the template after their encoding."""
+        self.server.reset([(200, {}, {'id': 'a/b c'})])
+        module, sdk = self.configure(record_api_calls=True)
+
+        sdk.get_resource_group(id='a/b c')
+
+        call = self.recorder.calls[0]
+        assert call['operation'] == 'get_resource_group'
+        assert call['path'] == '/v2/resource_groups/{}'
+
+    def test_calls_in_module_result(self):
+        """The summary is always returned, the calls only on request."""
+        exit_json = MagicMock()
+        module = make_module()
+        module.exit_json = exit_json
+        config.configure(module)
+        config._registry.clear()
+        config.get_resource_manager_sdk().set_service_url(self.server.url)
+        config.get_resource_manager_sdk().list_resource_groups()
+
+        module.exit_json(msg='ok')
+
+        result = exit_json.call_args.kwargs
+        assert result['api_calls_summary']['count'] == 1
+        assert result['api_calls_summary']['total_time'] >= 0
+        assert '_api_calls' not in result
+
+        fail_json = MagicMock()
+        module = make_module(record_api_calls=True)
+        module.fail_json = fail_json
+        config.configure(module)
+        config.get_resource_manager_sdk().list_resource_groups()
+
+        module.fail_json(msg='failed')
+
+        result = fail_json.call_args.kwargs
+        assert result['api_calls_summary']['count'] == 2
+        assert [c['operation'] for c in result['_api_calls']] == ['list_resource_groups']
+
+    def token_manager(self, status, body):
+        """A token manager whose requests get the response given."""
+        def request(method, url, hooks=None, **kwargs):
+            response = requests.Response()
+            response.status_code = status
+            response._content = body
+            for hook in hooks['response']:
+                hook(response)
+            if status >= 300:
+                raise ApiException(status, http_response=response)
+            return response.json()
+
+        token_manager = MagicMock()
+        token_manager._request.side_effect = request
+        self.recorder.detailed = True
+        return self.recorder.instrument_token_manager(token_manager, 'iam')
+
+    def test_token_requests_recorded(self):
+        """Token exchanges with IAM are recorded as calls of the iam service."""
+        body = b'{"access_token": "token"}'
+        token_manager = self.token_manager(200, body)
+
+        token_manager._request(method='POST', url='https://iam.cloud.ibm.com/identity/token', data={'apikey': 'x'})
+
+        call = self.recorder.calls[0]
+        assert call['service'] == 'iam'
+        assert call['path'] == '/identity/token'
+        assert call['status'] == 200
+        assert call['request_bytes'] == len('apikey=x')
+        assert call['response_bytes'] == len(body)
+
+    def test_failed_token_requests_recorded(self):
+        """Token exchanges IAM rejects are recorded with their status."""
+        body = b'{"errorMessage": "Provided API key could not be found."}'
+        token_manager = self.token_manager(400, body)
+
+        with self.assertRaises(ApiException):
+            token_manager._request(method='POST', url='https://iam.cloud.ibm.com/identity/token', data={'apikey': 'x'})
+
+        call = self.recorder.calls[0]
+        assert call['status'] == 400
+        assert call['response_bytes'] == len(body)
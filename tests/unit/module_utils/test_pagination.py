@@ -0,0 +1,303 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import gzip
+import hashlib
+import os
+import tempfile
+import unittest
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock
+
+from .common import make_module
+from plugins.module_utils import pagination
+
+
+def start_token_pages(items):
+    """Returns a mocked list method paging items with start tokens."""
+    def list_method(start=None, limit=None, **kwargs):
+        offset = int(start or 0)
+        limit = limit or 10
+        result = {'resources': items[offset:offset + limit], 'next_url': None}
+        if offset + limit < len(items):
+            result['next_url'] = '/v2/resource_instances?limit=%d&start=%d' % (limit, offset + limit)
+        return DetailedResponse(response=result)
+    return MagicMock(side_effect=list_method)
+
+
+def offset_pages(items, total_count=True):
+    """Returns a mocked list method paging items with offsets."""
+    def list_method(offset=None, limit=None, **kwargs):
+        offset = offset or 0
+        limit = limit or 10
+        result = {'offset': offset, 'limit': limit, 'groups': items[offset:offset + limit]}
+        if total_count:
+            result['total_count'] = len(items)
+        return DetailedResponse(response=result)
+    return MagicMock(side_effect=list_method)
+
+
+class TestStartTokenPager(unittest.TestCase):
+    """
+    Test class for the start token pagination.
+    """
+
+    def test_all_pages(self):
+        """The next_url of every page is followed until the last one."""
+        list_method = start_token_pages(list(range(25)))
+        pager = pagination.StartTokenPager(list_method, 'resources', page_size=10, guid='guid')
+
+        assert list(pager.items()) == list(range(25))
+        assert pager.pages_fetched == 3
+        assert [c.kwargs['start'] for c in list_method.call_args_list] == [None, '10', '20']
+        assert all(c.kwargs['limit'] == 10 for c in list_method.call_args_list)
+        assert all(c.kwargs['guid'] == 'guid' for c in list_method.call_args_list)
+
+    def test_start(self):
+        """Paging starts at the given token."""
+        list_method = start_token_pages(list(range(25)))
+        pager = pagination.StartTokenPager(list_method, 'resources', token='20')
+
+        assert list(pager.items()) == list(range(20, 25))
+        assert pager.pages_fetched == 1
+
+    def test_max_items(self):
+        """No page is fetched once max_items items were returned, and pages are no larger than max_items."""
+        list_method = start_token_pages(list(range(25)))
+        pager = pagination.StartTokenPager(list_method, 'resources', page_size=10)
+
+        assert list(pager.items(max_items=15)) == list(range(15))
+        assert pager.pages_fetched == 2
+
+        pager = pagination.StartTokenPager(list_method, 'resources', page_size=10)
+        assert list(pager.items(max_items=5)) == list(range(5))
+        assert list_method.call_args.kwargs['limit'] == 5
+        assert list(pager.items(max_items=0)) == []
+        assert pager.pages_fetched == 1
+
+    def test_exists(self):
+        """exists fetches a single item."""
+        list_method = start_token_pages(list(range(25)))
+
+        assert pagination.StartTokenPager(list_method, 'resources', page_size=10).exists()
+        assert list_method.call_args.kwargs['limit'] == 1
+        assert not pagination.StartTokenPager(start_token_pages([]), 'resources').exists()
+
+    def test_count(self):
+        """Without a total count the items are counted in pages of the largest size."""
+        list_method = start_token_pages(list(range(250)))
+        pager = pagination.StartTokenPager(list_method, 'resources')
+
+        assert pager.count() == 250
+        assert pager.pages_fetched == 3
+        assert all(c.kwargs['limit'] == pagination.MAX_PAGE_SIZE for c in list_method.call_args_list)
+
+
+class TestPageTokenPager(unittest.TestCase):
+    """
+    Test class for the page token pagination.
+    """
+
+    def test_all_pages(self):
+        """The page token of the next URL of every page is followed until the last one."""
+        pages = [
+            {'serviceids': [1, 2], 'next': 'https://iam.cloud.ibm.com/v1/serviceids?pagetoken=abc&pagesize=2'},
+            {'serviceids': [3]},
+        ]
+        list_method = MagicMock(side_effect=[DetailedResponse(response=page) for page in pages])
+        pager = pagination.PageTokenPager(list_method, 'serviceids', page_size=2, account_id='account')
+
+        assert list(pager.items()) == [1, 2, 3]
+        assert [c.kwargs['pagetoken'] for c in list_method.call_args_list] == [None, 'abc']
+        assert all(c.kwargs['pagesize'] == 2 for c in list_method.call_args_list)
+
+
+class TestOffsetPager(unittest.TestCase):
+    """
+    Test class for the offset pagination.
+    """
+
+    def test_all_pages(self):
+        """The pages after the first are fetched in parallel and merged in order."""
+        list_method = offset_pages(list(range(95)))
+        pager = pagination.OffsetPager(list_method, 'groups', page_size=10, workers=4, account_id='account')
+
+        assert list(pager.items()) == list(range(95))
+        assert pager.pages_fetched == 10
+        assert sorted(c.kwargs['offset'] for c in list_method.call_args_list) == list(range(0, 95, 10))
+        assert all(c.kwargs['account_id'] == 'account' for c in list_method.call_args_list)
+
+    def test_bounded_window(self):
+        """No more than workers pages are fetched ahead of the page consumed."""
+        list_method = offset_pages(list(range(95)))
+        pager = pagination.OffsetPager(list_method, 'groups', page_size=10, workers=2)
+
+        pages = pager.pages()
+        next(pages)
+        next(pages)
+        assert list_method.call_count <= 4
+        pages.close()
+        assert list_method.call_count <= 4
+
+    def test_offset(self):
+        """Paging starts at the given offset and uses the page size of the server."""
+        list_method = offset_pages(list(range(95)))
+        pager = pagination.OffsetPager(list_method, 'groups', offset=50)
+
+        assert list(pager.items()) == list(range(50, 95))
+        assert pager.pages_fetched == 5
+
+    def test_max_items(self):
+        """Only the pages holding the first max_items items are fetched."""
+        list_method = offset_pages(list(range(95)))
+        pager = pagination.OffsetPager(list_method, 'groups', page_size=10)
+
+        assert list(pager.items(max_items=25)) == list(range(25))
+        assert sorted(c.kwargs['offset'] for c in list_method.call_args_list) == [0, 10, 20]
+
+    def test_max_items_with_predicate(self):
+        """With a predicate, max_items counts the matching items only."""
+        list_method = offset_pages(list(range(95)))
+        pager = pagination.OffsetPager(list_method, 'groups', page_size=10, predicate=lambda item: item % 10 == 0)
+
+        assert list(pager.items(max_items=5)) == [0, 10, 20, 30, 40]
+
+        list_method = offset_pages(list(range(30)), total_count=False)
+        pager = pagination.OffsetPager(list_method, 'groups', page_size=10, predicate=lambda item: item >= 20)
+
+        assert list(pager.items(max_items=5)) == [20, 21, 22, 23, 24]
+
+    def test_without_total_count(self):
+        """Without a total_count the pages are fetched until a short page."""
+        list_method = offset_pages(list(range(30)), total_count=False)
+        pager = pagination.OffsetPager(list_method, 'groups', page_size=10)
+
+        assert list(pager.items()) == list(range(30))
+        assert [c.kwargs['offset'] for c in list_method.call_args_list] == [0, 10, 20, 30]
+
+    def test_count(self):
+        """The count is read from the total_count of a single item page."""
+        list_method = offset_pages(list(range(95)))
+
+        assert pagination.OffsetPager(list_method, 'groups', offset=50, page_size=10).count() == 45
+        list_method.assert_called_once()
+        assert list_method.call_args.kwargs['limit'] == 1
+
+    def test_count_without_total_count(self):
+        """Without a total_count the items are counted page by page."""
+        list_method = offset_pages(list(range(30)), total_count=False)
+
+        assert pagination.OffsetPager(list_method, 'groups').count() == 30
+
+
+class TestExitJson(unittest.TestCase):
+    """
+    Test class for the results of the list modules.
+    """
+
+    def exit_json(self, module, pager):
+        module.exit_json.side_effect = SystemExit
+        with self.assertRaises(SystemExit):
+            pagination.exit_json(module, pager)
+
+    def test_items(self):
+        """The items come with the number of pages fetched."""
+        module = make_module(max_items=None, results_only=False, output_file=None)
+
+        self.exit_json(module, pagination.StartTokenPager(start_token_pages(list(range(25))), 'resources'))
+
+        module.exit_json.assert_called_once_with(msg={'items': list(range(25)), 'pages_fetched': 3})
+
+    def test_results_only(self):
+        """results_only returns the plain list of items."""
+        module = make_module(max_items=12, results_only=True, output_file=None)
+
+        self.exit_json(module, pagination.StartTokenPager(start_token_pages(list(range(25))), 'resources'))
+
+        module.exit_json.assert_called_once_with(msg=list(range(12)))
+
+    def test_count_only(self):
+        """count_only returns the number of items."""
+        module = make_module(count_only=True)
+
+        self.exit_json(module, pagination.OffsetPager(offset_pages(list(range(95))), 'groups'))
+
+        module.exit_json.assert_called_once_with(msg=95)
+
+    def test_exists_only(self):
+        """exists_only returns whether there is any item."""
+        module = make_module(exists_only=True)
+
+        self.exit_json(module, pagination.StartTokenPager(start_token_pages([]), 'resources'))
+
+        module.exit_json.assert_called_once_with(msg=False)
+
+    def test_fields(self):
+        """The items are projected on the fields option."""
+        module = make_module(max_items=None, results_only=True, output_file=None, fields=['id'])
+
+        self.exit_json(module, pagination.StartTokenPager(
+            start_token_pages([{'id': i, 'name': 'item-%d' % i} for i in range(3)]), 'resources'))
+
+        module.exit_json.assert_called_once_with(msg=[{'id': 0}, {'id': 1}, {'id': 2}])
+
+    def test_output_file(self):
+        """output_file writes the items as JSON lines and returns the path, count and checksum."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'items.jsonl')
+            module = make_module(max_items=None, results_only=False, output_file=path)
+
+            self.exit_json(module, pagination.StartTokenPager(
+                start_token_pages([{'id': i} for i in range(3)]), 'resources'))
+
+            content = b'{"id": 0}\n{"id": 1}\n{"id": 2}\n'
+            module.exit_json.assert_called_once_with(changed=True, msg={
+                'path': path, 'count': 3, 'checksum': hashlib.sha256(content).hexdigest(), 'pages_fetched': 1})
+            with open(path, 'rb') as f:
+                assert f.read() == content
+
+    def test_output_file_gzip(self):
+        """An output_file ending with .gz is gzip compressed, the same items giving the same file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'items.jsonl.gz')
+            items = [{'id': i} for i in range(3)]
+
+            count, checksum = pagination.write_items(iter(items), path)
+
+            assert count == 3
+            with open(path, 'rb') as f:
+                assert hashlib.sha256(f.read()).hexdigest() == checksum
+            with gzip.open(path, 'rt') as f:
+                assert f.read() == '{"id": 0}\n{"id": 1}\n{"id": 2}\n'
+            assert pagination.write_items(iter(items), path) == (count, checksum)
+
+    def test_write_items_atomic(self):
+        """A failed listing leaves the previous file in place."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'items.jsonl')
+            assert pagination.write_items(iter([{'id': 1}]), path)[0] == 1
+
+            def failing_items():
+                yield {'id': 2}
+                raise RuntimeError('page failed')
+            with self.assertRaises(RuntimeError):
+                pagination.write_items(failing_items(), path)
+
+            with open(path) as f:
+                assert f.read() == '{"id": 1}\n'
+            assert os.listdir(tmpdir) == ['items.jsonl']
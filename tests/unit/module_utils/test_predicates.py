@@ -0,0 +1,93 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock
+
+from plugins.module_utils import pagination, predicates
+
+ITEMS = [
+    {'id': '1', 'name': 'db-prod', 'state': 'active', 'tags': ['env:prod', 'team:a'],
+     'crn': 'crn:v1:bluemix:public:cloudantnosqldb:us-south:a/account:1::'},
+    {'id': '2', 'name': 'db-dev', 'state': 'active', 'tags': ['env:dev'],
+     'crn': 'crn:v1:bluemix:public:cloudantnosqldb:eu-de:a/account:2::'},
+    {'id': '3', 'name': 'cos-prod', 'state': 'inactive', 'tags': ['env:prod'],
+     'crn': 'crn:v1:bluemix:public:cloud-object-storage:global:a/account:3::'},
+]
+
+
+def matching(filters, list_args=None):
+    predicate = predicates.apply(filters, {} if list_args is None else list_args)
+    return [item['id'] for item in ITEMS if predicate(item)]
+
+
+class TestApply(unittest.TestCase):
+    """
+    Test class for the filters of the resource list modules.
+    """
+
+    def test_server_side(self):
+        """Filters the list operation takes are sent to the server."""
+        list_args = {'resource_group_id': None, 'state': None, 'name': None}
+
+        predicate = predicates.apply({'resource_group_id': 'group', 'state': 'active', 'type': None}, list_args)
+
+        assert predicate is None
+        assert list_args == {'resource_group_id': 'group', 'state': 'active', 'name': None}
+
+    def test_conflict(self):
+        """A filter conflicting with the option of the same name is an error."""
+        with self.assertRaises(ValueError):
+            predicates.apply({'resource_group_id': 'group'}, {'resource_group_id': 'other'})
+        with self.assertRaises(ValueError):
+            predicates.apply({'name': '('}, {})
+
+    def test_client_side(self):
+        """The other filters are checked on the items."""
+        assert matching({'state': 'active'}) == ['1', '2']
+        assert matching({'name': '^db-'}) == ['1', '2']
+        assert matching({'tags': ['env:prod']}) == ['1', '3']
+        assert matching({'tags': ['env:prod', 'team:a']}) == ['1']
+        assert matching({'region': 'global'}) == ['3']
+        assert matching({'name': 'prod', 'region': 'us-south', 'tags': None}) == ['1']
+
+    def test_region(self):
+        """The region is the sixth part of a CRN."""
+        assert predicates.region(ITEMS[1]['crn']) == 'eu-de'
+        assert predicates.region('not a crn') is None
+        assert predicates.region(None) is None
+
+    def test_filter_page(self):
+        """Only the matching items of a page are kept."""
+        page = {'rows_count': 3, 'next_url': None, 'resources': ITEMS}
+        predicate = predicates.apply({'name': 'prod'}, {})
+
+        assert predicates.filter_page(page, 'resources', predicate) == {
+            'rows_count': 3, 'next_url': None, 'resources': [ITEMS[0], ITEMS[2]]}
+        assert predicates.filter_page(page, 'resources', None) is page
+
+    def test_pager(self):
+        """Pagers only yield and count the matching items, without shrinking pages for max_items."""
+        list_method = MagicMock(return_value=DetailedResponse(response={'resources': ITEMS, 'next_url': None}))
+        predicate = predicates.apply({'tags': ['env:prod']}, {})
+
+        assert list(pagination.StartTokenPager(list_method, 'resources', predicate=predicate).items(1)) == [ITEMS[0]]
+        assert list_method.call_args.kwargs['limit'] is None
+        assert 'predicate' not in list_method.call_args.kwargs
+        assert pagination.StartTokenPager(list_method, 'resources', predicate=predicate).count() == 2
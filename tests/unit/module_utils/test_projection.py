@@ -0,0 +1,109 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+from .common import make_module
+from plugins.module_utils import projection
+
+INSTANCE = {
+    'id': 'crn:v1:instance',
+    'name': 'my-instance',
+    'extensions': {'endpoints': {'public': 'https://public', 'private': 'https://private'}, 'big': 'x' * 100},
+    'last_operation': {'type': 'create', 'state': 'succeeded'},
+    'plan_history': [{'resource_plan_id': 'plan-1', 'start_date': 'a'}, {'resource_plan_id': 'plan-2', 'start_date': 'b'}],
+}
+
+
+class TestProject(unittest.TestCase):
+    """
+    Test class for the projection of results on field paths.
+    """
+
+    def test_no_fields(self):
+        """Without fields the value is returned as it is."""
+        assert projection.project(INSTANCE, None) is INSTANCE
+        assert projection.project(INSTANCE, []) is INSTANCE
+
+    def test_top_level(self):
+        """Top level fields keep their whole values, missing ones are left out."""
+        assert projection.project(INSTANCE, ['id', 'last_operation', 'missing']) == {
+            'id': 'crn:v1:instance', 'last_operation': {'type': 'create', 'state': 'succeeded'}}
+
+    def test_dotted(self):
+        """Dotted paths keep the nesting of the selected values."""
+        assert projection.project(INSTANCE, ['name', 'extensions.endpoints.public', 'last_operation.state']) == {
+            'name': 'my-instance',
+            'extensions': {'endpoints': {'public': 'https://public'}},
+            'last_operation': {'state': 'succeeded'},
+        }
+
+    def test_lists(self):
+        """Lists are projected element by element, with or without []."""
+        expected = {'plan_history': [{'resource_plan_id': 'plan-1'}, {'resource_plan_id': 'plan-2'}]}
+        assert projection.project(INSTANCE, ['plan_history[].resource_plan_id']) == expected
+        assert projection.project(INSTANCE, ['plan_history.resource_plan_id']) == expected
+        assert projection.project([INSTANCE], ['id']) == [{'id': 'crn:v1:instance'}]
+
+    def test_wildcard(self):
+        """* matches every key and merges with the other paths."""
+        assert projection.project(INSTANCE, ['extensions.*.private', 'extensions.big']) == {
+            'extensions': {'endpoints': {'private': 'https://private'}, 'big': 'x' * 100}}
+
+    def test_overlapping(self):
+        """A whole value wins over a path into it."""
+        assert projection.project(INSTANCE, ['last_operation.state', 'last_operation']) == {
+            'last_operation': {'type': 'create', 'state': 'succeeded'}}
+        assert projection.project(INSTANCE, ['last_operation', 'last_operation.state']) == {
+            'last_operation': {'type': 'create', 'state': 'succeeded'}}
+
+    def test_scalar(self):
+        """A path into a scalar keeps the scalar."""
+        assert projection.project(INSTANCE, ['name.first']) == {'name': 'my-instance'}
+
+
+class TestExitJson(unittest.TestCase):
+    """
+    Test class for the results of the info modules.
+    """
+
+    def test_resource(self):
+        """A single resource is projected as a whole."""
+        module = make_module(fields=['id'])
+
+        projection.exit_json(module, INSTANCE)
+
+        module.exit_json.assert_called_once_with(msg={'id': 'crn:v1:instance'})
+
+    def test_page(self):
+        """The items of a page are projected and the rest of the page is kept."""
+        module = make_module(fields=['id'])
+        page = {'rows_count': 1, 'next_url': None, 'resources': [INSTANCE]}
+
+        projection.exit_json(module, page, 'resources')
+
+        module.exit_json.assert_called_once_with(
+            msg={'rows_count': 1, 'next_url': None, 'resources': [{'id': 'crn:v1:instance'}]})
+        assert page['resources'] == [INSTANCE]
+
+    def test_no_fields(self):
+        """Without fields the result is returned as it is."""
+        module = make_module(fields=None)
+
+        projection.exit_json(module, INSTANCE, 'resources')
+
+        module.exit_json.assert_called_once_with(msg=INSTANCE)
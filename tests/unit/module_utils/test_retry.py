@@ -0,0 +1,137 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+
+from .common import StubServer, make_module
+from plugins.module_utils import config
+from plugins.module_utils.retry import RetryStats, SDKRetry
+
+
+class TestRetry(unittest.TestCase):
+    """
+    Test class for the retry policy of the shared HTTP session.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
+    def setUp(self):
+        self.server.reset()
+        patcher = patch.object(config, 'get_authenticator', return_value=NoAuthAuthenticator())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sleep_patcher = patch('time.sleep')
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+        self.stats = RetryStats()
+        stats_patcher = patch.object(config, '_retry_stats', self.stats)
+        stats_patcher.start()
+        self.addCleanup(stats_patcher.stop)
+        self.configure(retry_jitter=0.0)
+        self.addCleanup(config._registry.clear)
+
+    def configure(self, **params):
+        config.configure(make_module(**params))
+        config._registry.clear()
+        sdk = config.get_resource_manager_sdk()
+        sdk.set_service_url(self.server.url)
+        return sdk
+
+    def test_get_retried_after_retry_after(self):
+        """A throttled GET is retried after the Retry-After delay."""
+        self.server.reset([(429, {'Retry-After': '2'}, {}), (503, {}, {})])
+        sdk = self.configure(retry_jitter=0.0, retry_backoff_base=0.5)
+
+        result = sdk.list_resource_groups().get_result()
+
+        assert result == {'resources': []}
+        assert [r[0] for r in self.server.requests] == ['GET', 'GET', 'GET']
+        assert self.stats.to_dict() == dict(count=2, wait_time=3.0)
+        assert [c.args[0] for c in self.sleep.call_args_list] == [2, 1.0]
+
+    def test_retry_after_capped(self):
+        """A Retry-After delay longer than retry_backoff_max waits retry_backoff_max."""
+        self.server.reset([(429, {'Retry-After': '3600'}, {})])
+        sdk = self.configure(retry_jitter=0.0, retry_backoff_max=5.0)
+
+        result = sdk.list_resource_groups().get_result()
+
+        assert result == {'resources': []}
+        assert [c.args[0] for c in self.sleep.call_args_list] == [5.0]
+        assert self.stats.to_dict() == dict(count=1, wait_time=5.0)
+
+    def test_post_not_retried(self):
+        """A POST is never retried, it may not be idempotent."""
+        self.server.reset([(503, {}, {})])
+        sdk = self.configure(retry_jitter=0.0)
+
+        with self.assertRaises(ApiException) as ex:
+            sdk.create_resource_group(name='test')
+
+        assert ex.exception.status_code == 503
+        assert [r[0] for r in self.server.requests] == ['POST']
+        assert self.stats.count == 0
+
+    def test_retries_exhausted(self):
+        """The last error surfaces once max_retries is used up."""
+        self.server.reset([(503, {}, {})] * 3)
+        sdk = self.configure(max_retries=2, retry_jitter=0.0)
+
+        with self.assertRaises(ApiException) as ex:
+            sdk.list_resource_groups()
+
+        assert ex.exception.status_code == 503
+        assert len(self.server.requests) == 3
+        assert self.stats.count == 2
+
+    def test_backoff_capped(self):
+        """The exponential backoff never exceeds retry_backoff_max plus jitter."""
+        retry = SDKRetry.from_options(10, 1.0, 5.0, 0.0)
+        for dummy in range(6):
+            retry = retry.increment(method='GET', url='/', error=None, response=MagicMock(status=503, headers={}))
+
+        assert retry.get_backoff_time() == 5.0
+
+        jittered = SDKRetry.from_options(10, 1.0, 5.0, 2.0).new(history=retry.history)
+        assert 5.0 <= jittered.get_backoff_time() <= 7.0
+
+    def test_stats_in_module_result(self):
+        """configure() adds the retry statistics to exit_json and fail_json."""
+        self.stats.count = 3
+        self.stats.wait_time = 1.5
+        module = make_module()
+        exit_json = module.exit_json
+        fail_json = module.fail_json
+        config.configure(module)
+
+        module.exit_json(msg='ok')
+        module.fail_json(msg='failed')
+
+        assert exit_json.call_args.kwargs['msg'] == 'ok'
+        assert exit_json.call_args.kwargs['retries'] == dict(count=3, wait_time=1.5)
+        assert fail_json.call_args.kwargs['msg'] == 'failed'
+        assert fail_json.call_args.kwargs['retries'] == dict(count=3, wait_time=1.5)
@@ -0,0 +1,135 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+from datetime import datetime, timezone
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import MagicMock, patch
+
+from plugins.module_utils import pagination, sync
+
+FILTERS = {'resource_group_id': 'group', 'updated_from': None}
+
+
+def pagers(*answers):
+    """Returns a mocked pager factory whose pagers list the given items, and the list method."""
+    list_method = MagicMock(side_effect=[
+        DetailedResponse(response={'resources': items, 'next_url': None}) for items in answers])
+
+    def new_pager(**kwargs):
+        return pagination.StartTokenPager(list_method, 'resources', **dict(FILTERS, **kwargs))
+    return new_pager, list_method
+
+
+def at(*args):
+    return patch('plugins.module_utils.sync._now', return_value=datetime(*args, tzinfo=timezone.utc))
+
+
+class TestSync(unittest.TestCase):
+    """
+    Test class for the delta sync of list snapshots.
+    """
+
+    def test_full_sync(self):
+        """Without a state all the items are listed and the time of the run is the watermark."""
+        new_pager, list_method = pagers([{'id': 'a', 'name': 'A'}, {'id': 'b', 'name': 'B'}])
+
+        with at(2022, 5, 1, 12, 0, 0):
+            state, summary = sync.sync(None, FILTERS, new_pager)
+
+        assert state == {
+            'version': 1,
+            'watermark': '2022-05-01T12:00:00Z',
+            'filters': FILTERS,
+            'fields': None,
+            'items': {'a': {'id': 'a', 'name': 'A'}, 'b': {'id': 'b', 'name': 'B'}},
+        }
+        assert summary == {
+            'watermark': '2022-05-01T12:00:00Z', 'full_sync': True, 'count': 2,
+            'updated': 2, 'removed': 0, 'pages_fetched': 1,
+        }
+        assert list_method.call_args.kwargs['updated_from'] is None
+
+    def test_delta(self):
+        """Only the changes since the watermark are listed and merged into the snapshot."""
+        previous = {
+            'version': 1,
+            'watermark': '2022-05-01T12:00:00Z',
+            'filters': FILTERS,
+            'fields': None,
+            'items': {'a': {'id': 'a', 'name': 'A'}, 'b': {'id': 'b', 'name': 'B'}, 'c': {'id': 'c', 'name': 'C'}},
+        }
+        new_pager, list_method = pagers(
+            [{'id': 'a', 'name': 'A'}, {'id': 'b', 'name': 'B2'}, {'id': 'd', 'name': 'D'}],
+            [{'id': 'c', 'name': 'C'}, {'id': 'e', 'name': 'E'}])
+
+        with at(2022, 5, 1, 12, 10, 0):
+            state, summary = sync.sync(previous, FILTERS, new_pager)
+
+        assert state['items'] == {'a': {'id': 'a', 'name': 'A'}, 'b': {'id': 'b', 'name': 'B2'}, 'd': {'id': 'd', 'name': 'D'}}
+        assert state['watermark'] == '2022-05-01T12:10:00Z'
+        assert summary == {
+            'watermark': '2022-05-01T12:10:00Z', 'full_sync': False, 'count': 3,
+            'updated': 2, 'removed': 1, 'pages_fetched': 2,
+        }
+        calls = list_method.call_args_list
+        assert [c.kwargs['updated_from'] for c in calls] == ['2022-05-01T11:55:00Z'] * 2
+        assert [c.kwargs.get('state') for c in calls] == [None, 'removed']
+        assert all(c.kwargs['resource_group_id'] == 'group' for c in calls)
+        assert previous['items']['b'] == {'id': 'b', 'name': 'B'}
+
+    def test_predicate(self):
+        """Items updated so that they no longer match the predicate are dropped."""
+        previous = {
+            'version': 1,
+            'watermark': '2022-05-01T12:00:00Z',
+            'filters': FILTERS,
+            'fields': None,
+            'items': {'a': {'id': 'a', 'state': 'active'}},
+        }
+        new_pager, list_method = pagers([{'id': 'a', 'state': 'inactive'}, {'id': 'b', 'state': 'inactive'}], [])
+
+        state, summary = sync.sync(previous, FILTERS, new_pager, predicate=lambda item: item['state'] == 'active')
+
+        assert state['items'] == {}
+        assert (summary['updated'], summary['removed']) == (0, 1)
+
+    def test_changed_filters(self):
+        """A snapshot taken with other filters or fields is listed in full again."""
+        previous = {
+            'version': 1,
+            'watermark': '2022-05-01T12:00:00Z',
+            'filters': dict(FILTERS, resource_group_id='other'),
+            'fields': None,
+            'items': {'x': {'id': 'x'}},
+        }
+        for state in (previous, dict(previous, filters=FILTERS, fields=['id', 'name'])):
+            new_pager, list_method = pagers([{'id': 'a', 'name': 'A', 'crn': 'crn:a'}])
+
+            new_state, summary = sync.sync(state, FILTERS, new_pager, ['id'])
+
+            assert summary['full_sync'] is True
+            assert new_state['items'] == {'a': {'id': 'a'}}
+            list_method.assert_called_once()
+
+    def test_load_state(self):
+        """Missing, unreadable or other version states are ignored."""
+        assert sync.load_state('/nonexistent/state.json') is None
+        with patch('plugins.module_utils.sync.open', create=True) as mock_open:
+            mock_open.return_value.__enter__.return_value.read.return_value = '{"version": 0}'
+            assert sync.load_state('state.json') is None
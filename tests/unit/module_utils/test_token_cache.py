@@ -0,0 +1,124 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import tempfile
+import time
+import unittest
+
+import jwt
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+
+from plugins.module_utils import token_cache
+
+
+def make_token_response(lifetime=3600):
+    now = int(time.time())
+    access_token = jwt.encode(
+        {'iat': now, 'exp': now + lifetime}, 'x' * 32, algorithm='HS256')
+    return {
+        'access_token': access_token,
+        'refresh_token': 'not-needed',
+        'token_type': 'Bearer',
+        'expires_in': lifetime,
+        'expiration': now + lifetime,
+    }
+
+
+class TestTokenCache(unittest.TestCase):
+    """
+    Test class for the on-disk IAM token cache.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmpdir.name, 'tokens')
+        self.env = patch.dict(os.environ, {
+            'IC_TOKEN_CACHE': 'true',
+            'IC_TOKEN_CACHE_DIR': self.cache_dir,
+        })
+        self.env.start()
+        self.addCleanup(self.env.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def new_token_manager(self, apikey='apikey'):
+        return token_cache.attach(
+            IAMAuthenticator(apikey=apikey).token_manager, apikey)
+
+    def test_token_shared_between_processes(self):
+        """A token fetched by one run is reused by the next one."""
+        response = make_token_response()
+        with patch('ibm_cloud_sdk_core.token_managers.iam_token_manager.IAMTokenManager.request_token') as mock:
+            mock.return_value = response
+            first = self.new_token_manager().get_token()
+            second = self.new_token_manager().get_token()
+
+        assert first == second == response['access_token']
+        mock.assert_called_once()
+
+        files = os.listdir(self.cache_dir)
+        assert len([f for f in files if f.endswith('.json')]) == 1
+        with open(os.path.join(self.cache_dir, [f for f in files if f.endswith('.json')][0])) as f:
+            content = f.read()
+        assert 'apikey' not in content
+        assert 'not-needed' not in content
+        assert os.stat(self.cache_dir).st_mode & 0o777 == 0o700
+
+    def test_token_keyed_by_apikey(self):
+        """Tokens are never shared between different API keys."""
+        with patch('ibm_cloud_sdk_core.token_managers.iam_token_manager.IAMTokenManager.request_token') as mock:
+            mock.side_effect = [make_token_response(), make_token_response()]
+            self.new_token_manager('apikey-1').get_token()
+            self.new_token_manager('apikey-2').get_token()
+
+        assert mock.call_count == 2
+
+    def test_token_near_expiry_not_reused(self):
+        """A token that is about to expire triggers a new exchange."""
+        with patch('ibm_cloud_sdk_core.token_managers.iam_token_manager.IAMTokenManager.request_token') as mock:
+            mock.side_effect = [
+                make_token_response(token_cache.EXPIRY_SKEW - 10),
+                make_token_response(),
+            ]
+            self.new_token_manager().get_token()
+            self.new_token_manager().get_token()
+
+        assert mock.call_count == 2
+
+    def test_cache_disabled(self):
+        """IC_TOKEN_CACHE=false turns the cache off."""
+        os.environ['IC_TOKEN_CACHE'] = 'false'
+        with patch('ibm_cloud_sdk_core.token_managers.iam_token_manager.IAMTokenManager.request_token') as mock:
+            mock.side_effect = [make_token_response(), make_token_response()]
+            self.new_token_manager().get_token()
+            self.new_token_manager().get_token()
+
+        assert mock.call_count == 2
+        assert not os.path.exists(self.cache_dir)
+
+    def test_shared_directory_ignored(self):
+        """A cache directory readable by other users is never trusted."""
+        os.makedirs(self.cache_dir, mode=0o755)
+        os.chmod(self.cache_dir, 0o755)
+        with patch('ibm_cloud_sdk_core.token_managers.iam_token_manager.IAMTokenManager.request_token') as mock:
+            mock.side_effect = [make_token_response(), make_token_response()]
+            self.new_token_manager().get_token()
+            self.new_token_manager().get_token()
+
+        assert mock.call_count == 2
+        assert os.listdir(self.cache_dir) == []
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import sqlite3
+import tempfile
+
+from ibm_cloud_sdk_core import ApiException
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleFailJson, AnsibleExitJson, set_module_args
+
+from plugins.modules import ibm_account_snapshot
+
+
+class TestAccountSnapshotModule(ModuleTestCase):
+    """
+    Test class for AccountSnapshot module testing.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, 'account.db')
+
+    def test_snapshot_success(self):
+        """Test the "snapshot" path - successful."""
+        patcher = patch('plugins.modules.ibm_account_snapshot.account_snapshot.crawl')
+        mock = patcher.start()
+        mock.return_value = iter([
+            ('resource_instances', None, [{'id': 'crn:i-1', 'crn': 'crn:i-1', 'name': 'db'}]),
+            ('access_group_members', 'AccessGroupId-1', [{'iam_id': 'IBMid-1'}]),
+        ])
+
+        set_module_args({
+            'account_id': 'account',
+            'path': self.path,
+            'workers': 16,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_account_snapshot.main()
+
+        assert result.exception.args[0]['changed'] is True
+        msg = result.exception.args[0]['msg']
+        assert msg['path'] == self.path
+        assert msg['counts']['resource_instances'] == 1
+        assert msg['counts']['access_group_members'] == 1
+        mock.assert_called_once_with('account', 16)
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        assert conn.execute('SELECT kind, id, parent_id FROM resources ORDER BY kind').fetchall() == [
+            ('access_group_members', 'IBMid-1', 'AccessGroupId-1'), ('resource_instances', 'crn:i-1', None)]
+
+        patcher.stop()
+
+    def test_snapshot_failed(self):
+        """Test the "snapshot" path - failed."""
+        patcher = patch('plugins.modules.ibm_account_snapshot.account_snapshot.crawl')
+        mock = patcher.start()
+        mock.side_effect = ApiException(403, message='Forbidden')
+
+        set_module_args({
+            'account_id': 'account',
+            'path': self.path,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_account_snapshot.main()
+
+        assert result.exception.args[0]['msg'] == 'Forbidden'
+        assert not os.path.exists(self.path)
+
+        patcher.stop()
@@ -0,0 +1,105 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+
+from ibm_cloud_sdk_core import ApiException
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleFailJson, AnsibleExitJson, set_module_args
+
+from plugins.modules import ibm_catalog_resolve_info
+
+
+def resolve_many(targets, workers):
+    resolutions = {
+        ('cloudant', 'lite', 'us-south'): ('service-id', 'crn:us-south', 'plan-id'),
+        ('cloudant', 'lite', 'eu-de'): ('service-id', 'crn:eu-de', 'plan-id'),
+    }
+    return dict((t, resolutions.get(t) or ValueError('[ERROR] not found')) for t in targets)
+
+
+class TestCatalogResolveModuleInfo(ModuleTestCase):
+    """
+    Test class for CatalogResolve module testing.
+    """
+
+    def test_resolve_success(self):
+        """Test the "resolve" path - successful."""
+        patcher = patch('plugins.modules.ibm_catalog_resolve_info.catalog.resolve_many')
+        mock = patcher.start()
+        mock.side_effect = resolve_many
+
+        set_module_args({
+            'targets': [
+                {'service': 'cloudant', 'plan': 'lite', 'location': 'us-south'},
+                {'service': 'cloudant', 'plan': 'lite', 'location': 'eu-de'},
+            ],
+            'workers': 2,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_catalog_resolve_info.main()
+
+        assert result.exception.args[0]['msg'] == {
+            'cloudant/lite/us-south': {'service_id': 'service-id', 'plan_id': 'plan-id', 'catalog_crn': 'crn:us-south'},
+            'cloudant/lite/eu-de': {'service_id': 'service-id', 'plan_id': 'plan-id', 'catalog_crn': 'crn:eu-de'},
+        }
+
+        mock.assert_called_once_with(
+            [('cloudant', 'lite', 'us-south'), ('cloudant', 'lite', 'eu-de')], 2)
+
+        patcher.stop()
+
+    def test_resolve_not_found(self):
+        """Test the "resolve" path - not found."""
+        patcher = patch('plugins.modules.ibm_catalog_resolve_info.catalog.resolve_many')
+        mock = patcher.start()
+        mock.side_effect = resolve_many
+
+        set_module_args({
+            'targets': [
+                {'service': 'cloudant', 'plan': 'lite', 'location': 'us-south'},
+                {'service': 'cloudant', 'plan': 'lite', 'location': 'mars-1'},
+            ],
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_catalog_resolve_info.main()
+
+        assert result.exception.args[0]['msg'] == 'cloudant/lite/mars-1: [ERROR] not found'
+
+        patcher.stop()
+
+    def test_resolve_failed(self):
+        """Test the "resolve" path - failed."""
+        patcher = patch('plugins.modules.ibm_catalog_resolve_info.catalog.resolve_many')
+        mock = patcher.start()
+        mock.side_effect = ApiException(500, message='Resolve error')
+
+        set_module_args({
+            'targets': [{'service': 'cloudant', 'plan': 'lite', 'location': 'us-south'}],
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_catalog_resolve_info.main()
+
+        assert result.exception.args[0]['msg'] == 'Resolve error'
+
+        patcher.stop()
@@ -442,7 +442,8 @@ class TestCatalogModule(ModuleTestCase):
         get_catalog_patcher = patch(
             'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
-        get_catalog_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_catalog_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'catalog_identifier': 'testString',
@@ -484,6 +485,7 @@ class TestCatalogModule(ModuleTestCase):
             catalog_filters=filters_model,
             syndication_settings=syndication_resource_model,
             kind='testString',
+            headers={},
         )
 
         mock.assert_called_once()
@@ -561,23 +563,6 @@ class TestCatalogModule(ModuleTestCase):
             'authorization': syndication_authorization_model,
         }
 
-        resource = {
-            'catalog_identifier': 'testString',
-            'id': 'testString',
-            'rev': 'testString',
-            'label': 'testString',
-            'short_description': 'testString',
-            'catalog_icon_url': 'testString',
-            'tags': ['testString'],
-            'features': [feature_model],
-            'disabled': True,
-            'resource_group_id': 'testString',
-            'owning_account': 'testString',
-            'catalog_filters': filters_model,
-            'syndication_settings': syndication_resource_model,
-            'kind': 'testString',
-        }
-
         patcher = patch(
             'plugins.modules.ibm_cm_catalog.CatalogManagementV1.replace_catalog')
         mock = patcher.start()
@@ -587,7 +572,8 @@ class TestCatalogModule(ModuleTestCase):
         get_catalog_patcher = patch(
             'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
         get_catalog_mock = get_catalog_patcher.start()
-        get_catalog_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_catalog_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'catalog_identifier': 'testString',
@@ -628,6 +614,7 @@ class TestCatalogModule(ModuleTestCase):
             catalog_filters=filters_model,
             syndication_settings=syndication_resource_model,
             kind='testString',
+            headers={},
         )
 
         mock.assert_called_once()
@@ -651,6 +638,82 @@ class TestCatalogModule(ModuleTestCase):
         get_catalog_patcher.stop()
         patcher.stop()
 
+    def test_update_ibm_cm_catalog_conflict(self):
+        """Test the "update" path - a stale revision is refreshed and the update retried."""
+        resource = {
+            'id': 'testString',
+            '_rev': '3-c',
+            'label': 'renamed',
+        }
+
+        patcher = patch(
+            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.replace_catalog')
+        mock = patcher.start()
+        mock.side_effect = [
+            ApiException(409, message='Document update conflict.'),
+            DetailedResponseMock(resource),
+        ]
+
+        get_catalog_patcher = patch(
+            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+        get_catalog_mock = get_catalog_patcher.start()
+        get_catalog_mock.side_effect = [
+            DetailedResponseMock({'id': 'testString', '_rev': '1-a', 'label': 'testString'}),
+            DetailedResponseMock({'id': 'testString', '_rev': '2-b', 'label': 'other'}),
+        ]
+
+        set_module_args({
+            'catalog_identifier': 'testString',
+            'id': 'testString',
+            'label': 'renamed',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['CATALOG_MANAGEMENT_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_cm_catalog.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == resource
+
+        assert get_catalog_mock.call_count == 2
+        assert [call.kwargs['rev'] for call in mock.call_args_list] == ['1-a', '2-b']
+        get_catalog_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_cm_catalog_conflict_with_rev(self):
+        """Test the "update" path - a stale revision given by the user is not retried."""
+        patcher = patch(
+            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.replace_catalog')
+        mock = patcher.start()
+        mock.side_effect = ApiException(409, message='Document update conflict.')
+
+        get_catalog_patcher = patch(
+            'plugins.modules.ibm_cm_catalog.CatalogManagementV1.get_catalog')
+        get_catalog_mock = get_catalog_patcher.start()
+        get_catalog_mock.return_value = DetailedResponseMock(
+            {'id': 'testString', '_rev': '2-b', 'label': 'testString'})
+
+        set_module_args({
+            'catalog_identifier': 'testString',
+            'id': 'testString',
+            'rev': '1-a',
+            'label': 'renamed',
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['CATALOG_MANAGEMENT_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_cm_catalog.main()
+
+        assert result.exception.args[0]['msg'] == 'Document update conflict.'
+
+        get_catalog_mock.assert_called_once()
+        mock.assert_called_once()
+        assert mock.call_args.kwargs['rev'] == '1-a'
+        get_catalog_patcher.stop()
+        patcher.stop()
+
     def test_delete_ibm_cm_catalog_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
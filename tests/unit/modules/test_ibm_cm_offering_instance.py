@@ -349,8 +349,8 @@ class TestOfferingInstanceModule(ModuleTestCase):
         get_offering_instance_patcher = patch(
             'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
-        get_offering_instance_mock.return_value = DetailedResponseMock(
-            resource)
+        # The existing resource differs from the desired one.
+        get_offering_instance_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'instance_identifier': 'testString',
@@ -438,30 +438,6 @@ class TestOfferingInstanceModule(ModuleTestCase):
             'updated': 'testString',
         }
 
-        resource = {
-            'instance_identifier': 'testString',
-            'x_auth_refresh_token': 'testString',
-            'id': 'testString',
-            'rev': 'testString',
-            'url': 'testString',
-            'crn': 'testString',
-            'label': 'testString',
-            'catalog_id': 'testString',
-            'offering_id': 'testString',
-            'kind_format': 'testString',
-            'version': 'testString',
-            'cluster_id': 'testString',
-            'cluster_region': 'testString',
-            'cluster_namespaces': ['testString'],
-            'cluster_all_namespaces': True,
-            'schematics_workspace_id': 'testString',
-            'resource_group_id': 'testString',
-            'install_plan': 'testString',
-            'channel': 'testString',
-            'metadata': {'key1': 'testString'},
-            'last_operation': offering_instance_last_operation_model,
-        }
-
         patcher = patch(
             'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.put_offering_instance')
         mock = patcher.start()
@@ -471,8 +447,8 @@ class TestOfferingInstanceModule(ModuleTestCase):
         get_offering_instance_patcher = patch(
             'plugins.modules.ibm_cm_offering_instance.CatalogManagementV1.get_offering_instance')
         get_offering_instance_mock = get_offering_instance_patcher.start()
-        get_offering_instance_mock.return_value = DetailedResponseMock(
-            resource)
+        # The existing resource differs from the desired one.
+        get_offering_instance_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'instance_identifier': 'testString',
@@ -0,0 +1,117 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2022.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import os
+import tempfile
+
+from ibm_cloud_sdk_core import ApiException
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleFailJson, AnsibleExitJson, set_module_args
+
+from plugins.modules import ibm_global_catalog_snapshot
+
+SNAPSHOT = {
+    'version': 1,
+    'services': {
+        'cloudant': {
+            'id': 'service-id',
+            'plans': {'lite': {'id': 'plan-id', 'deployments': {'us-south': 'crn:us-south', 'eu-de': 'crn:eu-de'}}},
+        },
+    },
+}
+
+
+class TestGlobalCatalogSnapshotModule(ModuleTestCase):
+    """
+    Test class for GlobalCatalogSnapshot module testing.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, 'snapshot.json')
+
+    def test_export_success(self):
+        """Test the "export" path - successful."""
+        patcher = patch('plugins.modules.ibm_global_catalog_snapshot.catalog.build_snapshot')
+        mock = patcher.start()
+        mock.return_value = SNAPSHOT
+
+        set_module_args({
+            'services': ['cloudant'],
+            'path': self.path,
+        })
+
+        for changed in (True, False):
+            with self.assertRaises(AnsibleExitJson) as result:
+                os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+                ibm_global_catalog_snapshot.main()
+
+            assert result.exception.args[0]['changed'] is changed
+            assert result.exception.args[0]['msg'] == {
+                'path': self.path,
+                'services': 1,
+                'plans': 1,
+                'deployments': 2,
+            }
+
+        with open(self.path) as f:
+            assert json.load(f) == SNAPSHOT
+        mock.assert_called_with(['cloudant'], None, 4)
+
+        patcher.stop()
+
+    def test_export_not_found(self):
+        """Test the "export" path - service not found."""
+        patcher = patch('plugins.modules.ibm_global_catalog_snapshot.catalog.build_snapshot')
+        mock = patcher.start()
+        mock.side_effect = ValueError('[ERROR] service name is invalid or not found: unknown')
+
+        set_module_args({
+            'services': ['unknown'],
+            'path': self.path,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_global_catalog_snapshot.main()
+
+        assert result.exception.args[0]['msg'] == '[ERROR] service name is invalid or not found: unknown'
+        assert not os.path.exists(self.path)
+
+        patcher.stop()
+
+    def test_export_failed(self):
+        """Test the "export" path - failed."""
+        patcher = patch('plugins.modules.ibm_global_catalog_snapshot.catalog.build_snapshot')
+        mock = patcher.start()
+        mock.side_effect = ApiException(500, message='Export error')
+
+        set_module_args({
+            'services': ['cloudant'],
+            'path': self.path,
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_global_catalog_snapshot.main()
+
+        assert result.exception.args[0]['msg'] == 'Export error'
+
+        patcher.stop()
@@ -233,7 +233,8 @@ class TestCreateGroupRequestModule(ModuleTestCase):
         get_access_group_patcher = patch(
             'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
-        get_access_group_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_access_group_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'access_group_id': 'testString',
@@ -281,16 +282,83 @@ class TestCreateGroupRequestModule(ModuleTestCase):
         get_access_group_patcher.stop()
         patcher.stop()
 
-    def test_update_ibm_iam_access_group_failed(self):
-        """Test the "update" path - failed."""
+    def test_update_ibm_iam_access_group_unchanged(self):
+        """Test the "update" path - the existing resource is already as desired."""
         resource = {
+            'id': 'testString',
+            'name': 'Awesome Managers',
+            'description': 'Group for awesome managers.',
+        }
+
+        patcher = patch(
+            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.update_access_group')
+        mock = patcher.start()
+
+        get_access_group_patcher = patch(
+            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+        get_access_group_mock = get_access_group_patcher.start()
+        get_access_group_mock.return_value = DetailedResponseMock(resource)
+
+        set_module_args({
             'access_group_id': 'testString',
-            'if_match': 'testString',
             'name': 'Awesome Managers',
             'description': 'Group for awesome managers.',
-            'transaction_id': 'testString',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['msg'] == resource
+
+        get_access_group_mock.assert_called_once()
+        mock.assert_not_called()
+        get_access_group_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_iam_access_group_etag(self):
+        """Test the "update" path - if_match defaults to the ETag of the existing resource."""
+        resource = {
+            'id': 'testString',
+            'name': 'Awesome Managers',
+            'description': 'Group for awesome managers.',
         }
 
+        patcher = patch(
+            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.update_access_group')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(resource)
+
+        get_access_group_patcher = patch(
+            'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
+        get_access_group_mock = get_access_group_patcher.start()
+        get_access_group_mock.return_value = DetailedResponseMock(
+            {'id': 'testString', 'name': 'Managers'}, {'ETag': '2-abc'})
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'name': 'Awesome Managers',
+            'description': 'Group for awesome managers.',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == resource
+
+        get_access_group_mock.assert_called_once()
+        mock.assert_called_once()
+        assert mock.call_args.kwargs['if_match'] == '2-abc'
+        get_access_group_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_iam_access_group_failed(self):
+        """Test the "update" path - failed."""
         patcher = patch(
             'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.update_access_group')
         mock = patcher.start()
@@ -300,7 +368,8 @@ class TestCreateGroupRequestModule(ModuleTestCase):
         get_access_group_patcher = patch(
             'plugins.modules.ibm_iam_access_group.IamAccessGroupsV2.get_access_group')
         get_access_group_mock = get_access_group_patcher.start()
-        get_access_group_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_access_group_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'access_group_id': 'testString',
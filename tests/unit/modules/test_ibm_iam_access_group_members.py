@@ -382,7 +382,8 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
         list_access_group_members_patcher = patch(
             'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
         list_access_group_members_mock = list_access_group_members_patcher.start()
-        list_access_group_members_mock.return_value = DetailedResponseMock()
+        list_access_group_members_mock.return_value = DetailedResponseMock(
+            {'members': [{'iam_id': 'testString'}], 'total_count': 1})
 
         args = {
             'access_group_id': 'testString',
@@ -427,6 +428,8 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
         for param in list_access_group_members_mock_data:
             list_access_group_members_mock_data[param] = mock_data.get(
                 param, None)
+        # The members are read from the first one, with the largest pages.
+        list_access_group_members_mock_data.update(limit=100, offset=0)
 
         list_access_group_members_mock.assert_called_once()
         list_access_group_members_processed_result = post_process_result(
@@ -488,6 +491,8 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
         for param in list_access_group_members_mock_data:
             list_access_group_members_mock_data[param] = mock_data.get(
                 param, None)
+        # The members are read from the first one, with the largest pages.
+        list_access_group_members_mock_data.update(limit=100, offset=0)
 
         list_access_group_members_mock.assert_called_once()
         list_access_group_members_processed_result = post_process_result(
@@ -508,7 +513,8 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
         list_access_group_members_patcher = patch(
             'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
         list_access_group_members_mock = list_access_group_members_patcher.start()
-        list_access_group_members_mock.return_value = DetailedResponseMock()
+        list_access_group_members_mock.return_value = DetailedResponseMock(
+            {'members': [{'iam_id': 'testString'}], 'total_count': 1})
 
         set_module_args({
             'access_group_id': 'testString',
@@ -549,6 +555,8 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
         for param in list_access_group_members_mock_data:
             list_access_group_members_mock_data[param] = mock_data.get(
                 param, None)
+        # The members are read from the first one, with the largest pages.
+        list_access_group_members_mock_data.update(limit=100, offset=0)
 
         list_access_group_members_mock.assert_called_once()
         list_access_group_members_processed_result = post_process_result(
@@ -557,3 +565,106 @@ class TestAddGroupMembersResponseModule(ModuleTestCase):
 
         list_access_group_members_patcher.stop()
         patcher.stop()
+
+    def test_delete_ibm_iam_access_group_members_not_member(self):
+        """Test the "delete" path - the IAM ID is not a member of the group."""
+        patcher = patch(
+            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.remove_member_from_access_group')
+        mock = patcher.start()
+
+        list_access_group_members_patcher = patch(
+            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+        list_access_group_members_mock = list_access_group_members_patcher.start()
+        list_access_group_members_mock.return_value = DetailedResponseMock(
+            {'members': [{'iam_id': 'otherString'}], 'total_count': 1})
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'iam_id': 'testString',
+            'state': 'absent',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_members.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['msg']['status'] == 'not_found'
+        mock.assert_not_called()
+
+        list_access_group_members_patcher.stop()
+        patcher.stop()
+
+    def test_delete_ibm_iam_access_group_members_later_page(self):
+        """Test the "delete" path - the member is found on a later page."""
+        patcher = patch(
+            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.remove_member_from_access_group')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock()
+
+        list_access_group_members_patcher = patch(
+            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+        list_access_group_members_mock = list_access_group_members_patcher.start()
+        list_access_group_members_mock.side_effect = lambda offset, **kwargs: DetailedResponseMock({
+            'members': [{'iam_id': 'otherString'}] if offset == 0 else [{'iam_id': 'testString'}],
+            'total_count': 2,
+            'limit': 1,
+        })
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'iam_id': 'testString',
+            'limit': 1,
+            'state': 'absent',
+            '_ansible_diff': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_members.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg']['status'] == 'deleted'
+        assert result.exception.args[0]['diff']['before']['members'] == [
+            {'iam_id': 'otherString'}, {'iam_id': 'testString'}]
+        assert result.exception.args[0]['diff']['after']['members'] == [{'iam_id': 'otherString'}]
+        assert list_access_group_members_mock.call_count == 2
+        mock.assert_called_once()
+
+        list_access_group_members_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_iam_access_group_members_no_op(self):
+        """Test the "update" path - all the members are in the group already, some on a later page."""
+        patcher = patch(
+            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.add_members_to_access_group')
+        mock = patcher.start()
+
+        list_access_group_members_patcher = patch(
+            'plugins.modules.ibm_iam_access_group_members.IamAccessGroupsV2.list_access_group_members')
+        list_access_group_members_mock = list_access_group_members_patcher.start()
+        list_access_group_members_mock.side_effect = lambda offset, **kwargs: DetailedResponseMock({
+            'members': [{'iam_id': 'otherString'}] if offset == 0 else [{'iam_id': 'testString'}],
+            'total_count': 2,
+            'limit': 1,
+        })
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'iam_id': 'testString',
+            'members': [{'iam_id': 'testString', 'type': 'user'}],
+            'limit': 1,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_members.main()
+
+        assert result.exception.args[0]['changed'] is False
+        mock.assert_not_called()
+
+        list_access_group_members_patcher.stop()
+        patcher.stop()
@@ -86,3 +86,33 @@ class TestGroupMembersListModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_iam_access_group_members_all_pages(self):
+        """Test the "list" path - all pages."""
+        members = [{'iam_id': 'IBMid-%d' % i} for i in range(5)]
+
+        def list_access_group_members(offset=None, limit=None, **kwargs):
+            return DetailedResponseMock({
+                'offset': offset, 'limit': limit, 'total_count': len(members), 'members': members[offset:offset + limit]})
+
+        patcher = patch(
+            'plugins.modules.ibm_iam_access_group_members_info.IamAccessGroupsV2.list_access_group_members')
+        mock = patcher.start()
+        mock.side_effect = list_access_group_members
+
+        set_module_args({
+            'access_group_id': 'testString',
+            'limit': 2,
+            'all_pages': True,
+            'max_items': 3,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_members_info.main()
+
+        assert result.exception.args[0]['msg'] == {'items': members[:3], 'pages_fetched': 2}
+        assert all(c.kwargs['access_group_id'] == 'testString' for c in mock.call_args_list)
+
+        patcher.stop()
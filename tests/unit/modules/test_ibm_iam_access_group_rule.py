@@ -264,8 +264,8 @@ class TestRuleRequestModule(ModuleTestCase):
         get_access_group_rule_patcher = patch(
             'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
-        get_access_group_rule_mock.return_value = DetailedResponseMock(
-            resource)
+        # The existing resource differs from the desired one.
+        get_access_group_rule_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'access_group_id': 'testString',
@@ -319,8 +319,8 @@ class TestRuleRequestModule(ModuleTestCase):
         get_access_group_rule_patcher.stop()
         patcher.stop()
 
-    def test_update_ibm_iam_access_group_rule_failed(self):
-        """Test the "update" path - failed."""
+    def test_update_ibm_iam_access_group_rule_precondition_failed(self):
+        """Test the "update" path - a stale ETag is refreshed and the update retried."""
         rule_conditions_model = {
             'claim': 'isManager',
             'operator': 'EQUALS',
@@ -328,14 +328,57 @@ class TestRuleRequestModule(ModuleTestCase):
         }
 
         resource = {
+            'id': 'testString',
+            'expiration': 12,
+            'realm_name': 'https://idp.example.org/SAML2',
+            'conditions': [rule_conditions_model],
+            'name': 'Manager group rule',
+        }
+
+        patcher = patch(
+            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.replace_access_group_rule')
+        mock = patcher.start()
+        mock.side_effect = [
+            ApiException(412, message='Precondition failed'),
+            DetailedResponseMock(resource),
+        ]
+
+        get_access_group_rule_patcher = patch(
+            'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
+        get_access_group_rule_mock = get_access_group_rule_patcher.start()
+        get_access_group_rule_mock.side_effect = [
+            DetailedResponseMock({'id': 'testString', 'expiration': 6}, {'ETag': '1-a'}),
+            DetailedResponseMock({'id': 'testString', 'expiration': 8}, {'ETag': '2-b'}),
+        ]
+
+        set_module_args({
             'access_group_id': 'testString',
             'rule_id': 'testString',
-            'if_match': 'testString',
             'expiration': 12,
             'realm_name': 'https://idp.example.org/SAML2',
             'conditions': [rule_conditions_model],
             'name': 'Manager group rule',
-            'transaction_id': 'testString',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_group_rule.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == resource
+
+        assert get_access_group_rule_mock.call_count == 2
+        assert [call.kwargs['if_match'] for call in mock.call_args_list] == ['1-a', '2-b']
+        get_access_group_rule_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_iam_access_group_rule_failed(self):
+        """Test the "update" path - failed."""
+        rule_conditions_model = {
+            'claim': 'isManager',
+            'operator': 'EQUALS',
+            'value': 'true',
         }
 
         patcher = patch(
@@ -347,8 +390,8 @@ class TestRuleRequestModule(ModuleTestCase):
         get_access_group_rule_patcher = patch(
             'plugins.modules.ibm_iam_access_group_rule.IamAccessGroupsV2.get_access_group_rule')
         get_access_group_rule_mock = get_access_group_rule_patcher.start()
-        get_access_group_rule_mock.return_value = DetailedResponseMock(
-            resource)
+        # The existing resource differs from the desired one.
+        get_access_group_rule_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'access_group_id': 'testString',
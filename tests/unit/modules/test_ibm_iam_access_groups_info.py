@@ -88,3 +88,32 @@ class TestGroupsListModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_iam_access_groups_all_pages(self):
+        """Test the "list" path - all pages."""
+        groups = [{'id': str(i)} for i in range(5)]
+
+        def list_access_groups(offset=None, limit=None, **kwargs):
+            return DetailedResponseMock({
+                'offset': offset, 'limit': limit, 'total_count': len(groups), 'groups': groups[offset:offset + limit]})
+
+        patcher = patch(
+            'plugins.modules.ibm_iam_access_groups_info.IamAccessGroupsV2.list_access_groups')
+        mock = patcher.start()
+        mock.side_effect = list_access_groups
+
+        set_module_args({
+            'account_id': 'testString',
+            'limit': 2,
+            'all_pages': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_ACCESS_GROUPS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_access_groups_info.main()
+
+        assert result.exception.args[0]['msg'] == {'items': groups, 'pages_fetched': 3}
+        assert mock.call_count == 3
+
+        patcher.stop()
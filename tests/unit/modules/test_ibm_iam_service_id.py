@@ -257,7 +257,8 @@ class TestServiceIdModule(ModuleTestCase):
         get_service_id_patcher = patch(
             'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
-        get_service_id_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_service_id_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'id': 'testString',
@@ -305,14 +306,6 @@ class TestServiceIdModule(ModuleTestCase):
 
     def test_update_ibm_iam_service_id_failed(self):
         """Test the "update" path - failed."""
-        resource = {
-            'id': 'testString',
-            'if_match': 'testString',
-            'name': 'testString',
-            'description': 'testString',
-            'unique_instance_crns': ['testString'],
-        }
-
         patcher = patch(
             'plugins.modules.ibm_iam_service_id.IamIdentityV1.update_service_id')
         mock = patcher.start()
@@ -322,7 +315,8 @@ class TestServiceIdModule(ModuleTestCase):
         get_service_id_patcher = patch(
             'plugins.modules.ibm_iam_service_id.IamIdentityV1.get_service_id')
         get_service_id_mock = get_service_id_patcher.start()
-        get_service_id_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_service_id_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'id': 'testString',
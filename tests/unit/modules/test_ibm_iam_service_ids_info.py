@@ -15,7 +15,11 @@
 # limitations under the License.
 
 
+import gzip
+import hashlib
+import json
 import os
+import tempfile
 
 from ibm_cloud_sdk_core import ApiException
 from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
@@ -24,6 +28,17 @@ from ansible_collections.community.internal_test_tools.tests.unit.plugins.module
 from .common import DetailedResponseMock
 from plugins.modules import ibm_iam_service_ids_info
 
+SERVICE_IDS = [{'id': 'ServiceId-%d' % i} for i in range(5)]
+
+
+def list_service_ids(pagetoken=None, pagesize=None, **kwargs):
+    offset = int(pagetoken or 0)
+    pagesize = pagesize or 2
+    result = {'offset': offset, 'limit': pagesize, 'serviceids': SERVICE_IDS[offset:offset + pagesize]}
+    if offset + pagesize < len(SERVICE_IDS):
+        result['next'] = 'https://iam.cloud.ibm.com/v1/serviceids?pagetoken=%d' % (offset + pagesize)
+    return DetailedResponseMock(result)
+
 
 class TestServiceIdListModuleInfo(ModuleTestCase):
     """
@@ -129,3 +144,78 @@ class TestServiceIdListModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_iam_service_ids_all_pages(self):
+        """Test the "list" path - all pages."""
+        patcher = patch(
+            'plugins.modules.ibm_iam_service_ids_info.IamIdentityV1.list_service_ids')
+        mock = patcher.start()
+        mock.side_effect = list_service_ids
+
+        set_module_args({
+            'account_id': 'testString',
+            'all_pages': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_IDENTITY_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_service_ids_info.main()
+
+        assert result.exception.args[0]['msg'] == {'items': SERVICE_IDS, 'pages_fetched': 3}
+        assert [c.kwargs['pagetoken'] for c in mock.call_args_list] == [None, '2', '4']
+
+        patcher.stop()
+
+    def test_list_ibm_iam_service_ids_results_only(self):
+        """Test the "list" path - all pages, results only, up to max_items."""
+        patcher = patch(
+            'plugins.modules.ibm_iam_service_ids_info.IamIdentityV1.list_service_ids')
+        mock = patcher.start()
+        mock.side_effect = list_service_ids
+
+        set_module_args({
+            'account_id': 'testString',
+            'all_pages': True,
+            'pagesize': 2,
+            'max_items': 3,
+            'results_only': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IAM_IDENTITY_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_iam_service_ids_info.main()
+
+        assert result.exception.args[0]['msg'] == SERVICE_IDS[:3]
+        assert mock.call_count == 2
+
+        patcher.stop()
+
+    def test_list_ibm_iam_service_ids_output_file(self):
+        """Test the "list" path - all pages written to a gzip compressed file."""
+        patcher = patch(
+            'plugins.modules.ibm_iam_service_ids_info.IamIdentityV1.list_service_ids')
+        mock = patcher.start()
+        mock.side_effect = list_service_ids
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'serviceids.jsonl.gz')
+            set_module_args({
+                'account_id': 'testString',
+                'output_file': path,
+            })
+
+            with self.assertRaises(AnsibleExitJson) as result:
+                os.environ['IAM_IDENTITY_AUTH_TYPE'] = 'noAuth'
+                os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+                ibm_iam_service_ids_info.main()
+
+            with open(path, 'rb') as f:
+                checksum = hashlib.sha256(f.read()).hexdigest()
+            assert result.exception.args[0]['msg'] == {
+                'path': path, 'count': 5, 'checksum': checksum, 'pages_fetched': 3}
+            with gzip.open(path, 'rt') as f:
+                assert [json.loads(line) for line in f] == SERVICE_IDS
+
+        patcher.stop()
@@ -221,7 +221,8 @@ class TestResourceAliasPostModule(ModuleTestCase):
         get_resource_alias_patcher = patch(
             'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
-        get_resource_alias_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_resource_alias_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'id': 'testString',
@@ -263,11 +264,6 @@ class TestResourceAliasPostModule(ModuleTestCase):
 
     def test_update_ibm_resource_alias_failed(self):
         """Test the "update" path - failed."""
-        resource = {
-            'id': 'testString',
-            'name': 'my-new-alias-name',
-        }
-
         patcher = patch(
             'plugins.modules.ibm_resource_alias.ResourceControllerV2.update_resource_alias')
         mock = patcher.start()
@@ -277,7 +273,8 @@ class TestResourceAliasPostModule(ModuleTestCase):
         get_resource_alias_patcher = patch(
             'plugins.modules.ibm_resource_alias.ResourceControllerV2.get_resource_alias')
         get_resource_alias_mock = get_resource_alias_patcher.start()
-        get_resource_alias_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_resource_alias_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'id': 'testString',
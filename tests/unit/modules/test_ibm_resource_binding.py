@@ -240,7 +240,8 @@ class TestResourceBindingPostModule(ModuleTestCase):
         get_resource_binding_patcher = patch(
             'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
-        get_resource_binding_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_resource_binding_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'id': 'testString',
@@ -282,11 +283,6 @@ class TestResourceBindingPostModule(ModuleTestCase):
 
     def test_update_ibm_resource_binding_failed(self):
         """Test the "update" path - failed."""
-        resource = {
-            'id': 'testString',
-            'name': 'my-new-binding-name',
-        }
-
         patcher = patch(
             'plugins.modules.ibm_resource_binding.ResourceControllerV2.update_resource_binding')
         mock = patcher.start()
@@ -296,7 +292,8 @@ class TestResourceBindingPostModule(ModuleTestCase):
         get_resource_binding_patcher = patch(
             'plugins.modules.ibm_resource_binding.ResourceControllerV2.get_resource_binding')
         get_resource_binding_mock = get_resource_binding_patcher.start()
-        get_resource_binding_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_resource_binding_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'id': 'testString',
@@ -22,6 +22,7 @@ from ansible_collections.community.internal_test_tools.tests.unit.compat.mock im
 from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import ModuleTestCase, AnsibleFailJson, AnsibleExitJson, set_module_args
 
 from .common import DetailedResponseMock
+from plugins.module_utils import catalog
 from plugins.modules import ibm_resource_instance
 
 
@@ -303,6 +304,289 @@ class TestResourceInstancePostModule(ModuleTestCase):
         get_resource_instance_patcher.stop()
         patcher.stop()
 
+    def test_update_ibm_resource_instance_unchanged(self):
+        """Test the "update" path - nothing to update."""
+        resource = {
+            'id': 'testString',
+            'name': 'my-instance-name',
+            'parameters': {'key1': 'testString', 'key2': 'default'},
+            'resource_plan_id': 'a8dff6d3-d287-4668-a81d-c87c55c2656d',
+            'allow_cleanup': True,
+            'state': 'active',
+        }
+
+        patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.update_resource_instance')
+        mock = patcher.start()
+
+        get_resource_instance_patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+        get_resource_instance_mock = get_resource_instance_patcher.start()
+        get_resource_instance_mock.return_value = DetailedResponseMock(resource)
+
+        set_module_args({
+            'id': 'testString',
+            'name': 'my-instance-name',
+            'parameters': {'key1': 'testString'},
+            'plan': 'a8dff6d3-d287-4668-a81d-c87c55c2656d',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['msg'] == resource
+        mock.assert_not_called()
+        get_resource_instance_mock.assert_called_once()
+
+        get_resource_instance_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_resource_instance_unchanged_plan_name(self):
+        """Test the "update" path - the plan name given with the service is resolved to its ID."""
+        resource = {
+            'id': 'testString',
+            'name': 'my-instance-name',
+            'resource_plan_id': 'a8dff6d3-d287-4668-a81d-c87c55c2656d',
+            'state': 'active',
+        }
+
+        patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.update_resource_instance')
+        mock = patcher.start()
+
+        get_resource_instance_patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+        get_resource_instance_mock = get_resource_instance_patcher.start()
+        get_resource_instance_mock.return_value = DetailedResponseMock(resource)
+
+        get_planID_patcher = patch(
+            'plugins.modules.ibm_resource_instance.catalog.get_planID')
+        get_planID_mock = get_planID_patcher.start()
+        get_planID_mock.return_value = ('dff97f5c-bc5e-4455-b470-411c3edbe49c', 'a8dff6d3-d287-4668-a81d-c87c55c2656d')
+
+        set_module_args({
+            'id': 'testString',
+            'name': 'my-instance-name',
+            'service': 'cloud-object-storage',
+            'plan': 'standard',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is False
+        assert result.exception.args[0]['msg'] == resource
+        get_planID_mock.assert_called_once_with('cloud-object-storage', 'standard')
+        mock.assert_not_called()
+
+        get_planID_patcher.stop()
+        get_resource_instance_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_resource_instance_unknown_plan(self):
+        """Test the "update" path - the plan name given with the service does not exist."""
+        patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.update_resource_instance')
+        mock = patcher.start()
+
+        get_resource_instance_patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.get_resource_instance')
+        get_resource_instance_mock = get_resource_instance_patcher.start()
+        get_resource_instance_mock.return_value = DetailedResponseMock({
+            'id': 'testString',
+            'name': 'my-instance-name',
+            'resource_plan_id': 'a8dff6d3-d287-4668-a81d-c87c55c2656d',
+        })
+
+        get_planID_patcher = patch(
+            'plugins.modules.ibm_resource_instance.catalog.get_planID')
+        get_planID_mock = get_planID_patcher.start()
+        get_planID_mock.side_effect = catalog.NotFound(
+            '[ERROR] either of service plan or service name is invalid or not found')
+
+        set_module_args({
+            'id': 'testString',
+            'name': 'my-instance-name',
+            'service': 'cloud-object-storage',
+            'plan': 'no-such-plan',
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['msg'] == '[ERROR] either of service plan or service name is invalid or not found'
+        mock.assert_not_called()
+
+        get_planID_patcher.stop()
+        get_resource_instance_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_resource_instance_match_by_name(self):
+        """Test the "update" path - the instance is found by name and updated."""
+        current = {
+            'id': 'testString',
+            'name': 'my-instance-name',
+            'resource_group_id': '5c49eabc-f5e8-5881-a37e-2d100a33b3df',
+            'allow_cleanup': False,
+        }
+        resource = dict(current, allow_cleanup=True)
+
+        patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.update_resource_instance')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(resource)
+
+        list_resource_instances_patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.list_resource_instances')
+        list_resource_instances_mock = list_resource_instances_patcher.start()
+        list_resource_instances_mock.return_value = DetailedResponseMock({'resources': [current]})
+
+        create_patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.create_resource_instance')
+        create_mock = create_patcher.start()
+
+        set_module_args({
+            'match_by': 'name',
+            'name': 'my-instance-name',
+            'resource_group': '5c49eabc-f5e8-5881-a37e-2d100a33b3df',
+            'allow_cleanup': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == resource
+
+        list_resource_instances_mock.assert_called_once()
+        list_args = list_resource_instances_mock.call_args.kwargs
+        assert list_args['name'] == 'my-instance-name'
+        assert list_args['resource_group_id'] == '5c49eabc-f5e8-5881-a37e-2d100a33b3df'
+        mock.assert_called_once()
+        assert mock.call_args.kwargs['id'] == 'testString'
+        create_mock.assert_not_called()
+
+        create_patcher.stop()
+        list_resource_instances_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_resource_instance_match_by_name_plan(self):
+        """Test the "update" path - found by name within the service, its plan changed by name."""
+        current = {
+            'id': 'testString',
+            'name': 'my-instance-name',
+            'resource_plan_id': '2fdf0c08-2d32-4f46-84b5-32e0c92fffd8',
+        }
+        resource = dict(current, resource_plan_id='744bfc56-d12c-4866-88d5-dac9139e0e5d')
+
+        patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.update_resource_instance')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock(resource)
+
+        list_resource_instances_patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.list_resource_instances')
+        list_resource_instances_mock = list_resource_instances_patcher.start()
+        list_resource_instances_mock.return_value = DetailedResponseMock({'resources': [current]})
+
+        get_serviceID_patcher = patch(
+            'plugins.modules.ibm_resource_instance.catalog.get_serviceID')
+        get_serviceID_mock = get_serviceID_patcher.start()
+        get_serviceID_mock.return_value = 'dff97f5c-bc5e-4455-b470-411c3edbe49c'
+
+        get_planID_patcher = patch(
+            'plugins.modules.ibm_resource_instance.catalog.get_planID')
+        get_planID_mock = get_planID_patcher.start()
+        get_planID_mock.return_value = ('dff97f5c-bc5e-4455-b470-411c3edbe49c', '744bfc56-d12c-4866-88d5-dac9139e0e5d')
+
+        set_module_args({
+            'match_by': 'name',
+            'name': 'my-instance-name',
+            'service': 'cloud-object-storage',
+            'plan': 'standard',
+            '_ansible_diff': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['diff']['before']['resource_plan_id'] == '2fdf0c08-2d32-4f46-84b5-32e0c92fffd8'
+        assert result.exception.args[0]['diff']['after']['resource_plan_id'] == '744bfc56-d12c-4866-88d5-dac9139e0e5d'
+
+        assert list_resource_instances_mock.call_args.kwargs['resource_id'] == 'dff97f5c-bc5e-4455-b470-411c3edbe49c'
+        get_planID_mock.assert_called_once_with('cloud-object-storage', 'standard')
+        mock.assert_called_once()
+        assert mock.call_args.kwargs['id'] == 'testString'
+        assert mock.call_args.kwargs['resource_plan_id'] == '744bfc56-d12c-4866-88d5-dac9139e0e5d'
+
+        get_planID_patcher.stop()
+        get_serviceID_patcher.stop()
+        list_resource_instances_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_resource_instance_match_by_name_unknown_service(self):
+        """Test the "update" path - the service to look the instance up in does not exist."""
+        list_resource_instances_patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.list_resource_instances')
+        list_resource_instances_mock = list_resource_instances_patcher.start()
+
+        get_serviceID_patcher = patch(
+            'plugins.modules.ibm_resource_instance.catalog.get_serviceID')
+        get_serviceID_mock = get_serviceID_patcher.start()
+        get_serviceID_mock.side_effect = catalog.NotFound('[ERROR] service name is invalid or not found')
+
+        set_module_args({
+            'match_by': 'name',
+            'name': 'my-instance-name',
+            'service': 'no-such-service',
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instance.main()
+
+        assert result.exception.args[0]['msg'] == '[ERROR] service name is invalid or not found'
+        list_resource_instances_mock.assert_not_called()
+
+        get_serviceID_patcher.stop()
+        list_resource_instances_patcher.stop()
+
+    def test_update_ibm_resource_instance_match_by_name_ambiguous(self):
+        """Test the "update" path - more than one instance has the name."""
+        list_resource_instances_patcher = patch(
+            'plugins.modules.ibm_resource_instance.ResourceControllerV2.list_resource_instances')
+        list_resource_instances_mock = list_resource_instances_patcher.start()
+        list_resource_instances_mock.return_value = DetailedResponseMock({'resources': [
+            {'id': 'first', 'name': 'my-instance-name'},
+            {'id': 'second', 'name': 'my-instance-name'},
+        ]})
+
+        set_module_args({
+            'match_by': 'name',
+            'name': 'my-instance-name',
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instance.main()
+
+        assert 'more than one instance' in result.exception.args[0]['msg']
+        list_resource_instances_patcher.stop()
+
     def test_update_ibm_resource_instance_failed(self):
         """Test the "update" path - failed."""
         resource = {
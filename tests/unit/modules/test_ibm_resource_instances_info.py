@@ -15,7 +15,9 @@
 # limitations under the License.
 
 
+import json
 import os
+import tempfile
 
 from ibm_cloud_sdk_core import ApiException
 from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
@@ -66,3 +68,166 @@ class TestResourceInstancesListModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_resource_instances_all_pages(self):
+        """Test the "list" path - all pages."""
+        pages = [
+            DetailedResponseMock({'rows_count': 2, 'next_url': '/v2/resource_instances?limit=2&start=page2',
+                                  'resources': [{'id': '1'}, {'id': '2'}]}),
+            DetailedResponseMock({'rows_count': 1, 'next_url': None, 'resources': [{'id': '3'}]}),
+        ]
+        patcher = patch(
+            'plugins.modules.ibm_resource_instances_info.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.side_effect = pages
+
+        set_module_args({'all_pages': True, 'limit': 2})
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        assert result.exception.args[0]['msg'] == {
+            'items': [{'id': '1'}, {'id': '2'}, {'id': '3'}], 'pages_fetched': 2}
+        assert [c.kwargs['start'] for c in mock.call_args_list] == [None, 'page2']
+
+        patcher.stop()
+
+    def test_list_ibm_resource_instances_max_items(self):
+        """Test the "list" path - all pages up to max_items."""
+        patcher = patch(
+            'plugins.modules.ibm_resource_instances_info.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock({
+            'rows_count': 2, 'next_url': '/v2/resource_instances?limit=2&start=page2',
+            'resources': [{'id': '1'}, {'id': '2'}]})
+
+        set_module_args({'all_pages': True, 'max_items': 2})
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        assert result.exception.args[0]['msg'] == {'items': [{'id': '1'}, {'id': '2'}], 'pages_fetched': 1}
+        mock.assert_called_once()
+        assert mock.call_args.kwargs['limit'] == 2
+
+        patcher.stop()
+
+    def test_list_ibm_resource_instances_fields(self):
+        """Test the "list" path - projected on fields."""
+        patcher = patch(
+            'plugins.modules.ibm_resource_instances_info.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock({
+            'rows_count': 1, 'next_url': None,
+            'resources': [{'id': '1', 'name': 'instance', 'extensions': {'endpoints': {'public': 'url'}, 'big': {}}}]})
+
+        set_module_args({'fields': ['name', 'extensions.endpoints']})
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        assert result.exception.args[0]['msg'] == {
+            'rows_count': 1, 'next_url': None,
+            'resources': [{'name': 'instance', 'extensions': {'endpoints': {'public': 'url'}}}]}
+
+        patcher.stop()
+
+    def test_list_ibm_resource_instances_exists_only(self):
+        """Test the "list" path - whether any instance exists."""
+        patcher = patch(
+            'plugins.modules.ibm_resource_instances_info.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock({
+            'rows_count': 1, 'next_url': '/v2/resource_instances?limit=1&start=page2', 'resources': [{'id': '1'}]})
+
+        set_module_args({'name': 'instance', 'exists_only': True})
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        assert result.exception.args[0]['msg'] is True
+        mock.assert_called_once()
+        assert mock.call_args.kwargs['limit'] == 1
+        assert mock.call_args.kwargs['name'] == 'instance'
+
+        patcher.stop()
+
+    def test_list_ibm_resource_instances_count_only_exclusive(self):
+        """Test the "list" path - count_only and exists_only together."""
+        set_module_args({'count_only': True, 'exists_only': True})
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        assert 'mutually exclusive' in result.exception.args[0]['msg']
+
+    def test_list_ibm_resource_instances_since_last_run(self):
+        """Test the "list" path - delta sync into a state file."""
+        patcher = patch(
+            'plugins.modules.ibm_resource_instances_info.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.side_effect = [
+            DetailedResponseMock({'rows_count': 2, 'next_url': None, 'resources': [{'id': '1'}, {'id': '2'}]}),
+            DetailedResponseMock({'rows_count': 1, 'next_url': None, 'resources': [{'id': '3'}]}),
+            DetailedResponseMock({'rows_count': 1, 'next_url': None, 'resources': [{'id': '1'}]}),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'instances.json')
+            set_module_args({'since_last_run': True, 'state_file': path, 'resource_group_id': 'group'})
+
+            summaries = []
+            for dummy in range(2):
+                with self.assertRaises(AnsibleExitJson) as result:
+                    os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+                    ibm_resource_instances_info.main()
+                summaries.append(result.exception.args[0]['msg'])
+
+            assert [(s['full_sync'], s['count'], s['updated'], s['removed']) for s in summaries] == [
+                (True, 2, 2, 0), (False, 2, 1, 1)]
+            with open(path) as f:
+                assert sorted(json.load(f)['items']) == ['2', '3']
+
+        assert mock.call_args_list[0].kwargs['updated_from'] is None
+        assert mock.call_args_list[1].kwargs['updated_from'] is not None
+        assert mock.call_args_list[2].kwargs['state'] == 'removed'
+        assert all(c.kwargs['resource_group_id'] == 'group' for c in mock.call_args_list)
+
+        patcher.stop()
+
+    def test_list_ibm_resource_instances_since_last_run_without_state_file(self):
+        """Test the "list" path - delta sync without a state file."""
+        set_module_args({'since_last_run': True})
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        assert 'state_file' in result.exception.args[0]['msg']
+
+    def test_list_ibm_resource_instances_filters(self):
+        """Test the "list" path - filters sent to the server and checked on the items."""
+        patcher = patch(
+            'plugins.modules.ibm_resource_instances_info.ResourceControllerV2.list_resource_instances')
+        mock = patcher.start()
+        mock.return_value = DetailedResponseMock({'rows_count': 3, 'next_url': None, 'resources': [
+            {'id': '1', 'name': 'db-prod', 'crn': 'crn:v1:bluemix:public:cloudantnosqldb:us-south:a/account:1::'},
+            {'id': '2', 'name': 'db-dev', 'crn': 'crn:v1:bluemix:public:cloudantnosqldb:us-south:a/account:2::'},
+            {'id': '3', 'name': 'db-prod-eu', 'crn': 'crn:v1:bluemix:public:cloudantnosqldb:eu-de:a/account:3::'},
+        ]})
+
+        set_module_args({'all_pages': True, 'filters': {'state': 'active', 'name': 'prod', 'region': 'us-south'}})
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_instances_info.main()
+
+        assert [i['id'] for i in result.exception.args[0]['msg']['items']] == ['1']
+        assert mock.call_args.kwargs['state'] == 'active'
+
+        patcher.stop()
@@ -235,7 +235,8 @@ class TestResourceKeyPostModule(ModuleTestCase):
         get_resource_key_patcher = patch(
             'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
-        get_resource_key_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_resource_key_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'id': 'testString',
@@ -275,13 +276,49 @@ class TestResourceKeyPostModule(ModuleTestCase):
         get_resource_key_patcher.stop()
         patcher.stop()
 
-    def test_update_ibm_resource_key_failed(self):
-        """Test the "update" path - failed."""
+    def test_update_ibm_resource_key_check_mode(self):
+        """Test the "update" path - check mode only reads, and returns the diff."""
+        current = {
+            'id': 'testString',
+            'name': 'my-key-name',
+        }
         resource = {
             'id': 'testString',
             'name': 'my-new-key-name',
         }
 
+        patcher = patch(
+            'plugins.modules.ibm_resource_key.ResourceControllerV2.update_resource_key')
+        mock = patcher.start()
+
+        get_resource_key_patcher = patch(
+            'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
+        get_resource_key_mock = get_resource_key_patcher.start()
+        get_resource_key_mock.return_value = DetailedResponseMock(current)
+
+        set_module_args({
+            'id': 'testString',
+            'name': 'my-new-key-name',
+            '_ansible_check_mode': True,
+            '_ansible_diff': True,
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_key.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == resource
+        assert result.exception.args[0]['diff'] == {'before': current, 'after': resource}
+
+        get_resource_key_mock.assert_called_once()
+        mock.assert_not_called()
+        get_resource_key_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_resource_key_failed(self):
+        """Test the "update" path - failed."""
         patcher = patch(
             'plugins.modules.ibm_resource_key.ResourceControllerV2.update_resource_key')
         mock = patcher.start()
@@ -291,7 +328,8 @@ class TestResourceKeyPostModule(ModuleTestCase):
         get_resource_key_patcher = patch(
             'plugins.modules.ibm_resource_key.ResourceControllerV2.get_resource_key')
         get_resource_key_mock = get_resource_key_patcher.start()
-        get_resource_key_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_resource_key_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'id': 'testString',
@@ -66,3 +66,26 @@ class TestResourceKeysListModuleInfo(ModuleTestCase):
         mock.assert_called_once()
 
         patcher.stop()
+
+    def test_list_ibm_resource_keys_all_pages(self):
+        """Test the "list" path - all pages."""
+        pages = [
+            DetailedResponseMock({'next_url': '/v2/resource_keys?limit=1&start=page2', 'resources': [{'id': '1'}]}),
+            DetailedResponseMock({'next_url': None, 'resources': [{'id': '2'}]}),
+        ]
+        patcher = patch(
+            'plugins.modules.ibm_resource_keys_info.ResourceControllerV2.list_resource_keys')
+        mock = patcher.start()
+        mock.side_effect = pages
+
+        set_module_args({'limit': 1, 'all_pages': True})
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['RESOURCE_CONTROLLER_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_resource_keys_info.main()
+
+        assert result.exception.args[0]['msg'] == {'items': [{'id': '1'}, {'id': '2'}], 'pages_fetched': 2}
+        assert [c.kwargs['start'] for c in mock.call_args_list] == [None, 'page2']
+
+        patcher.stop()
@@ -248,7 +248,8 @@ class TestInventoryResourceRecordModule(ModuleTestCase):
         get_inventory_patcher = patch(
             'plugins.modules.ibm_schematics_inventory.SchematicsV1.get_inventory')
         get_inventory_mock = get_inventory_patcher.start()
-        get_inventory_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_inventory_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'inventory_id': 'testString',
@@ -276,6 +277,7 @@ class TestInventoryResourceRecordModule(ModuleTestCase):
             resource_group='testString',
             inventories_ini='testString',
             resource_queries=['testString'],
+            headers={},
         )
 
         mock.assert_called_once()
@@ -301,16 +303,6 @@ class TestInventoryResourceRecordModule(ModuleTestCase):
 
     def test_update_ibm_schematics_inventory_failed(self):
         """Test the "update" path - failed."""
-        resource = {
-            'inventory_id': 'testString',
-            'name': 'testString',
-            'description': 'testString',
-            'location': 'us-south',
-            'resource_group': 'testString',
-            'inventories_ini': 'testString',
-            'resource_queries': ['testString'],
-        }
-
         patcher = patch(
             'plugins.modules.ibm_schematics_inventory.SchematicsV1.replace_inventory')
         mock = patcher.start()
@@ -320,7 +312,8 @@ class TestInventoryResourceRecordModule(ModuleTestCase):
         get_inventory_patcher = patch(
             'plugins.modules.ibm_schematics_inventory.SchematicsV1.get_inventory')
         get_inventory_mock = get_inventory_patcher.start()
-        get_inventory_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_inventory_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'inventory_id': 'testString',
@@ -347,6 +340,7 @@ class TestInventoryResourceRecordModule(ModuleTestCase):
             resource_group='testString',
             inventories_ini='testString',
             resource_queries=['testString'],
+            headers={},
         )
 
         mock.assert_called_once()
@@ -371,6 +365,77 @@ class TestInventoryResourceRecordModule(ModuleTestCase):
         get_inventory_patcher.stop()
         patcher.stop()
 
+    def test_update_ibm_schematics_inventory_precondition_failed(self):
+        """Test the "update" path - a stale ETag is refreshed and the update retried."""
+        resource = {
+            'id': 'testString',
+            'name': 'renamed',
+        }
+
+        patcher = patch(
+            'plugins.modules.ibm_schematics_inventory.SchematicsV1.replace_inventory')
+        mock = patcher.start()
+        mock.side_effect = [
+            ApiException(412, message='Precondition failed'),
+            DetailedResponseMock(resource),
+        ]
+
+        get_inventory_patcher = patch(
+            'plugins.modules.ibm_schematics_inventory.SchematicsV1.get_inventory')
+        get_inventory_mock = get_inventory_patcher.start()
+        get_inventory_mock.side_effect = [
+            DetailedResponseMock({'id': 'testString', 'name': 'testString'}, {'ETag': '1-a'}),
+            DetailedResponseMock({'id': 'testString', 'name': 'other'}, {'ETag': '2-b'}),
+        ]
+
+        set_module_args({
+            'inventory_id': 'testString',
+            'name': 'renamed',
+        })
+
+        with self.assertRaises(AnsibleExitJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_inventory.main()
+
+        assert result.exception.args[0]['changed'] is True
+        assert result.exception.args[0]['msg'] == resource
+
+        assert get_inventory_mock.call_count == 2
+        assert [call.kwargs['headers'] for call in mock.call_args_list] == [{'If-Match': '1-a'}, {'If-Match': '2-b'}]
+        get_inventory_patcher.stop()
+        patcher.stop()
+
+    def test_update_ibm_schematics_inventory_precondition_failed_twice(self):
+        """Test the "update" path - the update is retried once only."""
+        patcher = patch(
+            'plugins.modules.ibm_schematics_inventory.SchematicsV1.replace_inventory')
+        mock = patcher.start()
+        mock.side_effect = ApiException(412, message='Precondition failed')
+
+        get_inventory_patcher = patch(
+            'plugins.modules.ibm_schematics_inventory.SchematicsV1.get_inventory')
+        get_inventory_mock = get_inventory_patcher.start()
+        get_inventory_mock.side_effect = [
+            DetailedResponseMock({'id': 'testString', 'name': 'testString'}, {'ETag': '1-a'}),
+            DetailedResponseMock({'id': 'testString', 'name': 'other'}, {'ETag': '2-b'}),
+        ]
+
+        set_module_args({
+            'inventory_id': 'testString',
+            'name': 'renamed',
+        })
+
+        with self.assertRaises(AnsibleFailJson) as result:
+            os.environ['SCHEMATICS_AUTH_TYPE'] = 'noAuth'
+            os.environ['IC_API_KEY'] = 'noAuthAPIKey'
+            ibm_schematics_inventory.main()
+
+        assert result.exception.args[0]['msg'] == 'Precondition failed'
+        assert mock.call_count == 2
+        get_inventory_patcher.stop()
+        patcher.stop()
+
     def test_delete_ibm_schematics_inventory_success(self):
         """Test the "delete" path - successfull."""
         patcher = patch(
@@ -1067,7 +1067,8 @@ class TestJobModule(ModuleTestCase):
         get_job_patcher = patch(
             'plugins.modules.ibm_schematics_job.SchematicsV1.get_job')
         get_job_mock = get_job_patcher.start()
-        get_job_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_job_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'job_id': 'testString',
@@ -1393,24 +1394,6 @@ class TestJobModule(ModuleTestCase):
             'system_job': job_log_summary_system_job_model,
         }
 
-        resource = {
-            'job_id': 'testString',
-            'refresh_token': 'testString',
-            'command_object': 'workspace',
-            'command_object_id': 'testString',
-            'command_name': 'workspace_plan',
-            'command_parameter': 'testString',
-            'command_options': ['testString'],
-            'inputs': [variable_data_model],
-            'settings': [variable_data_model],
-            'tags': ['testString'],
-            'location': 'us-south',
-            'status': job_status_model,
-            'data': job_data_model,
-            'bastion': bastion_resource_definition_model,
-            'log_summary': job_log_summary_model,
-        }
-
         patcher = patch(
             'plugins.modules.ibm_schematics_job.SchematicsV1.update_job')
         mock = patcher.start()
@@ -1420,7 +1403,8 @@ class TestJobModule(ModuleTestCase):
         get_job_patcher = patch(
             'plugins.modules.ibm_schematics_job.SchematicsV1.get_job')
         get_job_mock = get_job_patcher.start()
-        get_job_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_job_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'job_id': 'testString',
@@ -264,7 +264,8 @@ class TestResourceQueryRecordModule(ModuleTestCase):
         get_resources_query_patcher = patch(
             'plugins.modules.ibm_schematics_resource_query.SchematicsV1.get_resources_query')
         get_resources_query_mock = get_resources_query_patcher.start()
-        get_resources_query_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_resources_query_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'query_id': 'testString',
@@ -322,13 +323,6 @@ class TestResourceQueryRecordModule(ModuleTestCase):
             'query_select': ['testString'],
         }
 
-        resource = {
-            'query_id': 'testString',
-            'type': 'vsi',
-            'name': 'testString',
-            'queries': [resource_query_model],
-        }
-
         patcher = patch(
             'plugins.modules.ibm_schematics_resource_query.SchematicsV1.replace_resources_query')
         mock = patcher.start()
@@ -338,7 +332,8 @@ class TestResourceQueryRecordModule(ModuleTestCase):
         get_resources_query_patcher = patch(
             'plugins.modules.ibm_schematics_resource_query.SchematicsV1.get_resources_query')
         get_resources_query_mock = get_resources_query_patcher.start()
-        get_resources_query_mock.return_value = DetailedResponseMock(resource)
+        # The existing resource differs from the desired one.
+        get_resources_query_mock.return_value = DetailedResponseMock({})
 
         set_module_args({
             'query_id': 'testString',